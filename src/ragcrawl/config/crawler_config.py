@@ -1,7 +1,8 @@
 """Main crawler configuration."""
 
 from enum import Enum
-from typing import Any, Callable
+from pathlib import Path
+from typing import Any, Callable, Literal
 
 from pydantic import BaseModel, Field
 
@@ -119,6 +120,10 @@ class CrawlerConfig(BaseModel):
         default_factory=list,
         description="Regex/glob patterns for URLs to exclude",
     )
+    pattern_engine: Literal["re", "re2"] = Field(
+        default="re",
+        description="Regex engine for include/exclude patterns (re2 needs [fast])",
+    )
 
     # === Domain constraints ===
     allowed_domains: list[str] = Field(
@@ -168,6 +173,10 @@ class CrawlerConfig(BaseModel):
         default_factory=list,
         description="Domains to ignore robots.txt for (when mode=allowlist)",
     )
+    robots_cache_path: str | Path | None = Field(
+        default=None,
+        description="JSON file to keep robots.txt files across runs (None = memory only)",
+    )
     user_agent: str = Field(
         default="ragcrawl/0.1 (+https://github.com/datalync/ragcrawl)",
         description="User-Agent string",
@@ -203,6 +212,11 @@ class CrawlerConfig(BaseModel):
         default_factory=dict, description="Additional HTTP headers"
     )
     proxy: str | None = Field(default=None, description="Proxy URL")
+    max_body_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Skip pages whose response body exceeds this many bytes",
+    )
 
     # === Content options ===
     extract_html: bool = Field(
@@ -211,6 +225,10 @@ class CrawlerConfig(BaseModel):
     extract_plain_text: bool = Field(
         default=False, description="Also store plain text"
     )
+    html_parser: Literal["lxml", "selectolax"] = Field(
+        default="lxml",
+        description="HTML parser for metadata and link extraction (selectolax needs [fast])",
+    )
     quality_gates: QualityGateConfig = Field(
         default_factory=QualityGateConfig, description="Quality gate configuration"
     )
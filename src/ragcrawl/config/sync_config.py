@@ -1,10 +1,11 @@
 """Configuration for incremental sync operations."""
 
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 
 from pydantic import BaseModel, Field
 
+from ragcrawl.config.crawler_config import RateLimitConfig
 from ragcrawl.config.markdown_config import MarkdownConfig
 from ragcrawl.config.output_config import OutputConfig
 from ragcrawl.config.storage_config import StorageConfig
@@ -76,10 +77,23 @@ class SyncConfig(BaseModel):
     exclude_patterns: list[str] = Field(
         default_factory=list, description="Skip URLs matching these patterns"
     )
+    pattern_engine: Literal["re", "re2"] = Field(
+        default="re",
+        description="Regex engine for include/exclude patterns (re2 needs [fast])",
+    )
     max_age_hours: float | None = Field(
         default=None,
         description="Only re-check pages older than this (None = check all)",
     )
+    max_concurrency: int = Field(
+        default=16, ge=1, description="Max pages checked concurrently"
+    )
+    storage_batch_size: int = Field(
+        default=64, ge=1, description="Page/version writes buffered per storage flush"
+    )
+    rate_limit: RateLimitConfig = Field(
+        default_factory=RateLimitConfig, description="Rate limiting configuration"
+    )
 
     # === Tombstone handling ===
     detect_deletions: bool = Field(
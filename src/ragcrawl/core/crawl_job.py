@@ -100,6 +100,7 @@ class CrawlJob:
             include_patterns=self.config.include_patterns,
             exclude_patterns=self.config.exclude_patterns,
             blocked_query_params=self.config.blocked_query_params,
+            pattern_engine=self.config.pattern_engine,
         )
 
         # Frontier
@@ -130,6 +131,8 @@ class CrawlJob:
             follow_redirects=self.config.follow_redirects,
             max_redirects=self.config.max_redirects,
             markdown_config=self.config.markdown,
+            max_body_bytes=self.config.max_body_bytes,
+            max_concurrency=self.config.max_concurrency,
         )
 
         # Robots
@@ -137,11 +140,13 @@ class CrawlJob:
             mode=self.config.robots_mode,
             user_agent=self.config.user_agent,
             allowlist=self.config.robots_allowlist,
+            cache_path=self.config.robots_cache_path,
         )
 
         # Extractor
         self._extractor = ContentExtractor(
             allowed_domains=self.config.get_allowed_domains(),
+            html_backend=self.config.html_parser,
         )
 
         # Quality gate
@@ -248,6 +253,8 @@ class CrawlJob:
             # Cleanup
             if self._fetcher:
                 await self._fetcher.close()
+            if self._robots:
+                await self._robots.close()
             if self._storage:
                 self._storage.close()
 
@@ -278,7 +285,7 @@ class CrawlJob:
             if not await self._robots.is_allowed(url):
                 self._logger.page_skipped(url, "robots.txt blocked")
                 self._metrics.record_skip("robots_blocked")
-                await self._frontier.mark_failed(url, "robots.txt blocked")
+                await self._frontier.mark_failed(item, "robots.txt blocked")
                 return
 
             # Acquire scheduler slot
@@ -317,11 +324,13 @@ class CrawlJob:
                         )
 
                     self._scheduler.release(domain, success=False)
-                    await self._frontier.mark_failed(url, fetch_result.error)
+                    await self._frontier.mark_failed(item, fetch_result.error)
                     return
 
-                # Extract content
-                extraction = self._extractor.extract(
+                # Extract content off the event loop; lxml parses without the
+                # GIL, so other workers keep fetching and extracting meanwhile
+                extraction = await asyncio.to_thread(
+                    self._extractor.extract,
                     fetch_result,
                     fetch_result.final_url or url,
                     extract_html=self.config.extract_html,
@@ -341,7 +350,7 @@ class CrawlJob:
                     self._logger.page_skipped(url, f"Quality: {quality_result.issue.value}")
                     self._metrics.record_skip(quality_result.issue.value)
                     self._scheduler.release(domain, success=True)
-                    await self._frontier.mark_completed(url)
+                    await self._frontier.mark_completed(item)
                     return
 
                 # Create document
@@ -379,7 +388,7 @@ class CrawlJob:
                 )
 
                 self._scheduler.release(domain, success=True)
-                await self._frontier.mark_completed(url)
+                await self._frontier.mark_completed(item)
 
             except Exception as e:
                 self._scheduler.release(domain, success=False)
@@ -388,7 +397,7 @@ class CrawlJob:
         except Exception as e:
             logger.error("Error processing URL", url=url, error=str(e))
             self._metrics.record_error(type(e).__name__, domain)
-            await self._frontier.mark_failed(url, str(e))
+            await self._frontier.mark_failed(item, str(e))
 
             if self.config.on_error:
                 try:
@@ -1,9 +1,11 @@
 """Crawl frontier for URL queue management."""
 
-import asyncio
 import heapq
-from dataclasses import dataclass, field
+import itertools
+import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -12,13 +14,27 @@ from ragcrawl.filters.url_normalizer import URLNormalizer
 from ragcrawl.models.frontier_item import FrontierItem, FrontierStatus
 from ragcrawl.utils.hashing import compute_doc_id
 
+# Matches "scheme://netloc" at the start of an absolute URL
+_NETLOC_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)")
 
-@dataclass(order=True)
-class PrioritizedItem:
-    """Item in the priority queue."""
 
-    priority: float
-    item: FrontierItem = field(compare=False)
+@lru_cache(maxsize=4096)
+def _intern_domain(netloc: str) -> str:
+    """Lowercase and intern a netloc so repeated domains share one string."""
+    return sys.intern(netloc.lower())
+
+
+# Heap entry: [negated priority, insertion sequence, item]. The sequence
+# number breaks priority ties in FIFO order so items are never compared.
+# Entries are removed lazily by setting the item slot to None.
+_QueueEntry = list[Any]
+_ITEM = 2
+
+# URL status bit flags
+_SEEN = 1
+_IN_PROGRESS = 2
+_COMPLETED = 4
+_FAILED = 8
 
 
 class Frontier:
@@ -30,6 +46,10 @@ class Frontier:
     - Deduplication
     - Depth tracking
     - Per-domain bucketing
+
+    The frontier is meant to be shared by coroutines on a single event loop.
+    No method awaits while mutating state, so no lock is needed; it is not
+    safe to share across threads.
     """
 
     def __init__(
@@ -39,6 +59,7 @@ class Frontier:
         link_filter: LinkFilter,
         max_depth: int = 10,
         max_pages: int = 1000,
+        max_url_length: int = 2048,
     ) -> None:
         """
         Initialize the frontier.
@@ -49,23 +70,34 @@ class Frontier:
             link_filter: Filter for URL validation.
             max_depth: Maximum crawl depth.
             max_pages: Maximum pages to crawl.
+            max_url_length: URLs longer than this are rejected unparsed.
         """
         self.run_id = run_id
         self.site_id = site_id
         self.link_filter = link_filter
         self.max_depth = max_depth
         self.max_pages = max_pages
+        self.max_url_length = max_url_length
 
         self.normalizer = URLNormalizer()
 
+        # Path indicators used to boost/demote priority
+        self._doc_re = re.compile(r"/docs|/guide|/tutorial|/api|/reference")
+        self._old_re = re.compile(r"/archive|/old|/legacy|/deprecated")
+
         # Priority queue
-        self._queue: list[PrioritizedItem] = []
+        self._queue: list[_QueueEntry] = []
+        self._counter = itertools.count()
 
-        # Tracking sets
-        self._seen_urls: set[str] = set()
-        self._in_progress: set[str] = set()
-        self._completed: set[str] = set()
-        self._failed: set[str] = set()
+        # Live heap entry for each queued normalized URL
+        self._entries: dict[str, _QueueEntry] = {}
+        self._stale_count = 0
+
+        # Status flags per normalized URL
+        self._status: dict[str, int] = {}
+        self._in_progress_count = 0
+        self._completed_count = 0
+        self._failed_count = 0
 
         # Per-domain tracking
         self._domain_counts: dict[str, int] = {}
@@ -74,9 +106,6 @@ class Frontier:
         self._discovered_count = 0
         self._max_depth_seen = 0
 
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
-
     async def add(
         self,
         url: str,
@@ -96,65 +125,20 @@ class Frontier:
         Returns:
             True if URL was added, False if filtered/duplicate.
         """
-        async with self._lock:
-            # Check limits
-            if self._discovered_count >= self.max_pages:
-                return False
+        # Check limits
+        if self._discovered_count >= self.max_pages:
+            return False
 
-            if depth > self.max_depth:
-                return False
+        if depth > self.max_depth:
+            return False
 
-            # Filter and normalize
-            result = self.link_filter.filter(
-                url,
-                check_seen=False,
-                current_depth=depth,
-                max_depth=self.max_depth,
-            )
-
-            if not result.allowed:
-                return False
-
-            normalized_url = result.normalized_url or self.normalizer.normalize(url)
-
-            # Deduplication
-            if normalized_url in self._seen_urls:
-                return False
-
-            self._seen_urls.add(normalized_url)
-            self._discovered_count += 1
-            self._max_depth_seen = max(self._max_depth_seen, depth)
-
-            # Calculate priority
-            if priority is None:
-                priority = self._calculate_priority(depth, normalized_url)
+        # Filter and normalize
+        normalized_url = self._filter_url(url, depth)
+        if normalized_url is None:
+            return False
 
-            # Create frontier item
-            domain = self._get_domain(normalized_url)
-            url_hash = compute_doc_id(normalized_url)
-
-            item = FrontierItem(
-                item_id=f"{self.run_id}_{url_hash}",
-                run_id=self.run_id,
-                site_id=self.site_id,
-                url=url,
-                normalized_url=normalized_url,
-                url_hash=url_hash,
-                depth=depth,
-                referrer_url=referrer_url,
-                priority=priority,
-                status=FrontierStatus.PENDING,
-                discovered_at=datetime.now(),
-                domain=domain,
-            )
-
-            # Add to priority queue (negative priority for max-heap behavior)
-            heapq.heappush(self._queue, PrioritizedItem(-priority, item))
-
-            # Track domain
-            self._domain_counts[domain] = self._domain_counts.get(domain, 0) + 1
-
-            return True
+        added = self._add_many([(url, normalized_url, priority)], depth, referrer_url)
+        return added > 0
 
     async def add_seeds(self, seeds: list[str]) -> int:
         """
@@ -189,40 +173,144 @@ class Frontier:
         Returns:
             Number of URLs added.
         """
-        added = 0
+        if depth > self.max_depth:
+            return 0
+
+        # Filter and normalize the whole batch, then enqueue it in one pass
+        candidates: list[tuple[str, str, float | None]] = []
         for url in urls:
-            if await self.add(url, depth, referrer_url):
-                added += 1
-        return added
+            normalized_url = self._filter_url(url, depth)
+            if normalized_url is not None:
+                candidates.append((url, normalized_url, None))
 
-    async def get_next(self) -> FrontierItem | None:
+        if not candidates:
+            return 0
+
+        return self._add_many(candidates, depth, referrer_url)
+
+    def _filter_url(self, url: str, depth: int) -> str | None:
         """
-        Get the next URL to crawl.
+        Run a URL through the link filter.
+
+        Args:
+            url: URL to filter.
+            depth: Depth from seed.
 
         Returns:
-            Next FrontierItem or None if empty.
+            Normalized URL if allowed, None if filtered or already seen.
         """
-        async with self._lock:
-            while self._queue:
-                prioritized = heapq.heappop(self._queue)
-                item = prioritized.item
-
-                # Skip if already processed
-                if item.normalized_url in self._completed:
-                    continue
-                if item.normalized_url in self._failed:
-                    continue
-                if item.normalized_url in self._in_progress:
-                    continue
+        # Cheap rejects for oversized or non-absolute URLs before parsing
+        if len(url) > self.max_url_length or "://" not in url:
+            return None
 
-                # Mark in progress
-                self._in_progress.add(item.normalized_url)
-                item.mark_in_progress()
+        # Links are often already in normalized form; reject known ones
+        # before paying for parsing and filtering.
+        if self._status.get(url, 0) & _SEEN:
+            return None
 
-                return item
+        result = self.link_filter.filter(
+            url,
+            check_seen=False,
+            current_depth=depth,
+            max_depth=self.max_depth,
+        )
 
+        if not result.allowed:
             return None
 
+        return result.normalized_url or self.normalizer.normalize(url)
+
+    def _add_many(
+        self,
+        candidates: list[tuple[str, str, float | None]],
+        depth: int,
+        referrer_url: str | None,
+    ) -> int:
+        """
+        Add pre-filtered URLs to the queue.
+
+        Args:
+            candidates: (url, normalized_url, priority) tuples.
+            depth: Depth for all URLs.
+            referrer_url: Referrer URL.
+
+        Returns:
+            Number of URLs added.
+        """
+        entries: list[_QueueEntry] = []
+        now = datetime.now()
+
+        for url, normalized_url, priority in candidates:
+            if self._discovered_count >= self.max_pages:
+                break
+
+            # Deduplication. A setdefault/len-delta single probe measured
+            # slower than get + set: str caches its hash, so the second
+            # lookup is only a probe, cheaper than the extra calls.
+            status = self._status.get(normalized_url, 0)
+            if status & _SEEN:
+                continue
+
+            self._status[normalized_url] = status | _SEEN
+            self._discovered_count += 1
+
+            # Calculate priority
+            if priority is None:
+                priority = self._calculate_priority(depth, normalized_url)
+
+            # Create frontier item
+            domain = self._get_domain(normalized_url)
+            url_hash = compute_doc_id(normalized_url)
+
+            item = FrontierItem(
+                item_id=f"{self.run_id}_{url_hash}",
+                run_id=self.run_id,
+                site_id=self.site_id,
+                url=url,
+                normalized_url=normalized_url,
+                url_hash=url_hash,
+                depth=depth,
+                referrer_url=referrer_url,
+                priority=priority,
+                status=FrontierStatus.PENDING,
+                discovered_at=now,
+                domain=domain,
+            )
+
+            # Negative priority for max-heap behavior
+            entry = [-priority, next(self._counter), item]
+            entries.append(entry)
+            self._entries[normalized_url] = entry
+
+            # Track domain
+            self._domain_counts[domain] = self._domain_counts.get(domain, 0) + 1
+
+        if not entries:
+            return 0
+
+        self._max_depth_seen = max(self._max_depth_seen, depth)
+
+        # k pushes cost O(k log n); a single heapify costs O(n + k).
+        # Pick whichever is cheaper for this batch.
+        if len(entries) * max(1, len(self._queue).bit_length()) > len(self._queue) + len(entries):
+            self._queue.extend(entries)
+            heapq.heapify(self._queue)
+        else:
+            for entry in entries:
+                heapq.heappush(self._queue, entry)
+
+        return len(entries)
+
+    async def get_next(self) -> FrontierItem | None:
+        """
+        Get the next URL to crawl.
+
+        Returns:
+            Next FrontierItem or None if empty.
+        """
+        items = self._pop_batch(1)
+        return items[0] if items else None
+
     async def get_batch(self, count: int = 10) -> list[FrontierItem]:
         """
         Get multiple URLs to crawl.
@@ -233,38 +321,113 @@ class Frontier:
         Returns:
             List of FrontierItems.
         """
-        items = []
-        for _ in range(count):
-            item = await self.get_next()
+        return self._pop_batch(count)
+
+    def _pop_batch(self, count: int) -> list[FrontierItem]:
+        """Pop up to count items and mark them in progress."""
+        items: list[FrontierItem] = []
+        queue = self._queue
+        status = self._status
+        now = datetime.now()
+
+        # Once most of the heap is dead entries, rebuild it from the live ones
+        if self._stale_count > len(queue) // 2:
+            self._compact()
+            queue = self._queue
+
+        while queue and len(items) < count:
+            item = heapq.heappop(queue)[_ITEM]
+
+            # Skip entries invalidated after they were queued
             if item is None:
-                break
+                self._stale_count -= 1
+                continue
+
+            # Mark in progress
+            normalized_url = item.normalized_url
+            del self._entries[normalized_url]
+            status[normalized_url] |= _IN_PROGRESS
+            item.mark_in_progress(now)
             items.append(item)
+
+        self._in_progress_count += len(items)
         return items
 
-    async def mark_completed(self, url: str) -> None:
-        """Mark a URL as completed."""
-        async with self._lock:
-            normalized = self.normalizer.normalize(url)
-            self._in_progress.discard(normalized)
-            self._completed.add(normalized)
+    async def mark_completed(self, item: FrontierItem | str) -> None:
+        """
+        Mark a URL as completed.
+
+        Args:
+            item: FrontierItem returned by get_next/get_batch, or its URL.
+        """
+        normalized = self._resolve_normalized(item)
+        self._invalidate(normalized)
+        status = self._status.get(normalized, 0)
+        if status & _IN_PROGRESS:
+            self._in_progress_count -= 1
+        if not status & _COMPLETED:
+            self._completed_count += 1
+        self._status[normalized] = (status & ~_IN_PROGRESS) | _COMPLETED
+
+    async def mark_failed(self, item: FrontierItem | str, error: str | None = None) -> None:
+        """
+        Mark a URL as failed.
+
+        Args:
+            item: FrontierItem returned by get_next/get_batch, or its URL.
+            error: Error message.
+        """
+        normalized = self._resolve_normalized(item)
+        self._invalidate(normalized)
+        status = self._status.get(normalized, 0)
+        if status & _IN_PROGRESS:
+            self._in_progress_count -= 1
+        if not status & _FAILED:
+            self._failed_count += 1
+        self._status[normalized] = (status & ~_IN_PROGRESS) | _FAILED
+
+    def _resolve_normalized(self, item: FrontierItem | str) -> str:
+        """
+        Get the normalized URL for an item or URL string.
 
-    async def mark_failed(self, url: str, error: str | None = None) -> None:
-        """Mark a URL as failed."""
-        async with self._lock:
-            normalized = self.normalizer.normalize(url)
-            self._in_progress.discard(normalized)
-            self._failed.add(normalized)
+        Items carry their normalized URL, and strings that are already a
+        normalized URL in the frontier are used as-is, so normalization only
+        runs for raw URLs.
+        """
+        if isinstance(item, FrontierItem):
+            return item.normalized_url
+        if item in self._status:
+            return item
+        return self.link_filter.normalizer.normalize(item)
+
+    def _invalidate(self, normalized_url: str) -> None:
+        """Drop a URL's queued heap entry, if any, without touching the heap."""
+        entry = self._entries.pop(normalized_url, None)
+        if entry is not None:
+            entry[_ITEM] = None
+            self._stale_count += 1
+
+    def _compact(self) -> None:
+        """Drop invalidated entries from the heap in one O(n) pass."""
+        self._queue = [entry for entry in self._queue if entry[_ITEM] is not None]
+        heapq.heapify(self._queue)
+        self._stale_count = 0
 
     async def return_to_queue(self, item: FrontierItem) -> None:
         """Return an item to the queue for retry."""
-        async with self._lock:
-            self._in_progress.discard(item.normalized_url)
-            item.status = FrontierStatus.PENDING
-            item.retry_count += 1
-
-            # Lower priority on retry
-            new_priority = item.priority * 0.5
-            heapq.heappush(self._queue, PrioritizedItem(-new_priority, item))
+        status = self._status.get(item.normalized_url, 0)
+        if status & _IN_PROGRESS:
+            self._in_progress_count -= 1
+            self._status[item.normalized_url] = status & ~_IN_PROGRESS
+        item.status = FrontierStatus.PENDING
+        item.retry_count += 1
+
+        # Lower priority on retry
+        new_priority = item.priority * 0.5
+        self._invalidate(item.normalized_url)
+        entry = [-new_priority, next(self._counter), item]
+        self._entries[item.normalized_url] = entry
+        heapq.heappush(self._queue, entry)
 
     def _calculate_priority(self, depth: int, url: str) -> float:
         """
@@ -275,34 +438,33 @@ class Frontier:
         # Base priority inversely related to depth
         priority = 100.0 / (depth + 1)
 
+        lowered = url.lower()
+
         # Boost for documentation-like paths
-        doc_indicators = ["/docs", "/guide", "/tutorial", "/api", "/reference"]
-        for indicator in doc_indicators:
-            if indicator in url.lower():
-                priority *= 1.5
-                break
+        if self._doc_re.search(lowered):
+            priority *= 1.5
 
         # Lower priority for archive/old paths
-        old_indicators = ["/archive", "/old", "/legacy", "/deprecated"]
-        for indicator in old_indicators:
-            if indicator in url.lower():
-                priority *= 0.5
-                break
+        if self._old_re.search(lowered):
+            priority *= 0.5
 
         return priority
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
+        match = _NETLOC_RE.match(url)
+        if match is not None:
+            return _intern_domain(match.group(1))
+
         try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower()
+            return _intern_domain(urlparse(url).netloc)
         except Exception:
             return ""
 
     @property
     def size(self) -> int:
         """Current queue size."""
-        return len(self._queue)
+        return len(self._entries)
 
     @property
     def discovered_count(self) -> int:
@@ -312,17 +474,17 @@ class Frontier:
     @property
     def completed_count(self) -> int:
         """Total URLs completed."""
-        return len(self._completed)
+        return self._completed_count
 
     @property
     def failed_count(self) -> int:
         """Total URLs failed."""
-        return len(self._failed)
+        return self._failed_count
 
     @property
     def in_progress_count(self) -> int:
         """URLs currently in progress."""
-        return len(self._in_progress)
+        return self._in_progress_count
 
     @property
     def max_depth_reached(self) -> int:
@@ -332,16 +494,16 @@ class Frontier:
     @property
     def is_empty(self) -> bool:
         """Check if frontier is empty."""
-        return len(self._queue) == 0 and len(self._in_progress) == 0
+        return not self._entries and self._in_progress_count == 0
 
     def get_stats(self) -> dict[str, Any]:
         """Get frontier statistics."""
         return {
             "queue_size": self.size,
             "discovered": self._discovered_count,
-            "completed": len(self._completed),
-            "failed": len(self._failed),
-            "in_progress": len(self._in_progress),
+            "completed": self._completed_count,
+            "failed": self._failed_count,
+            "in_progress": self._in_progress_count,
             "max_depth_reached": self._max_depth_seen,
             "domains": len(self._domain_counts),
         }
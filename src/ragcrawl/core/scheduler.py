@@ -1,8 +1,8 @@
 """Domain-based scheduling and rate limiting."""
 
 import asyncio
-import time
-from collections import defaultdict
+import sys
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -23,6 +23,23 @@ class DomainState:
     consecutive_errors: int = 0
     circuit_open: bool = False
     circuit_open_until: float = 0.0
+    tokens: float = 0.0
+    last_refill: float = 0.0
+
+
+class DomainBucket:
+    """
+    Per-domain state plus the queue of requests waiting for a slot.
+
+    Concurrency is tracked with state.active_requests rather than a
+    per-domain asyncio.Semaphore; waiters are woken in FIFO order.
+    """
+
+    __slots__ = ("state", "waiters")
+
+    def __init__(self) -> None:
+        self.state = DomainState()
+        self.waiters: deque[asyncio.Future[None]] = deque()
 
 
 class DomainScheduler:
@@ -51,16 +68,19 @@ class DomainScheduler:
         self.config = config
         self.max_concurrency = max_concurrency
 
-        # Per-domain state
-        self._domain_states: dict[str, DomainState] = defaultdict(DomainState)
+        # Per-domain state and slot waiters, keyed by interned domain
+        self._domains: dict[str, DomainBucket] = {}
 
         # Global state
         self._last_global_request = 0.0
         self._active_requests = 0
 
-        # Semaphores
+        # Global semaphore
         self._global_semaphore = asyncio.Semaphore(max_concurrency)
-        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # Which rate-limit waits apply, decided once
+        self._has_global_limit = config.requests_per_second > 0
+        self._has_domain_limit = bool(config.per_domain_rps) or config.delay_between_requests > 0
 
         # Circuit breaker config
         self._error_threshold = 5  # Consecutive errors to open circuit
@@ -76,10 +96,16 @@ class DomainScheduler:
         Returns:
             True if request can proceed, False if blocked.
         """
+        domain = sys.intern(domain)
+        bucket = self._get_bucket(domain)
+        state = bucket.state
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
         # Check circuit breaker
-        state = self._domain_states[domain]
         if state.circuit_open:
-            if time.time() < state.circuit_open_until:
+            if now < state.circuit_open_until:
                 logger.debug("Circuit open for domain", domain=domain)
                 return False
             else:
@@ -87,23 +113,27 @@ class DomainScheduler:
                 state.circuit_open = False
 
         # Global rate limit
-        await self._wait_global_rate()
+        if self._has_global_limit:
+            now = await self._wait_global_rate(now)
 
         # Domain rate limit
-        await self._wait_domain_rate(domain)
+        if self._has_domain_limit:
+            await self._wait_domain_rate(state, now)
 
-        # Acquire semaphores
+        # Acquire global semaphore and domain slot
         await self._global_semaphore.acquire()
-
-        domain_sem = self._get_domain_semaphore(domain)
-        await domain_sem.acquire()
-
-        # Update state
-        state.active_requests += 1
+        try:
+            await self._acquire_domain_slot(bucket)
+        except BaseException:
+            self._global_semaphore.release()
+            raise
+
+        # Update state (acquiring may have blocked, so read the clock again)
+        now = loop.time()
         state.request_count += 1
-        state.last_request_time = time.time()
+        state.last_request_time = now
         self._active_requests += 1
-        self._last_global_request = time.time()
+        self._last_global_request = now
 
         return True
 
@@ -115,8 +145,9 @@ class DomainScheduler:
             domain: Target domain.
             success: Whether the request succeeded.
         """
-        state = self._domain_states[domain]
-        state.active_requests = max(0, state.active_requests - 1)
+        domain = sys.intern(domain)
+        bucket = self._get_bucket(domain)
+        state = bucket.state
         self._active_requests = max(0, self._active_requests - 1)
 
         # Update circuit breaker
@@ -128,53 +159,106 @@ class DomainScheduler:
 
             if state.consecutive_errors >= self._error_threshold:
                 state.circuit_open = True
-                state.circuit_open_until = time.time() + self._circuit_timeout
+                state.circuit_open_until = (
+                    asyncio.get_running_loop().time() + self._circuit_timeout
+                )
                 logger.warning(
                     "Circuit opened for domain",
                     domain=domain,
                     consecutive_errors=state.consecutive_errors,
                 )
 
-        # Release semaphores
+        # Release domain slot and global semaphore
+        self._release_domain_slot(bucket)
         self._global_semaphore.release()
 
-        domain_sem = self._get_domain_semaphore(domain)
-        domain_sem.release()
+    async def _acquire_domain_slot(self, bucket: DomainBucket) -> None:
+        """Wait for one of the domain's per_domain_concurrency slots."""
+        state = bucket.state
+        if not bucket.waiters and state.active_requests < self.config.per_domain_concurrency:
+            state.active_requests += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        bucket.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed to us just before cancellation; pass it on
+                self._release_domain_slot(bucket)
+            elif waiter in bucket.waiters:
+                bucket.waiters.remove(waiter)
+            raise
+
+    def _release_domain_slot(self, bucket: DomainBucket) -> None:
+        """Hand the slot to the next waiter, or free it if nobody is waiting."""
+        waiters = bucket.waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                # active_requests is unchanged: the slot moves to the waiter
+                waiter.set_result(None)
+                return
+
+        bucket.state.active_requests = max(0, bucket.state.active_requests - 1)
+
+    async def _wait_global_rate(self, now: float) -> float:
+        """
+        Wait for global rate limit.
 
-    async def _wait_global_rate(self) -> None:
-        """Wait for global rate limit."""
+        Args:
+            now: Current event loop time.
+
+        Returns:
+            Event loop time after any wait.
+        """
         if self.config.requests_per_second <= 0:
-            return
+            return now
 
         min_interval = 1.0 / self.config.requests_per_second
-        elapsed = time.time() - self._last_global_request
+        elapsed = now - self._last_global_request
 
         if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
+            delay = min_interval - elapsed
+            await asyncio.sleep(delay)
+            now += delay
+
+        return now
+
+    async def _wait_domain_rate(self, state: DomainState, now: float) -> None:
+        """
+        Wait for domain-specific rate limit.
 
-    async def _wait_domain_rate(self, domain: str) -> None:
-        """Wait for domain-specific rate limit."""
-        if not self.config.per_domain_rps:
+        Uses a token bucket holding up to per_domain_concurrency tokens, so
+        concurrent requests to a domain can burst while the average rate stays
+        at per_domain_rps. A token is reserved before sleeping, which keeps
+        concurrent waiters from all waking for the same token.
+        """
+        rps = self.config.per_domain_rps
+        if not rps:
             return
 
-        state = self._domain_states[domain]
-        min_interval = 1.0 / self.config.per_domain_rps
-        elapsed = time.time() - state.last_request_time
+        burst = float(self.config.per_domain_concurrency)
+        refill = max(0.0, now - state.last_refill) * rps
+        state.tokens = min(burst, state.tokens + refill)
+        state.last_refill = max(now, state.last_refill)
 
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
+        state.tokens -= 1.0
+        if state.tokens < 0:
+            await asyncio.sleep(-state.tokens / rps)
 
         # Additional delay if configured
         if self.config.delay_between_requests > 0:
             await asyncio.sleep(self.config.delay_between_requests)
 
-    def _get_domain_semaphore(self, domain: str) -> asyncio.Semaphore:
-        """Get or create domain semaphore."""
-        if domain not in self._domain_semaphores:
-            self._domain_semaphores[domain] = asyncio.Semaphore(
-                self.config.per_domain_concurrency
-            )
-        return self._domain_semaphores[domain]
+    def _get_bucket(self, domain: str) -> DomainBucket:
+        """Get or create the bucket for a domain."""
+        bucket = self._domains.get(domain)
+        if bucket is None:
+            bucket = DomainBucket()
+            self._domains[domain] = bucket
+        return bucket
 
     def set_crawl_delay(self, domain: str, delay: float) -> None:
         """
@@ -191,7 +275,8 @@ class DomainScheduler:
 
     def get_domain_stats(self, domain: str) -> dict[str, Any]:
         """Get statistics for a domain."""
-        state = self._domain_states[domain]
+        bucket = self._domains.get(domain)
+        state = bucket.state if bucket is not None else DomainState()
         return {
             "request_count": state.request_count,
             "error_count": state.error_count,
@@ -204,9 +289,9 @@ class DomainScheduler:
         """Get overall scheduler statistics."""
         return {
             "active_requests": self._active_requests,
-            "domains_tracked": len(self._domain_states),
+            "domains_tracked": len(self._domains),
             "circuits_open": sum(
-                1 for s in self._domain_states.values() if s.circuit_open
+                1 for b in self._domains.values() if b.state.circuit_open
             ),
         }
 
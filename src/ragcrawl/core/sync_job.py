@@ -1,15 +1,20 @@
 """Incremental sync job for detecting and processing changes."""
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urljoin, urlsplit
 
 from ragcrawl.config.sync_config import SyncConfig, SyncStrategy
-from ragcrawl.extraction.extractor import ContentExtractor
-from ragcrawl.fetcher.base import FetchStatus
+from ragcrawl.core.scheduler import DomainScheduler
+from ragcrawl.extraction.extractor import ContentExtractor, ExtractionResult
+from ragcrawl.fetcher.base import FetchResult, FetchStatus
 from ragcrawl.fetcher.crawl4ai_fetcher import Crawl4AIFetcher
 from ragcrawl.fetcher.revalidation import RevalidationStatus, Revalidator
+from ragcrawl.filters.patterns import PatternMatcher
 from ragcrawl.models.crawl_run import CrawlRun, CrawlStats
 from ragcrawl.models.page import Page
 from ragcrawl.models.page_version import PageVersion
@@ -23,6 +28,15 @@ from ragcrawl.utils.metrics import MetricsCollector
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """Extract the lowercased domain from a URL."""
+    try:
+        return urlsplit(url).netloc.lower()
+    except Exception:
+        return ""
+
+
 @dataclass
 class SyncResult:
     """Result of a sync job."""
@@ -61,33 +75,55 @@ class SyncJob:
         # Components
         self._storage: StorageBackend | None = None
         self._fetcher: Crawl4AIFetcher | None = None
+        self._scheduler: DomainScheduler | None = None
         self._extractor: ContentExtractor | None = None
         self._sitemap_parser: SitemapParser | None = None
         self._change_detector: ChangeDetector | None = None
         self._revalidator: Revalidator | None = None
+        self._matcher: PatternMatcher | None = None
 
         # Tracking
         self._metrics = MetricsCollector()
         self._logger = CrawlLoggerAdapter(self.run_id, self.site_id)
-        self._changed_pages: list[str] = []
-        self._deleted_pages: list[str] = []
+        self._changed_pages: deque[str] = deque()
+        self._deleted_pages: deque[str] = deque()
+
+        # Buffered storage writes, flushed in bulk by the workers
+        self._pending_pages: list[Page] = []
+        self._pending_versions: list[PageVersion] = []
+        self._flush_lock = asyncio.Lock()
 
     def _init_components(self) -> None:
         """Initialize components."""
         self._storage = create_storage_backend(self.config.storage)
         self._storage.initialize()
 
-        self._fetcher = Crawl4AIFetcher(markdown_config=self.config.markdown)
+        self._scheduler = DomainScheduler(
+            config=self.config.rate_limit,
+            max_concurrency=self.config.max_concurrency,
+        )
+        self._revalidator = Revalidator(
+            use_etag=self.config.use_etag,
+            use_last_modified=self.config.use_last_modified,
+        )
+        # Shares the revalidator so the fetcher's HEAD check honours the
+        # same use_etag/use_last_modified settings
+        self._fetcher = Crawl4AIFetcher(
+            markdown_config=self.config.markdown,
+            revalidator=self._revalidator,
+        )
         self._extractor = ContentExtractor()
         self._sitemap_parser = SitemapParser()
         self._change_detector = ChangeDetector(
             normalize=self.config.normalize_for_hash,
             noise_patterns=self.config.hash_noise_patterns,
         )
-        self._revalidator = Revalidator(
-            use_etag=self.config.use_etag,
-            use_last_modified=self.config.use_last_modified,
-        )
+        if self.config.include_patterns or self.config.exclude_patterns:
+            self._matcher = PatternMatcher(
+                include_patterns=self.config.include_patterns,
+                exclude_patterns=self.config.exclude_patterns,
+                engine=self.config.pattern_engine,
+            )
 
     async def run(self) -> SyncResult:
         """
@@ -123,13 +159,39 @@ class SyncJob:
 
             logger.info("Starting sync", site_id=self.site_id, pages_to_check=len(pages))
 
-            # Process pages
-            for page in pages:
-                await self._process_page(page)
-
-                # Check limit
-                if self.config.max_pages and self._metrics.metrics.pages_crawled >= self.config.max_pages:
-                    break
+            if self.config.max_pages:
+                pages = pages[: self.config.max_pages]
+
+            # Process pages with a fixed pool of max_concurrency workers. Pages
+            # are popped off a deque so each one can be freed once it has been
+            # checked and flushed, and only one task exists per worker. Each
+            # fetch also goes through the DomainScheduler for per-domain
+            # pacing and the circuit breaker, as in CrawlJob.
+            pending = deque(pages)
+            del pages
+            batch_size = self.config.storage_batch_size
+
+            async def worker() -> None:
+                while pending:
+                    await self._process_page(pending.popleft(), datetime.now())
+                    # Flushing here rather than inside _process_page lets a
+                    # storage failure stop the run instead of being logged
+                    # as one page's error
+                    if len(self._pending_pages) >= batch_size:
+                        await self._flush_writes()
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(min(self.config.max_concurrency, len(pending)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            await self._flush_writes()
 
             # Finalize
             metrics = self._metrics.finalize()
@@ -144,18 +206,19 @@ class SyncJob:
             self._storage.save_run(crawl_run)
 
             # Update site
-            site.last_sync_at = datetime.now()
+            end_time = datetime.now()
+            site.last_sync_at = end_time
             self._storage.save_site(site)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (end_time - start_time).total_seconds()
 
             return SyncResult(
                 run_id=self.run_id,
                 site_id=self.site_id,
                 success=True,
                 stats=crawl_run.stats,
-                changed_pages=self._changed_pages,
-                deleted_pages=self._deleted_pages,
+                changed_pages=list(self._changed_pages),
+                deleted_pages=list(self._deleted_pages),
                 duration_seconds=duration,
             )
 
@@ -173,6 +236,10 @@ class SyncJob:
             if self._fetcher:
                 await self._fetcher.close()
             if self._storage:
+                try:
+                    await self._flush_writes()
+                except Exception as e:
+                    logger.error("Failed to flush sync writes", error=str(e))
                 self._storage.close()
 
     async def _get_pages_to_check(self) -> list[Page]:
@@ -185,14 +252,9 @@ class SyncJob:
         )
 
         # Apply patterns
-        if self.config.include_patterns or self.config.exclude_patterns:
-            from ragcrawl.filters.patterns import PatternMatcher
-
-            matcher = PatternMatcher(
-                include_patterns=self.config.include_patterns,
-                exclude_patterns=self.config.exclude_patterns,
-            )
-            pages = [p for p in pages if matcher.should_include(p.url)]
+        if self._matcher is not None:
+            should_include = self._matcher.should_include
+            pages = [p for p in pages if should_include(p.url)]
 
         # Try sitemap prioritization
         if SyncStrategy.SITEMAP in self.config.strategy:
@@ -206,8 +268,6 @@ class SyncJob:
             # Try to discover sitemap
             site = self._storage.get_site(self.site_id)
             if site and site.seeds:
-                from urllib.parse import urljoin
-
                 sitemap_url = urljoin(site.seeds[0], "/sitemap.xml")
                 self.config.sitemap_urls = [sitemap_url]
 
@@ -215,20 +275,38 @@ class SyncJob:
             return pages
 
         try:
-            # Parse sitemap
-            sitemap_entries = await self._sitemap_parser.parse(self.config.sitemap_urls[0])
-
-            # Build lookup
-            sitemap_lastmod: dict[str, datetime | None] = {}
-            for entry in sitemap_entries:
-                sitemap_lastmod[entry.loc] = entry.lastmod
+            # Parse all sitemaps concurrently
+            results = await asyncio.gather(
+                *(self._sitemap_parser.parse(url) for url in self.config.sitemap_urls),
+                return_exceptions=True,
+            )
+            sitemap_entries = []
+            for url, result in zip(self.config.sitemap_urls, results):
+                if isinstance(result, Exception):
+                    logger.warning("Sitemap parsing failed", url=url, error=str(result))
+                    continue
+                sitemap_entries.extend(result)
 
             # Filter and prioritize
             if self.config.respect_sitemap_lastmod:
+                # Compare as epoch seconds: cheaper than datetime comparisons,
+                # and safe when one side is timezone-aware and the other naive.
+                # Keep the fraction so a sub-second change is not skipped.
+                lastmod_epoch = {
+                    entry.loc: entry.lastmod.timestamp()
+                    for entry in sitemap_entries
+                    if entry.lastmod
+                }
+                get_lastmod = lastmod_epoch.get
+
                 filtered_pages = []
                 for page in pages:
-                    lastmod = sitemap_lastmod.get(page.url)
-                    if lastmod and page.last_crawled and lastmod <= page.last_crawled:
+                    lastmod = get_lastmod(page.url)
+                    if (
+                        lastmod is not None
+                        and page.last_crawled
+                        and lastmod <= page.last_crawled.timestamp()
+                    ):
                         # Skip if sitemap says unchanged
                         self._metrics.record_unchanged()
                         continue
@@ -241,18 +319,24 @@ class SyncJob:
             logger.warning("Sitemap parsing failed", error=str(e))
             return pages
 
-    async def _process_page(self, page: Page) -> None:
-        """Process a single page for changes."""
+    async def _process_page(self, page: Page, now: datetime) -> None:
+        """
+        Process a single page for changes.
+
+        Args:
+            page: Page to check.
+            now: Timestamp recorded for every write made for this page.
+        """
         try:
             # Try conditional request first
             if SyncStrategy.HEADERS in self.config.strategy:
                 if self._revalidator.has_validators(page.etag, page.last_modified):
-                    result = await self._check_with_headers(page)
+                    result = await self._check_with_headers(page, now)
                     if result is not None:
                         return
 
             # Full fetch and hash compare
-            await self._full_check(page)
+            await self._full_check(page, now)
 
         except Exception as e:
             logger.error("Error processing page", url=page.url, error=str(e))
@@ -264,7 +348,7 @@ class SyncJob:
                 except Exception:
                     pass
 
-    async def _check_with_headers(self, page: Page) -> bool | None:
+    async def _check_with_headers(self, page: Page, now: datetime) -> bool | None:
         """
         Check for changes using conditional headers.
 
@@ -275,14 +359,16 @@ class SyncJob:
             page.etag, page.last_modified
         )
 
-        fetch_result = await self._fetcher.fetch(
-            page.url,
+        fetch_result = await self._fetch(
+            page,
             etag=page.etag,
             last_modified=page.last_modified,
         )
+        if fetch_result is None:
+            return True
 
         self._metrics.record_fetch(
-            domain=self._get_domain(page.url),
+            domain=_domain_of(page.url),
             status_code=fetch_result.status_code or 0,
             latency_ms=fetch_result.latency_ms,
             bytes_downloaded=fetch_result.content_length or 0,
@@ -292,28 +378,57 @@ class SyncJob:
         if fetch_result.is_not_modified:
             # Content unchanged
             self._metrics.record_unchanged()
-            page.last_crawled = datetime.now()
-            self._storage.save_page(page)
+            page.last_crawled = now
+            self._queue_write(page)
             return True
 
         if fetch_result.is_not_found:
             # Page deleted
-            await self._mark_deleted(page, fetch_result.status_code or 404)
+            await self._mark_deleted(page, fetch_result.status_code or 404, now)
             return True
 
         if fetch_result.is_success:
             # Content modified, do full extraction
-            await self._process_changed_page(page, fetch_result)
+            await self._process_changed_page(page, now, fetch_result)
             return False
 
         return None
 
-    async def _full_check(self, page: Page) -> None:
+    async def _fetch(self, page: Page, **kwargs: Any) -> FetchResult | None:
+        """
+        Fetch a page under the domain scheduler.
+
+        Returns:
+            The fetch result, or None if the domain's circuit is open. The
+            page is then left untouched so the next sync checks it again.
+        """
+        domain = _domain_of(page.url)
+        if not await self._scheduler.acquire(domain):
+            self._metrics.record_skip("circuit_open")
+            return None
+
+        success = False
+        try:
+            fetch_result = await self._fetcher.fetch(page.url, **kwargs)
+            # A 404 is how deletions are detected, not a sign of an
+            # overloaded server, so it does not count toward the breaker
+            success = (
+                fetch_result.is_success
+                or fetch_result.is_not_modified
+                or fetch_result.is_not_found
+            )
+            return fetch_result
+        finally:
+            self._scheduler.release(domain, success=success)
+
+    async def _full_check(self, page: Page, now: datetime) -> None:
         """Full fetch and hash compare."""
-        fetch_result = await self._fetcher.fetch(page.url)
+        fetch_result = await self._fetch(page)
+        if fetch_result is None:
+            return
 
         self._metrics.record_fetch(
-            domain=self._get_domain(page.url),
+            domain=_domain_of(page.url),
             status_code=fetch_result.status_code or 0,
             latency_ms=fetch_result.latency_ms,
             bytes_downloaded=fetch_result.content_length or 0,
@@ -321,36 +436,51 @@ class SyncJob:
         )
 
         if fetch_result.is_not_found:
-            await self._mark_deleted(page, fetch_result.status_code or 404)
+            await self._mark_deleted(page, fetch_result.status_code or 404, now)
             return
 
         if not fetch_result.is_success:
             page.error_count += 1
             page.last_error = fetch_result.error
-            self._storage.save_page(page)
+            self._queue_write(page)
             self._metrics.record_error("fetch_failed")
             return
 
-        # Extract and compare
-        extraction = self._extractor.extract(fetch_result, page.url)
+        # Same ETag as last time: treat as unchanged without extracting.
+        # This is a heuristic; the content hash is re-checked whenever the
+        # ETag differs or is missing.
+        if self.config.use_etag and fetch_result.etag and fetch_result.etag == page.etag:
+            self._metrics.record_unchanged()
+            page.last_crawled = now
+            page.last_modified = fetch_result.last_modified
+            self._queue_write(page)
+            return
+
+        # Extract and compare; extraction runs in a worker thread so the
+        # event loop keeps serving the other sync workers
+        extraction = await asyncio.to_thread(self._extractor.extract, fetch_result, page.url)
 
         if self._change_detector.has_changed(page.content_hash, extraction.content_hash):
-            await self._process_changed_page(page, fetch_result, extraction)
+            await self._process_changed_page(page, now, fetch_result, extraction)
         else:
             self._metrics.record_unchanged()
-            page.last_crawled = datetime.now()
+            page.last_crawled = now
             page.etag = fetch_result.etag
             page.last_modified = fetch_result.last_modified
-            self._storage.save_page(page)
+            self._queue_write(page)
 
     async def _process_changed_page(
-        self, page: Page, fetch_result: Any, extraction: Any = None
+        self,
+        page: Page,
+        now: datetime,
+        fetch_result: FetchResult,
+        extraction: ExtractionResult | None = None,
     ) -> None:
         """Process a page that has changed."""
-        now = datetime.now()
-
         if extraction is None:
-            extraction = self._extractor.extract(fetch_result, page.url)
+            extraction = await asyncio.to_thread(
+                self._extractor.extract, fetch_result, page.url
+            )
 
         # Create new version
         version_id = generate_version_id(extraction.content_hash)
@@ -373,8 +503,6 @@ class SyncJob:
             crawled_at=now,
         )
 
-        self._storage.save_version(version)
-
         # Update page
         old_hash = page.content_hash
         page.current_version_id = version_id
@@ -386,7 +514,7 @@ class SyncJob:
         page.version_count += 1
         page.error_count = 0
 
-        self._storage.save_page(page)
+        self._queue_write(page, version)
 
         self._metrics.record_change()
         self._changed_pages.append(page.url)
@@ -399,7 +527,7 @@ class SyncJob:
             except Exception as e:
                 logger.warning("on_change_detected error", error=str(e))
 
-    async def _mark_deleted(self, page: Page, status_code: int) -> None:
+    async def _mark_deleted(self, page: Page, status_code: int, now: datetime) -> None:
         """Mark a page as deleted."""
         if not self.config.detect_deletions:
             return
@@ -408,7 +536,6 @@ class SyncJob:
 
         if page.error_count >= self.config.deletion_threshold:
             # Create tombstone
-            now = datetime.now()
             version_id = generate_version_id("tombstone", now)
 
             version = PageVersion(
@@ -424,14 +551,12 @@ class SyncJob:
                 is_tombstone=True,
             )
 
-            self._storage.save_version(version)
-
             page.is_tombstone = True
             page.status_code = status_code
             page.last_crawled = now
             page.current_version_id = version_id
 
-            self._storage.save_page(page)
+            self._queue_write(page, version)
 
             self._metrics.record_deletion()
             self._deleted_pages.append(page.url)
@@ -444,14 +569,56 @@ class SyncJob:
                 except Exception as e:
                     logger.warning("on_deletion_detected error", error=str(e))
         else:
-            page.last_crawled = datetime.now()
-            self._storage.save_page(page)
+            page.last_crawled = now
+            self._queue_write(page)
 
-    def _get_domain(self, url: str) -> str:
-        """Extract domain from URL."""
-        from urllib.parse import urlparse
+    def _queue_write(self, page: Page, version: PageVersion | None = None) -> None:
+        """
+        Buffer a page (and optional new version) for a bulk storage write.
 
-        try:
-            return urlparse(url).netloc.lower()
-        except Exception:
-            return ""
+        Args:
+            page: Page to save.
+            version: New version for the page, if any.
+        """
+        if version is not None:
+            self._pending_versions.append(version)
+        self._pending_pages.append(page)
+
+    async def _flush_writes(self) -> None:
+        """
+        Write all buffered versions and pages to storage.
+
+        The blocking bulk saves run in a worker thread so the event loop keeps
+        serving fetches; the lock keeps flushes from overlapping. Whatever a
+        failed flush did not write is put back in the buffers before the
+        error propagates, so a later flush can retry it.
+        """
+        async with self._flush_lock:
+            versions, self._pending_versions = self._pending_versions, []
+            pages, self._pending_pages = self._pending_pages, []
+            if not versions and not pages:
+                return
+
+            save = asyncio.ensure_future(
+                asyncio.to_thread(self._save_batch, versions, pages)
+            )
+            try:
+                await asyncio.shield(save)
+            except BaseException:
+                # A cancelled worker cannot stop the thread: wait for it so
+                # the next flush never shares the connection with it
+                await asyncio.wait({save})
+                if save.exception() is not None:
+                    self._pending_versions[:0] = versions
+                    self._pending_pages[:0] = pages
+                raise
+
+    def _save_batch(self, versions: list[PageVersion], pages: list[Page]) -> None:
+        """Bulk save versions, then pages, emptying each list once written."""
+        # Versions first so a saved page never points at a missing version
+        if versions:
+            self._storage.save_versions_bulk(versions)
+            versions.clear()
+        if pages:
+            self._storage.save_pages_bulk(pages)
+            pages.clear()
@@ -1,8 +1,9 @@
 """Change events for downstream consumers."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
 
@@ -15,7 +16,7 @@ class EventType(str, Enum):
     PAGE_UNCHANGED = "page_unchanged"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeEvent:
     """
     Event representing a change to a page.
@@ -37,19 +38,14 @@ class ChangeEvent:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "event_type": self.event_type.value,
-            "page_id": self.page_id,
-            "url": self.url,
-            "site_id": self.site_id,
-            "run_id": self.run_id,
-            "timestamp": self.timestamp.isoformat(),
-            "version_id": self.version_id,
-            "old_version_id": self.old_version_id,
-            "content_hash": self.content_hash,
-            "old_content_hash": self.old_content_hash,
-            "metadata": self.metadata,
-        }
+        data = dict(zip(_CHANGE_EVENT_FIELDS, _get_change_event_fields(self)))
+        data["event_type"] = self.event_type.value
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+_CHANGE_EVENT_FIELDS = tuple(f.name for f in fields(ChangeEvent))
+_get_change_event_fields = attrgetter(*_CHANGE_EVENT_FIELDS)
 
 
 class EventEmitter:
@@ -59,20 +55,26 @@ class EventEmitter:
 
     def __init__(self) -> None:
         """Initialize event emitter."""
-        self._handlers: list[callable] = []
+        # Insertion-ordered set of handlers (keys are compared by equality,
+        # so a fresh bound method unregisters the one registered earlier)
+        self._handlers: dict[callable, None] = {}
+        # Immutable snapshot iterated by emit(), rebuilt on (un)register
+        self._handlers_tuple: tuple[callable, ...] = ()
 
     def register(self, handler: callable) -> None:
         """Register an event handler."""
-        self._handlers.append(handler)
+        self._handlers[handler] = None
+        self._handlers_tuple = tuple(self._handlers)
 
     def unregister(self, handler: callable) -> None:
         """Unregister an event handler."""
         if handler in self._handlers:
-            self._handlers.remove(handler)
+            del self._handlers[handler]
+            self._handlers_tuple = tuple(self._handlers)
 
     def emit(self, event: ChangeEvent) -> None:
         """Emit an event to all handlers."""
-        for handler in self._handlers:
+        for handler in self._handlers_tuple:
             try:
                 handler(event)
             except Exception:
@@ -88,15 +90,18 @@ class EventEmitter:
         content_hash: str,
     ) -> None:
         """Emit page created event."""
+        # Positional in field order: event_type, page_id, url, site_id,
+        # run_id, timestamp, version_id, old_version_id, content_hash
         self.emit(ChangeEvent(
-            event_type=EventType.PAGE_CREATED,
-            page_id=page_id,
-            url=url,
-            site_id=site_id,
-            run_id=run_id,
-            timestamp=datetime.now(),
-            version_id=version_id,
-            content_hash=content_hash,
+            EventType.PAGE_CREATED,
+            page_id,
+            url,
+            site_id,
+            run_id,
+            datetime.now(),
+            version_id,
+            None,
+            content_hash,
         ))
 
     def emit_changed(
@@ -112,16 +117,16 @@ class EventEmitter:
     ) -> None:
         """Emit page changed event."""
         self.emit(ChangeEvent(
-            event_type=EventType.PAGE_CHANGED,
-            page_id=page_id,
-            url=url,
-            site_id=site_id,
-            run_id=run_id,
-            timestamp=datetime.now(),
-            version_id=version_id,
-            old_version_id=old_version_id,
-            content_hash=content_hash,
-            old_content_hash=old_content_hash,
+            EventType.PAGE_CHANGED,
+            page_id,
+            url,
+            site_id,
+            run_id,
+            datetime.now(),
+            version_id,
+            old_version_id,
+            content_hash,
+            old_content_hash,
         ))
 
     def emit_deleted(
@@ -133,10 +138,5 @@ class EventEmitter:
     ) -> None:
         """Emit page deleted event."""
         self.emit(ChangeEvent(
-            event_type=EventType.PAGE_DELETED,
-            page_id=page_id,
-            url=url,
-            site_id=site_id,
-            run_id=run_id,
-            timestamp=datetime.now(),
+            EventType.PAGE_DELETED, page_id, url, site_id, run_id, datetime.now()
         ))
@@ -1,5 +1,6 @@
 """Base exporter protocol."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -66,3 +67,27 @@ class Exporter(ABC):
             path: File path to write to.
         """
         ...
+
+    async def aexport_documents(self, documents: list[Document], path: Path) -> None:
+        """
+        Export multiple documents to a file without blocking the event loop.
+
+        Runs export_documents in a worker thread.
+
+        Args:
+            documents: Documents to export.
+            path: File path to write to.
+        """
+        await asyncio.to_thread(self.export_documents, documents, path)
+
+    async def aexport_chunks(self, chunks: list[Chunk], path: Path) -> None:
+        """
+        Export multiple chunks to a file without blocking the event loop.
+
+        Runs export_chunks in a worker thread.
+
+        Args:
+            chunks: Chunks to export.
+            path: File path to write to.
+        """
+        await asyncio.to_thread(self.export_chunks, chunks, path)
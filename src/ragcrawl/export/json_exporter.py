@@ -1,7 +1,10 @@
 """JSON and JSONL exporters."""
 
 import json
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +12,74 @@ from ragcrawl.export.exporter import Exporter
 from ragcrawl.models.chunk import Chunk
 from ragcrawl.models.document import Document
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Plain fields copied as-is into exported documents and chunks, in output order
+_DOCUMENT_FIELDS = (
+    "doc_id",
+    "page_id",
+    "version_id",
+    "source_url",
+    "normalized_url",
+    "canonical_url",
+    "title",
+    "description",
+    "markdown",
+    "content_type",
+    "status_code",
+    "language",
+    "depth",
+    "referrer_url",
+    "run_id",
+    "site_id",
+    "first_seen",
+    "last_seen",
+    "last_crawled",
+    "last_changed",
+    "outlinks",
+    "is_tombstone",
+)
+_CHUNK_FIELDS = (
+    "chunk_id",
+    "doc_id",
+    "page_id",
+    "version_id",
+    "content",
+    "content_type",
+    "chunk_index",
+    "total_chunks",
+    "start_offset",
+    "end_offset",
+    "char_count",
+    "word_count",
+    "token_estimate",
+    "section_path",
+    "heading",
+    "heading_level",
+    "source_url",
+    "title",
+    "chunker_type",
+    "overlap_tokens",
+)
+_DOCUMENT_DATETIME_FIELDS = ("first_seen", "last_seen", "last_crawled", "last_changed")
+_get_document_fields = attrgetter(*_DOCUMENT_FIELDS)
+_get_chunk_fields = attrgetter(*_CHUNK_FIELDS)
+
+
+@lru_cache(maxsize=2048)
+def _cached_isoformat(value: datetime, utcoffset: timedelta | None) -> str:
+    """
+    Format a datetime as ISO 8601, caching repeated timestamps.
+
+    Documents from one run share most of their timestamps. The UTC offset is
+    part of the cache key because aware datetimes for the same instant
+    compare equal even when their offsets (and so their isoformat) differ.
+    """
+    return value.isoformat()
+
 
 class JSONExporter(Exporter):
     """
@@ -49,11 +120,7 @@ class JSONExporter(Exporter):
 
     def export_documents(self, documents: list[Document], path: Path) -> None:
         """Export documents as JSON array."""
-        data = [self._document_to_dict(doc) for doc in documents]
-        json_str = json.dumps(data, indent=self.indent, default=self._json_serializer)
-
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json_str)
+        self._write_array((self._document_to_dict(doc) for doc in documents), path)
 
     def export_chunk(self, chunk: Chunk, path: Path | None = None) -> str | None:
         """Export a chunk as JSON."""
@@ -69,42 +136,57 @@ class JSONExporter(Exporter):
 
     def export_chunks(self, chunks: list[Chunk], path: Path) -> None:
         """Export chunks as JSON array."""
-        data = [self._chunk_to_dict(chunk) for chunk in chunks]
-        json_str = json.dumps(data, indent=self.indent, default=self._json_serializer)
+        self._write_array((self._chunk_to_dict(chunk) for chunk in chunks), path)
+
+    def _write_array(self, items: Iterable[dict[str, Any]], path: Path) -> None:
+        """
+        Stream items to a JSON array file one element at a time.
+
+        The output is identical to ``json.dumps(list(items), indent=...)``
+        but only one serialized element is held in memory at once.
+
+        Args:
+            items: Dictionaries to write as array elements.
+            path: Output file path.
+        """
+        if self.indent is None:
+            pad = None
+            first, sep, end = "[", ", ", "]"
+        else:
+            pad = " " * self.indent
+            first, sep, end = "[\n", ",\n", "\n]"
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json_str)
+
+        with path.open("w") as f:
+            prefix = first
+            for data in items:
+                json_str = json.dumps(
+                    data, indent=self.indent, default=self._json_serializer
+                )
+                if pad:
+                    # Nest the element one level inside the array
+                    json_str = pad + json_str.replace("\n", "\n" + pad)
+                f.write(prefix)
+                f.write(json_str)
+                prefix = sep
+
+            # An empty array has no inner newlines
+            f.write(end if prefix is sep else "[]")
 
     def _document_to_dict(self, document: Document) -> dict[str, Any]:
         """Convert document to dictionary."""
-        data = {
-            "doc_id": document.doc_id,
-            "page_id": document.page_id,
-            "version_id": document.version_id,
-            "source_url": document.source_url,
-            "normalized_url": document.normalized_url,
-            "canonical_url": document.canonical_url,
-            "title": document.title,
-            "description": document.description,
-            "markdown": document.markdown,
-            "content_type": document.content_type,
-            "status_code": document.status_code,
-            "language": document.language,
-            "depth": document.depth,
-            "referrer_url": document.referrer_url,
-            "run_id": document.run_id,
-            "site_id": document.site_id,
-            "first_seen": document.first_seen,
-            "last_seen": document.last_seen,
-            "last_crawled": document.last_crawled,
-            "last_changed": document.last_changed,
-            "outlinks": document.outlinks,
-            "is_tombstone": document.is_tombstone,
-            "headings_outline": [
-                {"level": h.level, "text": h.text, "anchor": h.anchor}
-                for h in document.headings_outline
-            ],
-        }
+        data = dict(zip(_DOCUMENT_FIELDS, _get_document_fields(document)))
+        # Format timestamps up front so json.dumps never calls back into
+        # _json_serializer for them
+        for key in _DOCUMENT_DATETIME_FIELDS:
+            value = data[key]
+            if value is not None:
+                data[key] = _cached_isoformat(value, value.utcoffset())
+        data["headings_outline"] = [
+            {"level": h.level, "text": h.text, "anchor": h.anchor}
+            for h in document.headings_outline
+        ]
 
         if self.include_html and document.html:
             data["html"] = document.html
@@ -122,28 +204,7 @@ class JSONExporter(Exporter):
 
     def _chunk_to_dict(self, chunk: Chunk) -> dict[str, Any]:
         """Convert chunk to dictionary."""
-        return {
-            "chunk_id": chunk.chunk_id,
-            "doc_id": chunk.doc_id,
-            "page_id": chunk.page_id,
-            "version_id": chunk.version_id,
-            "content": chunk.content,
-            "content_type": chunk.content_type,
-            "chunk_index": chunk.chunk_index,
-            "total_chunks": chunk.total_chunks,
-            "start_offset": chunk.start_offset,
-            "end_offset": chunk.end_offset,
-            "char_count": chunk.char_count,
-            "word_count": chunk.word_count,
-            "token_estimate": chunk.token_estimate,
-            "section_path": chunk.section_path,
-            "heading": chunk.heading,
-            "heading_level": chunk.heading_level,
-            "source_url": chunk.source_url,
-            "title": chunk.title,
-            "chunker_type": chunk.chunker_type,
-            "overlap_tokens": chunk.overlap_tokens,
-        }
+        return dict(zip(_CHUNK_FIELDS, _get_chunk_fields(chunk)))
 
     @staticmethod
     def _json_serializer(obj: Any) -> Any:
@@ -190,10 +251,9 @@ class JSONLExporter(Exporter):
         """Export documents as JSONL file."""
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w") as f:
-            for doc in documents:
-                line = self._json_exporter.export_document(doc)
-                f.write(line + "\n")
+        to_dict = self._json_exporter._document_to_dict
+        with path.open("wb") as f:
+            f.writelines(self._dumps_line(to_dict(doc)) for doc in documents)
 
     def export_chunk(self, chunk: Chunk, path: Path | None = None) -> str | None:
         """Export a chunk as JSONL line."""
@@ -203,7 +263,34 @@ class JSONLExporter(Exporter):
         """Export chunks as JSONL file."""
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w") as f:
-            for chunk in chunks:
-                line = self._json_exporter.export_chunk(chunk)
-                f.write(line + "\n")
+        to_dict = self._json_exporter._chunk_to_dict
+        with path.open("wb") as f:
+            f.writelines(self._dumps_line(to_dict(chunk)) for chunk in chunks)
+
+    @staticmethod
+    def _dumps_line(data: dict[str, Any]) -> bytes:
+        """
+        Serialize a dictionary as one newline-terminated UTF-8 JSON line.
+
+        Lines are compact and not ASCII-escaped whether or not orjson is
+        installed. The two serializers still differ in places, e.g. orjson
+        writes 1e-7 where json writes 1e-07, and NaN as null.
+        """
+        if orjson is not None:
+            # orjson serializes datetimes natively, in isoformat(); extra
+            # dicts may carry int keys, which json.dumps stringifies too
+            try:
+                return orjson.dumps(
+                    data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                # Data orjson rejects, such as ints beyond 64 bits
+                pass
+
+        line = json.dumps(
+            data,
+            default=JSONExporter._json_serializer,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return (line + "\n").encode("utf-8")
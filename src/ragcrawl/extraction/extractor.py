@@ -1,23 +1,56 @@
 """Content extraction from fetched pages."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
+from urllib.parse import urlparse
 
+from ragcrawl.extraction.html_tree import parse_html
 from ragcrawl.extraction.link_extractor import LinkExtractor
 from ragcrawl.extraction.metadata import MetadataExtractor, PageMetadata
 from ragcrawl.fetcher.base import FetchResult
 from ragcrawl.utils.hashing import compute_content_hash
-
-
-@dataclass
+from ragcrawl.utils.text import count_words
+
+# Characters that may follow the host in a same-origin URL
+_ORIGIN_TERMINATORS = frozenset("/?#")
+
+# Markdown-to-text patterns, compiled once. Inline syntax is stripped in one
+# scan: code, fences and images are removed; links and emphasis are unwrapped
+# to their (recursively stripped) inner text.
+_MD_INLINE_RE = re.compile(
+    r"```[\s\S]*?```"
+    r"|`[^`]+`"
+    r"|!\[[^\]]*\]\([^)]*\)"
+    r"|\[(?P<link>[^\]]+)\]\([^)]*\)"
+    r"|\*\*(?P<bold_star>[^*]+)\*\*"
+    r"|\*(?P<italic_star>[^*]+)\*"
+    r"|__(?P<bold_underscore>[^_]+)__"
+    r"|_(?P<italic_underscore>[^_]+)_"
+)
+# Line prefixes removed in one scan: headers, rules, bullets, numbered items
+_MD_LINE_RE = re.compile(
+    r"^(?:#{1,6}\s+|[-*_]{3,}$|[\s]*[-*+]\s+|[\s]*\d+\.\s+)", re.MULTILINE
+)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r" +")
+
+
+def _unwrap_inline(match: re.Match[str]) -> str:
+    """Replace an inline markdown match with its stripped inner text, if any."""
+    if match.lastindex is None:
+        return ""
+    return _MD_INLINE_RE.sub(_unwrap_inline, match.group(match.lastindex))
+
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of content extraction."""
 
     # Content
     markdown: str
     html: str | None = None
-    plain_text: str | None = None
 
     # Hashes
     content_hash: str = ""
@@ -38,6 +71,23 @@ class ExtractionResult:
     success: bool = True
     error: str | None = None
 
+    # Plain text, rendered from markdown on first access when requested
+    text_renderer: Callable[[str], str] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _plain_text: str | None = field(default=None, init=False, repr=False)
+
+    @property
+    def plain_text(self) -> str | None:
+        """Plain text version of the markdown, if it was requested."""
+        if self._plain_text is None and self.text_renderer is not None:
+            self._plain_text = self.text_renderer(self.markdown)
+        return self._plain_text
+
+    @plain_text.setter
+    def plain_text(self, value: str | None) -> None:
+        self._plain_text = value
+
 
 class ExtractorProtocol(Protocol):
     """Protocol for content extractors."""
@@ -63,15 +113,23 @@ class ContentExtractor:
     def __init__(
         self,
         allowed_domains: set[str] | None = None,
+        html_backend: str = "lxml",
     ) -> None:
         """
         Initialize content extractor.
 
         Args:
             allowed_domains: Domains to consider as internal.
+            html_backend: HTML parser backend, "lxml" or "selectolax".
         """
         self.allowed_domains = allowed_domains or set()
-        self.metadata_extractor = MetadataExtractor()
+        self._dot_allowed = tuple(f".{domain}" for domain in self.allowed_domains)
+        self.html_backend = html_backend
+        self.metadata_extractor = MetadataExtractor(backend=html_backend)
+        self.link_extractor = LinkExtractor(
+            allowed_domains=self.allowed_domains,
+            backend=html_backend,
+        )
 
     def extract(
         self,
@@ -105,16 +163,21 @@ class ContentExtractor:
 
             # Get HTML
             html = fetch_result.html
-            raw_hash = compute_content_hash(html) if html else None
+            # The raw hash fingerprints the HTML as fetched, so skip the
+            # whitespace normalization (most of the cost on large pages)
+            raw_hash = compute_content_hash(html, normalize=False) if html else None
+
+            # Parse once and share the tree between metadata and links
+            tree = parse_html(html, self.html_backend) if html else None
 
             # Extract metadata
             if html:
-                metadata = self.metadata_extractor.extract(html, markdown)
+                metadata = self.metadata_extractor.extract(html, markdown, tree=tree)
             else:
                 metadata = PageMetadata(
                     title=fetch_result.title,
                     description=fetch_result.description,
-                    word_count=len(markdown.split()),
+                    word_count=count_words(markdown),
                     char_count=len(markdown),
                 )
 
@@ -124,38 +187,40 @@ class ContentExtractor:
             if fetch_result.description:
                 metadata.description = fetch_result.description
 
-            # Extract links
-            link_extractor = LinkExtractor(
-                base_url=url,
-                allowed_domains=self.allowed_domains,
-            )
+            # Categorize links in a single pass
+            outlinks: list[str] = []
+            internal_links: list[str] = []
+            external_links: list[str] = []
+            add_out = outlinks.append
+            add_internal = internal_links.append
+            add_external = external_links.append
 
             if html:
-                links = link_extractor.extract(html)
-                outlinks = [link.href for link in links]
-                internal_links = [link.href for link in links if link.is_internal]
-                external_links = [link.href for link in links if not link.is_internal]
+                for link in self.link_extractor.extract(html, tree=tree, base_url=url):
+                    href = link.href
+                    add_out(href)
+                    if link.is_internal:
+                        add_internal(href)
+                    else:
+                        add_external(href)
             else:
                 # Use links from fetch result
-                outlinks = fetch_result.links or []
-                internal_links = [
-                    link for link in outlinks if self._is_internal(link, url)
-                ]
-                external_links = [
-                    link for link in outlinks if not self._is_internal(link, url)
-                ]
-
-            # Generate plain text if requested
-            plain_text = None
-            if extract_plain_text:
-                plain_text = self._markdown_to_text(markdown)
+                base = urlparse(url)
+                base_domain = base.netloc.lower()
+                origin = f"{base.scheme}://{base.netloc}"
+                is_internal = self._is_internal
+                for href in fetch_result.links or []:
+                    add_out(href)
+                    if is_internal(href, base_domain, origin):
+                        add_internal(href)
+                    else:
+                        add_external(href)
 
             latency_ms = (time.time() - start_time) * 1000
 
             return ExtractionResult(
                 markdown=markdown,
                 html=html if extract_html else None,
-                plain_text=plain_text,
                 content_hash=content_hash,
                 raw_hash=raw_hash,
                 metadata=metadata,
@@ -164,6 +229,8 @@ class ContentExtractor:
                 external_links=external_links,
                 extraction_latency_ms=latency_ms,
                 success=True,
+                # Deferred so pages dropped before storage never pay for it
+                text_renderer=self._markdown_to_text if extract_plain_text else None,
             )
 
         except Exception as e:
@@ -175,66 +242,42 @@ class ContentExtractor:
                 error=str(e),
             )
 
-    def _is_internal(self, link: str, base_url: str) -> bool:
-        """Check if link is internal."""
-        from urllib.parse import urlparse
-
-        try:
-            link_parsed = urlparse(link)
-            base_parsed = urlparse(base_url)
-
-            link_domain = link_parsed.netloc.lower()
-            base_domain = base_parsed.netloc.lower()
+    def _is_internal(self, link: str, base_domain: str, origin: str) -> bool:
+        """
+        Check if link is internal.
 
-            if link_domain == base_domain:
-                return True
+        Args:
+            link: Absolute link URL.
+            base_domain: Lowercased netloc of the page URL.
+            origin: "scheme://netloc" of the page URL.
 
-            if link_domain in self.allowed_domains:
+        Returns:
+            True if the link points at the page's host or an allowed domain.
+        """
+        # Same-origin links skip urlparse entirely
+        if link.startswith(origin):
+            rest = link[len(origin) : len(origin) + 1]
+            if not rest or rest in _ORIGIN_TERMINATORS:
                 return True
 
-            for domain in self.allowed_domains:
-                if link_domain.endswith(f".{domain}"):
-                    return True
-
+        try:
+            link_domain = urlparse(link).netloc.lower()
+        except ValueError:
             return False
 
-        except Exception:
-            return False
+        return (
+            link_domain == base_domain
+            or link_domain in self.allowed_domains
+            or link_domain.endswith(self._dot_allowed)
+        )
 
     def _markdown_to_text(self, markdown: str) -> str:
         """Convert markdown to plain text."""
-        import re
-
-        text = markdown
-
-        # Remove code blocks
-        text = re.sub(r"```[\s\S]*?```", "", text)
-        text = re.sub(r"`[^`]+`", "", text)
-
-        # Remove images
-        text = re.sub(r"!\[[^\]]*\]\([^)]*\)", "", text)
-
-        # Convert links to just text
-        text = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", text)
-
-        # Remove headers markers
-        text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-
-        # Remove bold/italic
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
-        text = re.sub(r"__([^_]+)__", r"\1", text)
-        text = re.sub(r"_([^_]+)_", r"\1", text)
-
-        # Remove horizontal rules
-        text = re.sub(r"^[-*_]{3,}$", "", text, flags=re.MULTILINE)
-
-        # Remove list markers
-        text = re.sub(r"^[\s]*[-*+]\s+", "", text, flags=re.MULTILINE)
-        text = re.sub(r"^[\s]*\d+\.\s+", "", text, flags=re.MULTILINE)
+        text = _MD_INLINE_RE.sub(_unwrap_inline, markdown)
+        text = _MD_LINE_RE.sub("", text)
 
         # Normalize whitespace
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r" +", " ", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+        text = _SPACES_RE.sub(" ", text)
 
         return text.strip()
@@ -0,0 +1,104 @@
+"""Shared HTML parsing for the extractors."""
+
+from collections.abc import Iterator
+from typing import Any
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml ships with crawl4ai
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional [fast] extra
+    LexborHTMLParser = None
+
+HTML_BACKENDS = ("lxml", "selectolax")
+
+
+class _LexborElement:
+    """Read-only view of a Lexbor node with the lxml calls the extractors use."""
+
+    __slots__ = ("_node", "_attrs", "tag")
+
+    def __init__(self, node: Any) -> None:
+        self._node = node
+        self._attrs = node.attributes
+        self.tag = node.tag
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        """Return an attribute value, like lxml's Element.get()."""
+        value = self._attrs.get(name)
+        return default if value is None else value
+
+    def text_content(self) -> str:
+        """Return the text of this node and its descendants."""
+        return self._node.text(deep=True)
+
+
+class _LexborTree:
+    """Lexbor document exposing lxml's iter(*tags) in document order."""
+
+    __slots__ = ("_parser",)
+
+    def __init__(self, parser: Any) -> None:
+        self._parser = parser
+
+    def iter(self, *tags: str) -> Iterator[_LexborElement]:
+        """Yield elements matching any of the given tag names."""
+        for node in self._parser.css(",".join(tags)):
+            yield _LexborElement(node)
+
+
+def parse_html(html: str, backend: str = "lxml") -> Any | None:
+    """
+    Parse HTML once into an element tree.
+
+    The tree can be shared between MetadataExtractor and LinkExtractor so a
+    page is tokenized a single time. Both backends expose the same small
+    subset of the lxml element API (iter, get, text_content, tag).
+
+    Args:
+        html: HTML content.
+        backend: "lxml", or "selectolax" for the faster Lexbor parser
+            (falls back to lxml when selectolax is not installed).
+
+    Returns:
+        Root of the parsed document, or None if no parser is available
+        or the document cannot be parsed (callers then fall back to regex
+        scanning).
+
+    Raises:
+        ValueError: If backend is not one of HTML_BACKENDS.
+    """
+    if backend not in HTML_BACKENDS:
+        raise ValueError(f"Unknown HTML backend: {backend!r}")
+
+    if not html or html.isspace():
+        return None
+
+    if backend == "selectolax" and LexborHTMLParser is not None:
+        return _LexborTree(LexborHTMLParser(html))
+
+    if lxml is None:
+        return None
+
+    try:
+        return lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        # ValueError: str input carrying an XML encoding declaration
+        return None
+
+
+def normalize_space(text: str | None) -> str:
+    """
+    Collapse whitespace runs in parsed text to single spaces.
+
+    Args:
+        text: Text content from the tree (entities already decoded).
+
+    Returns:
+        Stripped, whitespace-normalized text.
+    """
+    return " ".join(text.split()) if text else ""
@@ -1,11 +1,36 @@
 """Link extraction from HTML content."""
 
 import re
+from collections.abc import Collection, Iterator
 from dataclasses import dataclass
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Any
+from urllib.parse import ParseResult, urlparse
 
+from ragcrawl.extraction.html_tree import normalize_space, parse_html
+from ragcrawl.utils.urls import join_url, url_origin
 
-@dataclass
+# Regex fallback patterns, compiled once. Anchors are found opener first;
+# the tag end and the closing </a> are then located by forward searches, so
+# long or unclosed anchors cannot make a lazy .*? retry </a> at every offset.
+_ANCHOR_OPEN_RE = re.compile(r"<a\s", re.IGNORECASE)
+_ANCHOR_CLOSE_RE = re.compile(r"</a\s*>", re.IGNORECASE)
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Href prefixes that never lead to a crawlable page
+_SPECIAL_SCHEMES = ("javascript:", "mailto:", "tel:", "data:", "#", "void(")
+_SPECIAL_PREFIX_LEN = max(map(len, _SPECIAL_SCHEMES))
+
+
+@lru_cache(maxsize=1024)
+def _page_scope(domain: str) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Internal-domain set and subdomain suffixes for a page on domain."""
+    return frozenset((domain,)), (f".{domain}",)
+
+
+@dataclass(slots=True)
 class ExtractedLink:
     """An extracted link with metadata."""
 
@@ -23,87 +48,145 @@ class LinkExtractor:
 
     def __init__(
         self,
-        base_url: str,
+        base_url: str | None = None,
         allowed_domains: set[str] | None = None,
+        backend: str = "lxml",
     ) -> None:
         """
         Initialize link extractor.
 
+        One extractor can serve a whole crawl: pass each page's URL to
+        extract() instead of constructing an extractor per page.
+
         Args:
-            base_url: Base URL for resolving relative links.
-            allowed_domains: Domains to consider as internal.
+            base_url: Default base URL for resolving relative links.
+            allowed_domains: Domains to consider as internal. Defaults to the
+                domain of the page being extracted.
+            backend: HTML parser backend, "lxml" or "selectolax".
         """
         self.base_url = base_url
-        self.base_parsed = urlparse(base_url)
-        self.base_domain = self.base_parsed.netloc.lower()
-
-        self.allowed_domains = allowed_domains or {self.base_domain}
-
-    def extract(self, html: str) -> list[ExtractedLink]:
+        self.backend = backend
+
+        # Explicit domains apply to every page; otherwise each page's own
+        # domain (and its subdomains) is internal
+        self._shared_domains = bool(allowed_domains)
+        if allowed_domains:
+            self.allowed_domains = allowed_domains
+            self._dot_allowed = tuple(f".{domain}" for domain in allowed_domains)
+        elif base_url:
+            domain = urlparse(base_url).netloc.lower()
+            self.allowed_domains = {domain}
+            self._dot_allowed = (f".{domain}",)
+        else:
+            self.allowed_domains = set()
+            self._dot_allowed = ()
+
+    def extract(
+        self, html: str, tree: Any | None = None, base_url: str | None = None
+    ) -> list[ExtractedLink]:
         """
         Extract all links from HTML.
 
         Args:
             html: HTML content.
+            tree: Optional pre-parsed tree from parse_html().
+            base_url: URL of the page, overriding the extractor's base_url.
 
         Returns:
             List of extracted links.
+
+        Raises:
+            ValueError: If no base URL was given here or at construction.
         """
-        links: list[ExtractedLink] = []
-        seen_hrefs: set[str] = set()
+        base_url = base_url or self.base_url
+        if not base_url:
+            raise ValueError("LinkExtractor.extract() requires a base_url")
 
-        # Match anchor tags
-        pattern = r"<a\s+([^>]*)>(.*?)</a>"
-        for match in re.finditer(pattern, html, re.IGNORECASE | re.DOTALL):
-            attrs = match.group(1)
-            text = self._clean_text(match.group(2))
+        if self._shared_domains or base_url == self.base_url:
+            allowed, dot_allowed = self.allowed_domains, self._dot_allowed
+        else:
+            allowed, dot_allowed = _page_scope(urlparse(base_url).netloc.lower())
 
-            # Extract href
-            href_match = re.search(r'href=["\']([^"\']+)["\']', attrs)
-            if not href_match:
-                continue
+        # Origin for root-relative hrefs, which are joined without urljoin
+        origin = url_origin(base_url)
 
-            href = href_match.group(1).strip()
+        links: list[ExtractedLink] = []
+        seen_hrefs: set[str] = set()
 
+        if tree is None:
+            tree = parse_html(html, self.backend)
+        if tree is not None:
+            anchors = self._iter_tree_anchors(tree)
+        else:
+            anchors = self._iter_regex_anchors(html)
+
+        for href, text, is_nofollow in anchors:
             # Skip javascript:, mailto:, tel:, etc.
             if self._is_special_scheme(href):
                 continue
 
-            # Resolve relative URLs
-            resolved = self._resolve_url(href)
-            if not resolved:
+            # Resolve relative URLs (parsed once, reused below)
+            result = self._resolve_url(href, base_url, origin)
+            if result is None:
                 continue
+            resolved, parsed = result
 
             # Deduplicate
-            normalized = self._normalize_for_dedup(resolved)
+            normalized = self._normalize_for_dedup(parsed)
             if normalized in seen_hrefs:
                 continue
             seen_hrefs.add(normalized)
 
-            # Check if nofollow
-            is_nofollow = "nofollow" in attrs.lower()
-
-            # Check if internal
-            is_internal = self._is_internal(resolved)
-
-            # Extract anchor
-            anchor = None
-            parsed = urlparse(resolved)
-            if parsed.fragment:
-                anchor = parsed.fragment
-
             links.append(
                 ExtractedLink(
                     href=resolved,
                     text=text if text else None,
-                    is_internal=is_internal,
+                    is_internal=self._is_internal(parsed, allowed, dot_allowed),
                     is_nofollow=is_nofollow,
-                    anchor=anchor,
+                    anchor=parsed.fragment or None,
                 )
             )
 
         return links
 
+    def _iter_tree_anchors(self, tree: Any) -> Iterator[tuple[str, str, bool]]:
+        """Yield (href, text, is_nofollow) for each <a href> in a parsed tree."""
+        for elem in tree.iter("a"):
+            href = (elem.get("href") or "").strip()
+            if not href:
+                continue
+
+            rel = (elem.get("rel") or "").lower()
+            yield href, normalize_space(elem.text_content()), "nofollow" in rel
+
+    def _iter_regex_anchors(self, html: str) -> Iterator[tuple[str, str, bool]]:
+        """Yield (href, text, is_nofollow) for each anchor found by regex."""
+        resume = 0
+        for match in _ANCHOR_OPEN_RE.finditer(html):
+            # Skip openers inside the previous anchor's text
+            if match.start() < resume:
+                continue
+
+            tag_end = html.find(">", match.end())
+            if tag_end < 0:
+                return
+            close = _ANCHOR_CLOSE_RE.search(html, tag_end + 1)
+            if close is None:
+                # Nothing after this point can be a closed anchor
+                return
+            resume = close.end()
+
+            attrs = html[match.end() : tag_end]
+            href_match = _HREF_RE.search(attrs)
+            if not href_match:
+                continue
+
+            yield (
+                href_match.group(1).strip(),
+                self._clean_text(html[tag_end + 1 : close.start()]),
+                "nofollow" in attrs.lower(),
+            )
+
     def extract_urls(self, html: str) -> list[str]:
         """
         Extract just the URLs from HTML.
@@ -140,66 +223,50 @@ class LinkExtractor:
         """
         return [link.href for link in self.extract(html) if not link.is_internal]
 
-    def _resolve_url(self, href: str) -> str | None:
-        """Resolve a URL relative to base URL."""
+    def _resolve_url(
+        self, href: str, base_url: str, origin: str = ""
+    ) -> tuple[str, ParseResult] | None:
+        """Resolve a URL relative to base URL, returning it with its parse."""
         try:
-            resolved = urljoin(self.base_url, href)
+            resolved = join_url(base_url, href, origin)
             parsed = urlparse(resolved)
 
             # Only allow http/https
             if parsed.scheme not in ("http", "https"):
                 return None
 
-            return resolved
+            return resolved, parsed
 
         except Exception:
             return None
 
-    def _is_internal(self, url: str) -> bool:
-        """Check if URL is internal."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+    def _is_internal(
+        self, parsed: ParseResult, allowed: Collection[str], dot_allowed: tuple[str, ...]
+    ) -> bool:
+        """Check if a parsed URL is internal."""
+        domain = parsed.netloc.lower()
 
-            # Direct domain match
-            if domain in self.allowed_domains:
-                return True
+        # Direct domain match
+        if domain in allowed:
+            return True
 
-            # Check subdomains
-            for allowed in self.allowed_domains:
-                if domain.endswith(f".{allowed}"):
-                    return True
-
-            return False
-
-        except Exception:
-            return False
+        # Check subdomains
+        return domain.endswith(dot_allowed)
 
     def _is_special_scheme(self, href: str) -> bool:
         """Check if href has a special scheme to skip."""
-        special = (
-            "javascript:",
-            "mailto:",
-            "tel:",
-            "data:",
-            "#",
-            "void(",
-        )
-        return any(href.lower().startswith(s) for s in special)
-
-    def _normalize_for_dedup(self, url: str) -> str:
-        """Normalize URL for deduplication."""
-        try:
-            parsed = urlparse(url)
-            # Remove fragment for dedup
-            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        except Exception:
-            return url
+        # Only the prefix matters, so avoid lowercasing the whole href
+        return href[:_SPECIAL_PREFIX_LEN].lower().startswith(_SPECIAL_SCHEMES)
+
+    def _normalize_for_dedup(self, parsed: ParseResult) -> str:
+        """Normalize a parsed URL for deduplication."""
+        # Remove fragment for dedup
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
     def _clean_text(self, text: str) -> str:
         """Clean link text."""
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _TAG_RE.sub("", text)
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         return text.strip()
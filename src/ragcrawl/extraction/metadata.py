@@ -1,11 +1,64 @@
 """Metadata extraction from HTML pages."""
 
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
+from html import unescape
 from typing import Any
 
-
-@dataclass
+from ragcrawl.extraction.html_tree import normalize_space, parse_html
+from ragcrawl.utils.text import count_words
+
+# Regex fallback patterns, compiled once
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+_H1_RE = re.compile(r"<h1[^>]*>([^<]+)</h1>", re.IGNORECASE)
+# <meta>/<link> openers; the tag end is found with str.find and attributes
+# are matched one at a time. Attribute values are disjoint alternatives
+# (quoted or bare) and names cannot contain quotes, so the scan stays linear
+# on hostile markup instead of backtracking across attribute boundaries.
+_META_OPEN_RE = re.compile(r"<meta\b", re.IGNORECASE)
+_LINK_OPEN_RE = re.compile(r"<link\b", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+_HEAD_END_RE = re.compile(r"</head\s*>|<body[\s>]", re.IGNORECASE)
+_HTML_LANG_RE = re.compile(r'<html[^>]+lang=["\']([^"\']+)["\']', re.IGNORECASE)
+# Headings are scanned like anchors: opener, then forward searches for the
+# tag end and the matching close tag
+_HEADING_OPEN_RE = re.compile(r"<h([1-6])(?=[\s>])", re.IGNORECASE)
+_HEADING_CLOSE_RES = {
+    level: re.compile(rf"</h{level}\s*>", re.IGNORECASE) for level in "123456"
+}
+_ID_ATTR_RE = re.compile(r'id=["\']([^"\']+)["\']')
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _iter_tag_attrs(html: str, opener: re.Pattern[str]) -> Iterator[dict[str, str]]:
+    """Yield the parsed attributes of each tag whose start matches opener."""
+    for match in opener.finditer(html):
+        end = html.find(">", match.end())
+        if end < 0:
+            # No tag can be closed past this point
+            return
+        yield _parse_attrs(html[match.end() : end])
+
+
+def _head_section(html: str) -> str:
+    """Return the document up to the end of <head>, or all of it if unmarked."""
+    match = _HEAD_END_RE.search(html)
+    return html[: match.start()] if match else html
+
+
+def _parse_attrs(attrs: str) -> dict[str, str]:
+    """Parse a tag's attribute text into {lowercased name: value}; first wins."""
+    parsed: dict[str, str] = {}
+    for match in _ATTR_RE.finditer(attrs):
+        name, double, single, bare = match.groups()
+        value = double if double is not None else single if single is not None else bare
+        parsed.setdefault(name.lower(), value or "")
+    return parsed
+
+
+@dataclass(slots=True)
 class HeadingInfo:
     """Information about a heading."""
 
@@ -14,7 +67,7 @@ class HeadingInfo:
     anchor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PageMetadata:
     """Extracted metadata from a page."""
 
@@ -35,168 +88,239 @@ class PageMetadata:
     char_count: int = 0
 
 
+def _index_meta(
+    elems: Iterable[Any], clean: Callable[[str], str]
+) -> dict[tuple[str, str], str]:
+    """
+    Index <meta> tags by (attribute, lowercased value) in one pass.
+
+    Args:
+        elems: Parsed elements or attribute dicts; anything with .get().
+        clean: Normalizes the content attribute.
+
+    Returns:
+        Mapping such as ("property", "og:title") -> content; first tag wins.
+    """
+    meta: dict[tuple[str, str], str] = {}
+    for elem in elems:
+        content = clean(elem.get("content") or "")
+        if not content:
+            continue
+        for attr in ("name", "property"):
+            value = elem.get(attr)
+            if value:
+                meta.setdefault((attr, value.lower()), content)
+    return meta
+
+
+def _apply_meta(metadata: PageMetadata, meta: dict[tuple[str, str], str]) -> None:
+    """Fill the meta-tag backed fields of metadata from _index_meta() output."""
+    metadata.description = meta.get(("name", "description"))
+    keywords = meta.get(("name", "keywords"))
+    if keywords:
+        metadata.keywords = [k.strip() for k in keywords.split(",") if k.strip()]
+    metadata.author = meta.get(("name", "author"))
+
+    # Dates
+    metadata.published_date = meta.get(("name", "article:published_time")) or meta.get(
+        ("name", "datepublished")
+    )
+    metadata.modified_date = meta.get(("name", "article:modified_time")) or meta.get(
+        ("name", "datemodified")
+    )
+
+    # Open Graph
+    metadata.og_title = meta.get(("property", "og:title"))
+    metadata.og_description = meta.get(("property", "og:description"))
+    metadata.og_image = meta.get(("property", "og:image"))
+    metadata.og_type = meta.get(("property", "og:type"))
+
+
 class MetadataExtractor:
     """
     Extracts metadata from HTML pages.
     """
 
-    def extract(self, html: str, text: str | None = None) -> PageMetadata:
+    def __init__(self, backend: str = "lxml") -> None:
+        """
+        Initialize metadata extractor.
+
+        Args:
+            backend: HTML parser backend, "lxml" or "selectolax".
+        """
+        self.backend = backend
+
+    def extract(
+        self, html: str, text: str | None = None, tree: Any | None = None
+    ) -> PageMetadata:
         """
         Extract metadata from HTML.
 
         Args:
             html: HTML content.
             text: Optional plain text for word/char counting.
+            tree: Optional pre-parsed tree from parse_html().
 
         Returns:
             PageMetadata with extracted values.
         """
-        metadata = PageMetadata()
+        if tree is None:
+            tree = parse_html(html, self.backend)
+        if tree is not None:
+            return self._extract_from_tree(tree, text)
+
+        # Fallback: scan the raw HTML with regexes, indexing every <meta>
+        # tag in one pass instead of rescanning the document per name. Head
+        # tags are only looked for in <head>, which is usually a small
+        # prefix of the page. The headings list is passed in so the dataclass
+        # does not build a default one only to have it replaced.
+        metadata = PageMetadata(headings_outline=self._extract_headings(html))
+        head = _head_section(html)
+        meta = _index_meta(_iter_tag_attrs(head, _META_OPEN_RE), self._clean_text)
+        _apply_meta(metadata, meta)
+
+        metadata.title = self._extract_title(html, metadata.og_title, head)
+        metadata.canonical_url = self._extract_canonical(head)
+        metadata.language = self._extract_language(head) or meta.get(
+            ("name", "content-language")
+        )
+
+        # Word/char count
+        if text:
+            metadata.word_count = count_words(text)
+            metadata.char_count = len(text)
 
-        # Title
-        metadata.title = self._extract_title(html)
-
-        # Meta tags
-        metadata.description = self._extract_meta(html, "description")
-        metadata.keywords = self._extract_keywords(html)
-        metadata.author = self._extract_meta(html, "author")
-        metadata.canonical_url = self._extract_canonical(html)
-        metadata.language = self._extract_language(html)
-
-        # Dates
-        metadata.published_date = self._extract_meta(
-            html, "article:published_time"
-        ) or self._extract_meta(html, "datePublished")
-        metadata.modified_date = self._extract_meta(
-            html, "article:modified_time"
-        ) or self._extract_meta(html, "dateModified")
-
-        # Open Graph
-        metadata.og_title = self._extract_meta(html, "og:title", property_attr=True)
-        metadata.og_description = self._extract_meta(html, "og:description", property_attr=True)
-        metadata.og_image = self._extract_meta(html, "og:image", property_attr=True)
-        metadata.og_type = self._extract_meta(html, "og:type", property_attr=True)
+        return metadata
+
+    def _extract_from_tree(self, tree: Any, text: str | None) -> PageMetadata:
+        """Extract metadata from a parsed tree in a single walk per tag."""
+        metadata = PageMetadata()
+        meta = _index_meta(tree.iter("meta"), normalize_space)
+        _apply_meta(metadata, meta)
+
+        # Title: <title>, then og:title, then first <h1>
+        metadata.title = metadata.og_title
+        for elem in tree.iter("title"):
+            title = normalize_space(elem.text_content())
+            if title:
+                metadata.title = title
+            break
+        if not metadata.title:
+            for elem in tree.iter("h1"):
+                metadata.title = normalize_space(elem.text_content()) or None
+                break
+
+        for elem in tree.iter("link"):
+            href = elem.get("href")
+            if href and (elem.get("rel") or "").lower() == "canonical":
+                metadata.canonical_url = href
+                break
+
+        for elem in tree.iter("html"):
+            lang = elem.get("lang")
+            if lang:
+                metadata.language = lang.split("-")[0].lower()
+            break
+        if not metadata.language:
+            metadata.language = meta.get(("name", "content-language"))
 
         # Headings outline
-        metadata.headings_outline = self._extract_headings(html)
+        for elem in tree.iter("h1", "h2", "h3", "h4", "h5", "h6"):
+            heading = normalize_space(elem.text_content())
+            if heading:
+                metadata.headings_outline.append(
+                    HeadingInfo(
+                        level=int(elem.tag[1]), text=heading, anchor=elem.get("id") or None
+                    )
+                )
 
         # Word/char count
         if text:
-            metadata.word_count = len(text.split())
+            metadata.word_count = count_words(text)
             metadata.char_count = len(text)
 
         return metadata
 
-    def _extract_title(self, html: str) -> str | None:
+    def _extract_title(
+        self, html: str, og_title: str | None = None, head: str | None = None
+    ) -> str | None:
         """Extract page title."""
         # Try <title> tag first
-        match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+        match = _TITLE_RE.search(html if head is None else head)
         if match:
             return self._clean_text(match.group(1))
 
         # Try og:title
-        og_title = self._extract_meta(html, "og:title", property_attr=True)
         if og_title:
             return og_title
 
         # Try first h1
-        match = re.search(r"<h1[^>]*>([^<]+)</h1>", html, re.IGNORECASE)
+        match = _H1_RE.search(html)
         if match:
             return self._clean_text(match.group(1))
 
         return None
 
-    def _extract_meta(
-        self, html: str, name: str, property_attr: bool = False
-    ) -> str | None:
-        """Extract meta tag content."""
-        attr = "property" if property_attr else "name"
-
-        patterns = [
-            rf'<meta[^>]+{attr}=["\']?{re.escape(name)}["\']?[^>]+content=["\']([^"\']+)["\']',
-            rf'<meta[^>]+content=["\']([^"\']+)["\'][^>]+{attr}=["\']?{re.escape(name)}["\']?',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                return self._clean_text(match.group(1))
-
-        return None
-
     def _extract_canonical(self, html: str) -> str | None:
         """Extract canonical URL."""
-        match = re.search(
-            r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']',
-            html,
-            re.IGNORECASE,
-        )
-        if match:
-            return match.group(1)
-
-        match = re.search(
-            r'<link[^>]+href=["\']([^"\']+)["\'][^>]+rel=["\']canonical["\']',
-            html,
-            re.IGNORECASE,
-        )
-        if match:
-            return match.group(1)
+        for attrs in _iter_tag_attrs(html, _LINK_OPEN_RE):
+            href = attrs.get("href")
+            if href and attrs.get("rel", "").lower() == "canonical":
+                return unescape(href)
 
         return None
 
     def _extract_language(self, html: str) -> str | None:
-        """Extract page language."""
-        # Try html lang attribute
-        match = re.search(r'<html[^>]+lang=["\']([^"\']+)["\']', html, re.IGNORECASE)
+        """Extract page language from the html lang attribute."""
+        match = _HTML_LANG_RE.search(html)
         if match:
             return match.group(1).split("-")[0].lower()
 
-        # Try meta Content-Language
-        return self._extract_meta(html, "Content-Language")
-
-    def _extract_keywords(self, html: str) -> list[str]:
-        """Extract keywords."""
-        keywords_str = self._extract_meta(html, "keywords")
-        if keywords_str:
-            return [k.strip() for k in keywords_str.split(",") if k.strip()]
-        return []
+        return None
 
     def _extract_headings(self, html: str) -> list[HeadingInfo]:
         """Extract headings outline."""
         headings = []
 
-        pattern = r"<(h[1-6])([^>]*)>([^<]*)</h[1-6]>"
-        for match in re.finditer(pattern, html, re.IGNORECASE):
-            tag = match.group(1).lower()
-            attrs = match.group(2)
-            text = self._clean_text(match.group(3))
+        resume = 0
+        unclosed: set[str] = set()  # Levels with no close tag left in the page
+        for match in _HEADING_OPEN_RE.finditer(html):
+            level = match.group(1)
+            if match.start() < resume or level in unclosed:
+                continue
 
-            if not text:
+            tag_end = html.find(">", match.end())
+            if tag_end < 0:
+                break
+            close = _HEADING_CLOSE_RES[level].search(html, tag_end + 1)
+            if close is None:
+                unclosed.add(level)
                 continue
+            resume = close.end()
 
-            level = int(tag[1])
+            # Drop nested inline tags (<a>, <em>, ...) and skip empty headings
+            text = self._clean_text(_TAG_RE.sub("", html[tag_end + 1 : close.start()]))
+            if not text:
+                continue
 
             # Try to extract id/anchor
             anchor = None
-            id_match = re.search(r'id=["\']([^"\']+)["\']', attrs)
-            if id_match:
-                anchor = id_match.group(1)
+            attrs = html[match.end() : tag_end]
+            if attrs:
+                id_match = _ID_ATTR_RE.search(attrs)
+                if id_match:
+                    anchor = id_match.group(1)
 
-            headings.append(HeadingInfo(level=level, text=text, anchor=anchor))
+            headings.append(HeadingInfo(level=int(level), text=text, anchor=anchor))
 
         return headings
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text."""
-        # Decode HTML entities
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
-        text = text.replace("&#39;", "'")
-        text = text.replace("&nbsp;", " ")
+        # Decode HTML entities (named and numeric) in one pass
+        text = unescape(text)
 
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
         return text.strip()
@@ -18,7 +18,7 @@ class FetchStatus(str, Enum):
     REDIRECT = "redirect"
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchResult:
     """Result of a fetch operation."""
 
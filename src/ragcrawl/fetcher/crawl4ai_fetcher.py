@@ -4,18 +4,92 @@ import asyncio
 import contextlib
 import re
 import time
+from collections.abc import AsyncIterator, Iterable, Mapping
 from datetime import datetime
 from typing import Any
-from urllib.parse import urljoin
 
 from ragcrawl.config.crawler_config import FetchMode, RetryConfig
 from ragcrawl.config.markdown_config import ContentFilterType, MarkdownConfig
 from ragcrawl.fetcher.base import BaseFetcher, FetchResult, FetchStatus
-from ragcrawl.fetcher.revalidation import Revalidator
+from ragcrawl.fetcher.revalidation import RevalidationStatus, Revalidator
 from ragcrawl.utils.logging import get_logger
+from ragcrawl.utils.urls import join_url, url_origin
+
+try:
+    import h2  # noqa: F401 - httpx only needs it importable for http2=True
+except ImportError:  # pragma: no cover - optional [fast] extra
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional [fast] extra
+    LexborHTMLParser = None
 
 logger = get_logger(__name__)
 
+# Patterns for the regex fallback when Crawl4AI extraction is unavailable
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+_DESC_RE = re.compile(
+    r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']')
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+# Markers of client-rendered pages whose HTTP response lacks the real content.
+# Plain substring tests beat a compiled alternation here: str's fastsearch
+# skips ahead per needle, while re tries every branch at each offset.
+_SPA_INDICATORS = (
+    "ng-app",
+    "data-reactroot",
+    "__NEXT_DATA__",
+    "window.__NUXT__",
+    'id="app"',
+    'id="root"',
+)
+
+# Pages at most this long that carry an SPA marker are treated as empty shells
+_SPA_SHELL_MAX_CHARS = 32 * 1024
+
+# Media types whose bodies are never worth downloading and decoding as text
+_BINARY_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/octet-stream",
+    "application/pdf",
+    "application/zip",
+)
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Response headers kept on FetchResult; the rest are dropped with the response
+_KEPT_HEADERS = (
+    "etag",
+    "last-modified",
+    "content-type",
+    "content-encoding",
+    "cache-control",
+    "vary",
+)
+
+
+def _looks_like_spa_shell(html: str) -> bool:
+    """Check whether raw HTML is a small client-rendered shell."""
+    return len(html) <= _SPA_SHELL_MAX_CHARS and any(
+        marker in html for marker in _SPA_INDICATORS
+    )
+
+
+def _kept_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Copy the caching and content headers worth keeping from a response."""
+    return {name: value for name in _KEPT_HEADERS if (value := headers.get(name)) is not None}
+
 
 class Crawl4AIFetcher(BaseFetcher):
     """
@@ -37,6 +111,10 @@ class Crawl4AIFetcher(BaseFetcher):
         follow_redirects: bool = True,
         max_redirects: int = 10,
         markdown_config: MarkdownConfig | None = None,
+        max_body_bytes: int = 10 * 1024 * 1024,
+        max_concurrency: int = 32,
+        revalidate_with_head: bool = True,
+        revalidator: Revalidator | None = None,
     ) -> None:
         """
         Initialize Crawl4AI fetcher.
@@ -53,6 +131,12 @@ class Crawl4AIFetcher(BaseFetcher):
             follow_redirects: Whether to follow redirects.
             max_redirects: Maximum redirects to follow.
             markdown_config: Markdown generation and filtering configuration.
+            max_body_bytes: Abort HTTP downloads whose body exceeds this size.
+            max_concurrency: Maximum fetches fetch_batch runs at once.
+            revalidate_with_head: When validators are given, send a HEAD
+                first and skip the GET if the page is unchanged.
+            revalidator: Decides which validators are sent and compared;
+                defaults to one using both ETag and Last-Modified.
         """
         self.fetch_mode = fetch_mode
         self.user_agent = user_agent
@@ -65,16 +149,55 @@ class Crawl4AIFetcher(BaseFetcher):
         self.follow_redirects = follow_redirects
         self.max_redirects = max_redirects
         self.markdown_config = markdown_config or MarkdownConfig()
+        self.max_body_bytes = max_body_bytes
+        self.max_concurrency = max_concurrency
+        self.revalidate_with_head = revalidate_with_head
+
+        # Preferred markdown variants, in order, resolved once from the config
+        # so per-page extraction doesn't re-read the flags.
+        mc = self.markdown_config
+        self._markdown_fields: tuple[str, ...] = tuple(
+            name
+            for name, enabled in (
+                ("markdown_with_citations", mc.include_citations),
+                ("fit_markdown", mc.use_fit_markdown),
+            )
+            if enabled
+        )
 
-        self.revalidator = Revalidator()
+        self.revalidator = revalidator or Revalidator()
         self._crawler: Any = None
+        self._http_client: Any = None
+        self._batch_semaphore = asyncio.Semaphore(max_concurrency)
         self._initialized = False
 
     async def _ensure_initialized(self) -> None:
-        """Ensure Crawl4AI is initialized (only for browser mode)."""
+        """Ensure the HTTP client and, in browser mode, Crawl4AI are initialized."""
         if self._initialized:
             return
 
+        # One pooled client for the fetcher's lifetime keeps connections
+        # (and their TLS sessions) alive across fetch() and fetch_batch().
+        # With h2 installed, concurrent fetches to a host share one
+        # multiplexed HTTP/2 connection; otherwise it stays on HTTP/1.1.
+        if self._http_client is None:
+            import httpx
+
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
+                max_redirects=self.max_redirects,
+                proxy=self.proxy,
+                http2=HTTP2_AVAILABLE,
+                headers={"User-Agent": self.user_agent, **self.headers},
+                cookies=self.cookies,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=200,
+                    keepalive_expiry=15.0,
+                ),
+            )
+
         # Only initialize Crawl4AI browser for BROWSER mode
         if self.fetch_mode == FetchMode.BROWSER:
             try:
@@ -113,32 +236,25 @@ class Crawl4AIFetcher(BaseFetcher):
         """
         await self._ensure_initialized()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         fetch_started = datetime.now()
 
         try:
-            # Try HTTP mode first if hybrid or HTTP
-            if self.fetch_mode in (FetchMode.HTTP, FetchMode.HYBRID):
-                result = await self._fetch_http(url, etag, last_modified)
-
-                # If hybrid and content looks incomplete, try browser
-                if (
-                    self.fetch_mode == FetchMode.HYBRID
-                    and result.is_success
-                    and self._needs_browser_rendering(result)
-                ):
-                    logger.debug("Falling back to browser rendering", url=url)
-                    result = await self._fetch_browser(url)
-                    result.used_browser = True
-
-            else:  # Browser mode
-                result = await self._fetch_browser(url)
-                result.used_browser = True
+            # Settle unchanged pages with a HEAD round trip, before any body
+            # download or browser render
+            result = None
+            if self.revalidate_with_head and self.revalidator.has_validators(
+                etag, last_modified
+            ):
+                result = await self._revalidate_with_head(url, etag, last_modified)
+
+            if result is None:
+                result = await self._fetch_fresh(url, etag, last_modified)
 
             # Set timing
             result.fetch_started_at = fetch_started
             result.fetch_completed_at = datetime.now()
-            result.latency_ms = (time.time() - start_time) * 1000
+            result.latency_ms = (time.perf_counter() - start_time) * 1000
 
             return result
 
@@ -149,33 +265,63 @@ class Crawl4AIFetcher(BaseFetcher):
                 error=str(e),
                 fetch_started_at=fetch_started,
                 fetch_completed_at=datetime.now(),
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    async def _fetch_fresh(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> FetchResult:
+        """Fetch over HTTP or the browser according to fetch_mode."""
+        # Try HTTP mode first if hybrid or HTTP
+        if self.fetch_mode in (FetchMode.HTTP, FetchMode.HYBRID):
+            # Without a browser, the fallback would only repeat the HTTP fetch
+            can_render = self.fetch_mode == FetchMode.HYBRID and self._crawler is not None
+            result = await self._fetch_http(
+                url, etag, last_modified, defer_spa_shells=can_render
             )
 
+            # If hybrid and content looks incomplete, try browser
+            if (
+                can_render
+                and result.is_success
+                and self._needs_browser_rendering(result)
+            ):
+                logger.debug("Falling back to browser rendering", url=url)
+                result = await self._fetch_browser(url)
+                result.used_browser = True
+
+        else:  # Browser mode
+            result = await self._fetch_browser(url)
+            result.used_browser = True
+
+        return result
+
     async def _fetch_http(
         self,
         url: str,
         etag: str | None = None,
         last_modified: str | None = None,
+        defer_spa_shells: bool = False,
     ) -> FetchResult:
-        """Fetch using HTTP client."""
+        """
+        Fetch using HTTP client.
+
+        With defer_spa_shells, pages that look like an unrendered SPA shell
+        are returned without markdown, so the caller's browser fallback runs
+        the only extraction.
+        """
         import httpx
 
-        headers = {**self.headers, "User-Agent": self.user_agent}
+        if self._http_client is None:
+            await self._ensure_initialized()
 
-        # Add conditional headers
+        # Client-level headers and cookies apply; only send the conditional ones
         cond_headers = self.revalidator.get_conditional_headers(etag, last_modified)
-        headers.update(cond_headers)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=self.follow_redirects,
-                max_redirects=self.max_redirects,
-                proxy=self.proxy,
-            ) as client:
-                response = await client.get(url, headers=headers, cookies=self.cookies)
-
+            # Stream the body so oversized or binary responses are dropped
+            # without being buffered and decoded whole
+            async with self._http_client.stream("GET", url, headers=cond_headers) as response:
                 # Handle 304 Not Modified
                 if response.status_code == 304:
                     return FetchResult(
@@ -184,36 +330,59 @@ class Crawl4AIFetcher(BaseFetcher):
                         final_url=str(response.url),
                         etag=response.headers.get("etag"),
                         last_modified=response.headers.get("last-modified"),
-                        headers=dict(response.headers),
+                        headers=_kept_headers(response.headers),
                     )
 
-                # Handle redirects (final URL)
-                final_url = str(response.url)
-
-                # Get content
-                html = response.text
                 content_type = response.headers.get("content-type", "")
+                if content_type.lower().startswith(_BINARY_CONTENT_TYPES):
+                    return FetchResult(
+                        status=FetchStatus.ERROR,
+                        status_code=response.status_code,
+                        content_type=content_type,
+                        final_url=str(response.url),
+                        error=f"Unsupported content type: {content_type}",
+                    )
 
-                # Extract using Crawl4AI if available
+                body = await self._read_body(response)
+                if body is None:
+                    return FetchResult(
+                        status=FetchStatus.ERROR,
+                        status_code=response.status_code,
+                        content_type=content_type,
+                        final_url=str(response.url),
+                        error=f"Response body exceeds {self.max_body_bytes} bytes",
+                    )
+
+                # Handle redirects (final URL)
+                final_url = str(response.url)
+                # Decode once, then drop the bytes so they don't sit next to
+                # the str copy for the whole extraction
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+                del body
+
+            # Extract using Crawl4AI if available
+            if defer_spa_shells and _looks_like_spa_shell(html):
+                markdown, title, description, links = None, None, None, []
+            else:
                 markdown, title, description, links = await self._extract_content(
                     html, final_url
                 )
 
-                return FetchResult(
-                    status=FetchStatus.SUCCESS,
-                    status_code=response.status_code,
-                    html=html,
-                    markdown=markdown,
-                    content_type=content_type,
-                    content_length=len(html),
-                    final_url=final_url,
-                    etag=response.headers.get("etag"),
-                    last_modified=response.headers.get("last-modified"),
-                    headers=dict(response.headers),
-                    title=title,
-                    description=description,
-                    links=links,
-                )
+            return FetchResult(
+                status=FetchStatus.SUCCESS,
+                status_code=response.status_code,
+                html=html,
+                markdown=markdown,
+                content_type=content_type,
+                content_length=len(html),
+                final_url=final_url,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                headers=_kept_headers(response.headers),
+                title=title,
+                description=description,
+                links=links,
+            )
 
         except httpx.TimeoutException:
             return FetchResult(
@@ -226,6 +395,81 @@ class Crawl4AIFetcher(BaseFetcher):
                 error=str(e),
             )
 
+    async def _read_body(self, response: Any) -> bytearray | None:
+        """
+        Read a streamed response body, stopping at max_body_bytes.
+
+        Args:
+            response: Open httpx streaming response.
+
+        Returns:
+            The body bytes, or None if it is larger than max_body_bytes.
+        """
+        # Trust an advertised length to skip the download entirely
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            return None
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes(_READ_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > self.max_body_bytes:
+                return None
+
+        return body
+
+    async def _revalidate_with_head(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> FetchResult | None:
+        """
+        Check stored validators with a conditional HEAD request.
+
+        Some servers ignore conditional headers on GET but answer HEAD with
+        a 304 or with unchanged ETag/Last-Modified values.
+
+        Args:
+            url: URL to check.
+            etag: Stored ETag.
+            last_modified: Stored Last-Modified.
+
+        Returns:
+            A NOT_MODIFIED FetchResult if the page is unchanged, or None if a
+            full fetch is needed (changed, error, or HEAD unsupported).
+        """
+        cond_headers = self.revalidator.get_conditional_headers(etag, last_modified)
+
+        try:
+            response = await self._http_client.head(url, headers=cond_headers)
+        except Exception as e:
+            logger.debug("HEAD revalidation failed", url=url, error=str(e))
+            return None
+
+        check = self.revalidator.parse_response(response.status_code, response.headers)
+        unchanged = check.status == RevalidationStatus.NOT_MODIFIED
+
+        # A 2xx carrying the stored validators is unchanged too. Prefer the
+        # ETag when both sides have one; Last-Modified has one-second resolution.
+        if check.status == RevalidationStatus.MODIFIED:
+            if self.revalidator.use_etag and etag and check.etag:
+                unchanged = check.etag == etag
+            elif self.revalidator.use_last_modified and last_modified and check.last_modified:
+                unchanged = check.last_modified == last_modified
+
+        if not unchanged:
+            return None
+
+        return FetchResult(
+            status=FetchStatus.NOT_MODIFIED,
+            status_code=response.status_code,
+            final_url=str(response.url),
+            etag=check.etag or etag,
+            last_modified=check.last_modified or last_modified,
+            headers=_kept_headers(response.headers),
+        )
+
     def _build_crawler_config(self) -> Any:
         """Build CrawlerRunConfig from markdown configuration."""
         from crawl4ai import CrawlerRunConfig
@@ -302,8 +546,6 @@ class Crawl4AIFetcher(BaseFetcher):
 
     def _extract_markdown_from_result(self, result: Any) -> str:
         """Extract the appropriate markdown from Crawl4AI result."""
-        mc = self.markdown_config
-
         # Handle MarkdownGenerationResult object (Crawl4AI 0.5+)
         markdown_obj = result.markdown
         if markdown_obj is None:
@@ -313,17 +555,12 @@ class Crawl4AIFetcher(BaseFetcher):
         if isinstance(markdown_obj, str):
             return markdown_obj
 
-        # For MarkdownGenerationResult, choose the appropriate output
-        if mc.include_citations and hasattr(markdown_obj, "markdown_with_citations"):
-            md = markdown_obj.markdown_with_citations
+        # For MarkdownGenerationResult, choose the first enabled variant
+        for name in self._markdown_fields:
+            md = getattr(markdown_obj, name, None)
             if md:
                 return md
 
-        if mc.use_fit_markdown and hasattr(markdown_obj, "fit_markdown"):
-            fit_md = markdown_obj.fit_markdown
-            if fit_md:
-                return fit_md
-
         # Fall back to raw_markdown
         if hasattr(markdown_obj, "raw_markdown"):
             return markdown_obj.raw_markdown or ""
@@ -443,38 +680,64 @@ class Crawl4AIFetcher(BaseFetcher):
         self, html: str, url: str
     ) -> tuple[str, str | None, str | None, list[str]]:
         """Fallback HTML extraction without Crawl4AI."""
-        import re
+        if LexborHTMLParser is not None:
+            title, description, links, text = self._scan_with_lexbor(html)
+        else:
+            title, description, links, text = self._scan_with_regex(html)
+
+        # Filter and normalize links
+        origin = url_origin(url)
+        normalized_links = []
+        for link in links:
+            if link.startswith(("http://", "https://", "/")):
+                if link.startswith("/"):
+                    link = join_url(url, link, origin)
+                normalized_links.append(link)
+
+        markdown = _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+        return markdown, title, description, normalized_links
+
+    def _scan_with_lexbor(self, html: str) -> tuple[str | None, str | None, list[str], str]:
+        """
+        Parse once with Lexbor and read title, description, hrefs, and text.
+
+        Mirrors _scan_with_regex: only script and style are dropped, every
+        element's href is collected, and the text covers the whole document.
+        """
+        tree = LexborHTMLParser(html)
+        for node in tree.css("script,style"):
+            node.decompose()
+
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else None
 
+        desc_node = tree.css_first('meta[name="description" i]')
+        description = (desc_node.attributes.get("content") or "").strip() if desc_node else ""
+
+        links = [node.attributes.get("href") or "" for node in tree.css("[href]")]
+        text = tree.root.text(separator="\n") if tree.root else ""
+
+        return title or None, description or None, links, text
+
+    def _scan_with_regex(self, html: str) -> tuple[str | None, str | None, list[str], str]:
+        """Regex scan used when selectolax is not installed."""
         # Simple title extraction
-        title_match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+        title_match = _TITLE_RE.search(html)
         title = title_match.group(1).strip() if title_match else None
 
         # Simple description extraction
-        desc_match = re.search(
-            r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']',
-            html,
-            re.IGNORECASE,
-        )
+        desc_match = _DESC_RE.search(html)
         description = desc_match.group(1).strip() if desc_match else None
 
         # Simple link extraction
-        links = re.findall(r'href=["\']([^"\']+)["\']', html)
-        # Filter and normalize links
-        normalized_links = []
-        for link in links:
-            if link.startswith(("http://", "https://", "/")):
-                if link.startswith("/"):
-                    link = urljoin(url, link)
-                normalized_links.append(link)
+        links = _HREF_RE.findall(html)
 
         # Simple HTML to text (very basic)
-        text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", "\n", text)
-        text = re.sub(r"\n\s*\n", "\n\n", text)
-        markdown = text.strip()
+        text = _SCRIPT_STYLE_RE.sub("", html)
+        text = _TAG_RE.sub("\n", text)
 
-        return markdown, title, description, normalized_links
+        return title, description, links, text
 
     def _needs_browser_rendering(self, result: FetchResult) -> bool:
         """
@@ -485,39 +748,88 @@ class Crawl4AIFetcher(BaseFetcher):
         if not result.markdown:
             return True
 
-        # Check for common SPA indicators
-        html = result.html or ""
-        spa_indicators = [
-            "ng-app",
-            "data-reactroot",
-            "__NEXT_DATA__",
-            "window.__NUXT__",
-            "id=\"app\"",
-            "id=\"root\"",
-        ]
-
-        for indicator in spa_indicators:
-            if indicator in html and len(result.markdown) < 500:
-                return True
+        # Short output from a page carrying common SPA markers
+        if len(result.markdown) >= 500:
+            return False
 
-        return False
+        html = result.html or ""
+        return any(marker in html for marker in _SPA_INDICATORS)
 
     async def fetch_batch(
         self,
         urls: list[str],
         **kwargs: Any,
     ) -> list[FetchResult]:
-        """Fetch multiple URLs concurrently."""
-        tasks = [self.fetch(url, **kwargs) for url in urls]
-        return await asyncio.gather(*tasks)
+        """Fetch multiple URLs concurrently, at most max_concurrency at a time."""
+        results: list[FetchResult | None] = [None] * len(urls)
+        async for index, _, result in self._iter_batch(urls, **kwargs):
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    async def fetch_batch_iter(
+        self,
+        urls: Iterable[str],
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[str, FetchResult]]:
+        """
+        Fetch URLs concurrently, yielding each result as soon as it completes.
+
+        At most max_concurrency fetches are in flight and no finished result
+        is held back, so callers can write pages out as they arrive instead
+        of buffering a whole batch.
+
+        Args:
+            urls: URLs to fetch; consumed lazily.
+            **kwargs: Passed through to fetch().
+
+        Yields:
+            (url, result) tuples in completion order.
+        """
+        async for _, url, result in self._iter_batch(urls, **kwargs):
+            yield url, result
+
+    async def _iter_batch(
+        self,
+        urls: Iterable[str],
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[int, str, FetchResult]]:
+        """Run fetches in a sliding window, yielding (index, url, result)."""
+
+        async def fetch_one(index: int, url: str) -> tuple[int, str, FetchResult]:
+            # The semaphore also bounds batches running side by side
+            async with self._batch_semaphore:
+                return index, url, await self.fetch(url, **kwargs)
+
+        pending: set[asyncio.Task[tuple[int, str, FetchResult]]] = set()
+        try:
+            for index, url in enumerate(urls):
+                pending.add(asyncio.create_task(fetch_one(index, url)))
+                if len(pending) < self.max_concurrency:
+                    continue
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # The consumer stopped early; don't leave fetches running
+            for task in pending:
+                task.cancel()
 
     async def close(self) -> None:
-        """Close Crawl4AI resources."""
+        """Close the HTTP client and Crawl4AI resources."""
+        if self._http_client is not None:
+            with contextlib.suppress(Exception):
+                await self._http_client.aclose()
+            self._http_client = None
         if self._crawler is not None:
             with contextlib.suppress(Exception):
                 await self._crawler.aclose()
             self._crawler = None
-            self._initialized = False
+        self._initialized = False
 
     def health_check(self) -> bool:
         """Check if fetcher is ready."""
@@ -1,9 +1,23 @@
 """HTTP conditional request handling for incremental sync."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
 
 
+def _get_header(headers: Mapping[str, str], name: str) -> str | None:
+    """
+    Look up a header by lowercase name without copying the mapping.
+
+    Case-insensitive mappings (httpx.Headers) and lowercase dicts answer the
+    direct lookup; other dicts fall back to a scan over their keys.
+    """
+    value = headers.get(name)
+    if value is not None:
+        return value
+    return next((v for k, v in headers.items() if k.lower() == name), None)
+
+
 class RevalidationStatus(str, Enum):
     """Status of revalidation check."""
 
@@ -13,7 +27,7 @@ class RevalidationStatus(str, Enum):
     ERROR = "error"  # Error during check
 
 
-@dataclass
+@dataclass(slots=True)
 class RevalidationResult:
     """Result of a revalidation check."""
 
@@ -83,22 +97,22 @@ class Revalidator:
     def parse_response(
         self,
         status_code: int,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
     ) -> RevalidationResult:
         """
         Parse response to determine if content changed.
 
         Args:
             status_code: HTTP status code.
-            headers: Response headers.
+            headers: Response headers, either a plain dict or a
+                case-insensitive mapping such as httpx.Headers.
 
         Returns:
             RevalidationResult.
         """
         # Extract caching headers (case-insensitive)
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-        etag = headers_lower.get("etag")
-        last_modified = headers_lower.get("last-modified")
+        etag = _get_header(headers, "etag")
+        last_modified = _get_header(headers, "last-modified")
 
         if status_code == 304:
             return RevalidationResult(
@@ -1,7 +1,12 @@
 """Robots.txt parsing and checking."""
 
 import asyncio
-from urllib.parse import urljoin, urlparse
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlsplit
 
 import httpx
 from robotexclusionrulesparser import RobotExclusionRulesParser
@@ -9,8 +14,46 @@ from robotexclusionrulesparser import RobotExclusionRulesParser
 from ragcrawl.config.crawler_config import RobotsMode
 from ragcrawl.utils.logging import get_logger
 
+try:
+    from protego import Protego
+except ImportError:  # pragma: no cover - optional [fast] extra
+    Protego = None
+
 logger = get_logger(__name__)
 
+# Upper bound on memoized allow/deny decisions
+_DECISION_CACHE_SIZE = 50_000
+
+
+class _ProtegoParser:
+    """Protego rules behind the RobotExclusionRulesParser calls used here."""
+
+    __slots__ = ("_rules", "sitemaps")
+
+    def __init__(self, text: str) -> None:
+        self._rules = Protego.parse(text)
+        self.sitemaps = list(self._rules.sitemaps)
+
+    def is_allowed(self, user_agent: str, url: str) -> bool:
+        """Check whether user_agent may fetch url."""
+        return self._rules.can_fetch(url, user_agent)
+
+    def get_crawl_delay(self, user_agent: str) -> float | None:
+        """Return the Crawl-delay for user_agent, if any."""
+        return self._rules.crawl_delay(user_agent)
+
+
+_RobotsParser = RobotExclusionRulesParser | _ProtegoParser
+
+
+def _parse_robots(text: str) -> _RobotsParser:
+    """Parse robots.txt with Protego when installed, else the pure-Python parser."""
+    if Protego is not None:
+        return _ProtegoParser(text)
+    parser = RobotExclusionRulesParser()
+    parser.parse(text)
+    return parser
+
 
 class RobotsChecker:
     """
@@ -23,6 +66,8 @@ class RobotsChecker:
         user_agent: str = "ragcrawl",
         allowlist: list[str] | None = None,
         cache_ttl_seconds: int = 3600,
+        cache_path: str | Path | None = None,
+        max_cache_entries: int = 10_000,
     ) -> None:
         """
         Initialize robots checker.
@@ -32,15 +77,39 @@ class RobotsChecker:
             user_agent: User agent to check rules for.
             allowlist: Domains to bypass robots.txt (when mode=ALLOWLIST).
             cache_ttl_seconds: How long to cache robots.txt files.
+            cache_path: JSON file that keeps fetched robots.txt files across
+                runs, so a recurring crawl skips re-fetching them while fresh.
+            max_cache_entries: Most domains to keep parsed rules for; the
+                least recently used are evicted beyond this. Also caps the
+                cache_path file, which keeps the most recently fetched.
         """
         self.mode = mode
         self.user_agent = user_agent
         self.allowlist = set(d.lower() for d in (allowlist or []))
         self.cache_ttl_seconds = cache_ttl_seconds
-
-        # Cache: domain -> (parser, timestamp)
-        self._cache: dict[str, tuple[RobotExclusionRulesParser | None, float]] = {}
-        self._lock = asyncio.Lock()
+        self.max_cache_entries = max_cache_entries
+
+        # LRU cache: domain -> (parser, timestamp)
+        self._cache: OrderedDict[str, tuple[_RobotsParser | None, float]] = OrderedDict()
+        # One lock per domain: different hosts fetch concurrently, while
+        # concurrent lookups for the same host share a single fetch
+        self._locks: dict[str, asyncio.Lock] = {}
+        # LRU of (parser, path?query) -> allowed. Keying on the parser object
+        # means a refreshed robots.txt never reuses the old file's answers.
+        self._decisions: OrderedDict[tuple[_RobotsParser, str], bool] = (
+            OrderedDict()
+        )
+        self._client: httpx.AsyncClient | None = None
+
+        # Raw robots.txt bodies by domain for cache_path: (text, fetched_at),
+        # oldest fetch first. An empty text records a 404, i.e. no restrictions.
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._stored: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._stored_dirty = False
+        if self.cache_path is not None:
+            self._stored = self._load_stored(
+                self.cache_path, cache_ttl_seconds, max_cache_entries
+            )
 
     async def is_allowed(self, url: str) -> bool:
         """
@@ -55,54 +124,107 @@ class RobotsChecker:
         if self.mode == RobotsMode.OFF:
             return True
 
-        domain = self._get_domain(url)
+        # Split once; the domain, robots.txt URL, and decision key all come from it
+        parts = urlsplit(url)
+        domain = parts.netloc.lower()
 
         if self.mode == RobotsMode.ALLOWLIST:
             if domain in self.allowlist:
                 return True
 
-        if self.mode == RobotsMode.OFF:
-            return True
-
         # Get or fetch robots.txt
-        parser = await self._get_parser(url)
+        parser = await self._get_parser(domain, f"{parts.scheme}://{parts.netloc}/robots.txt")
 
         if parser is None:
             # If we can't fetch robots.txt, allow by default
             return True
 
-        return parser.is_allowed(self.user_agent, url)
+        key = (parser, f"{parts.path}?{parts.query}" if parts.query else parts.path)
+        allowed = self._decisions.get(key)
+        if allowed is not None:
+            self._decisions.move_to_end(key)
+            return allowed
+
+        allowed = parser.is_allowed(self.user_agent, url)
+        self._decisions[key] = allowed
+        if len(self._decisions) > _DECISION_CACHE_SIZE:
+            self._decisions.popitem(last=False)
+        return allowed
 
-    async def _get_parser(self, url: str) -> RobotExclusionRulesParser | None:
+    async def _get_parser(self, domain: str, robots_url: str) -> _RobotsParser | None:
         """
-        Get or fetch robots.txt parser for a URL's domain.
+        Get or fetch robots.txt parser for a domain.
 
         Args:
-            url: URL to get parser for.
+            domain: Lowercased netloc the rules apply to.
+            robots_url: URL of the domain's robots.txt file.
 
         Returns:
             Parser instance or None if unavailable.
         """
-        domain = self._get_domain(url)
-        robots_url = self._get_robots_url(url)
-
-        async with self._lock:
-            # Check cache
-            if domain in self._cache:
-                parser, timestamp = self._cache[domain]
-                import time
-
-                if time.time() - timestamp < self.cache_ttl_seconds:
+        # Fast path: fresh cache entry, no locking needed
+        entry = self._fresh_entry(domain)
+        if entry is not None:
+            return entry[0]
+
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            # Another task may have fetched it while we waited
+            entry = self._fresh_entry(domain)
+            if entry is not None:
+                return entry[0]
+
+            # A previous run's copy is parsed on first use only
+            stored = self._stored.get(domain)
+            if stored is not None:
+                if time.time() - stored[1] < self.cache_ttl_seconds:
+                    text, fetched_at = stored
+                    parser = _parse_robots(text) if text else None
+                    self._cache_parser(domain, parser, fetched_at)
                     return parser
-
-            # Fetch robots.txt
-            parser = await self._fetch_robots(robots_url)
-            import time
-
-            self._cache[domain] = (parser, time.time())
+                del self._stored[domain]
+                self._stored_dirty = True
+
+            parser, text = await self._fetch_robots(robots_url)
+            fetched_at = time.time()
+            self._cache_parser(domain, parser, fetched_at)
+            if text is not None and self.cache_path is not None:
+                self._store(domain, text, fetched_at)
             return parser
 
-    async def _fetch_robots(self, robots_url: str) -> RobotExclusionRulesParser | None:
+    def _store(self, domain: str, text: str, fetched_at: float) -> None:
+        """Record a fetched robots.txt for cache_path, dropping the oldest past the cap."""
+        self._stored.pop(domain, None)
+        self._stored[domain] = (text, fetched_at)
+        while len(self._stored) > self.max_cache_entries:
+            self._stored.popitem(last=False)
+        self._stored_dirty = True
+
+    def _fresh_entry(self, domain: str) -> tuple[_RobotsParser | None, float] | None:
+        """Return the cached (parser, timestamp) for a domain unless missing or expired."""
+        entry = self._cache.get(domain)
+        if entry is None:
+            return None
+        if time.time() - entry[1] >= self.cache_ttl_seconds:
+            # Drop stale rules now rather than keeping them until eviction
+            del self._cache[domain]
+            return None
+        self._cache.move_to_end(domain)
+        return entry
+
+    def _cache_parser(
+        self, domain: str, parser: _RobotsParser | None, fetched_at: float
+    ) -> None:
+        """Insert a domain's parser, evicting the least recently used domains."""
+        self._cache[domain] = (parser, fetched_at)
+        self._cache.move_to_end(domain)
+        while len(self._cache) > self.max_cache_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+
+    async def _fetch_robots(self, robots_url: str) -> tuple[_RobotsParser | None, str | None]:
         """
         Fetch and parse robots.txt.
 
@@ -110,38 +232,42 @@ class RobotsChecker:
             robots_url: URL of robots.txt file.
 
         Returns:
-            Parser instance or None if fetch failed.
+            Tuple of (parser, text). The parser is None when there are no
+            rules to apply; text is "" for a 404 and None when the fetch
+            failed (failures are not worth persisting).
         """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(keepalive_expiry=15.0),
+            )
+
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    robots_url,
-                    follow_redirects=True,
-                    headers={"User-Agent": self.user_agent},
+            response = await self._client.get(robots_url)
+
+            if response.status_code == 200:
+                parser = _parse_robots(response.text)
+                logger.debug("Fetched robots.txt", url=robots_url)
+                return parser, response.text
+
+            elif response.status_code == 404:
+                # No robots.txt means everything is allowed
+                logger.debug("No robots.txt found", url=robots_url)
+                return None, ""
+
+            else:
+                logger.warning(
+                    "Failed to fetch robots.txt",
+                    url=robots_url,
+                    status=response.status_code,
                 )
-
-                if response.status_code == 200:
-                    parser = RobotExclusionRulesParser()
-                    parser.parse(response.text)
-                    logger.debug("Fetched robots.txt", url=robots_url)
-                    return parser
-
-                elif response.status_code == 404:
-                    # No robots.txt means everything is allowed
-                    logger.debug("No robots.txt found", url=robots_url)
-                    return None
-
-                else:
-                    logger.warning(
-                        "Failed to fetch robots.txt",
-                        url=robots_url,
-                        status=response.status_code,
-                    )
-                    return None
+                return None, None
 
         except Exception as e:
             logger.warning("Error fetching robots.txt", url=robots_url, error=str(e))
-            return None
+            return None, None
 
     def get_crawl_delay(self, url: str) -> float | None:
         """
@@ -185,14 +311,68 @@ class RobotsChecker:
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
-
-    def _get_robots_url(self, url: str) -> str:
-        """Get robots.txt URL for a given URL."""
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        return urlsplit(url).netloc.lower()
 
     def clear_cache(self) -> None:
-        """Clear the robots.txt cache."""
+        """Clear the robots.txt cache, including the cache_path file."""
         self._cache.clear()
+        self._decisions.clear()
+        self._stored.clear()
+        self._stored_dirty = False
+        if self.cache_path is not None:
+            self.cache_path.unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Save the persistent cache and close the HTTP client."""
+        if self._stored_dirty and self.cache_path is not None:
+            try:
+                await asyncio.to_thread(self._save_stored, self.cache_path, dict(self._stored))
+                self._stored_dirty = False
+            except OSError as e:
+                logger.warning(
+                    "Failed to save robots.txt cache", path=str(self.cache_path), error=str(e)
+                )
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _load_stored(
+        path: Path, ttl_seconds: float, max_entries: int
+    ) -> OrderedDict[str, tuple[str, float]]:
+        """
+        Read persisted robots.txt bodies, ignoring a missing or corrupt file.
+
+        Entries older than ttl_seconds are dropped, and only the max_entries
+        most recently fetched are kept, so the file cannot grow without bound.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries = [
+                (domain, (entry["text"], float(entry["fetched_at"])))
+                for domain, entry in data.items()
+            ]
+        except FileNotFoundError:
+            return OrderedDict()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable robots.txt cache", path=str(path), error=str(e))
+            return OrderedDict()
+
+        cutoff = time.time() - ttl_seconds
+        fresh = sorted(
+            (item for item in entries if item[1][1] > cutoff), key=lambda item: item[1][1]
+        )
+        return OrderedDict(fresh[-max_entries:] if max_entries > 0 else [])
+
+    @staticmethod
+    def _save_stored(path: Path, stored: dict[str, tuple[str, float]]) -> None:
+        """Write robots.txt bodies atomically via a temporary file."""
+        data = {
+            domain: {"text": text, "fetched_at": fetched_at}
+            for domain, (text, fetched_at) in stored.items()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -4,8 +4,6 @@ from dataclasses import dataclass
 from enum import Enum
 from urllib.parse import urlparse
 
-import tldextract
-
 from ragcrawl.filters.patterns import ExtensionFilter, PatternMatcher
 from ragcrawl.filters.url_normalizer import URLNormalizer
 
@@ -54,6 +52,7 @@ class LinkFilter:
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         blocked_query_params: list[str] | None = None,
+        pattern_engine: str = "re",
     ) -> None:
         """
         Initialize the link filter.
@@ -67,6 +66,8 @@ class LinkFilter:
             include_patterns: Regex/glob patterns for URLs to include.
             exclude_patterns: Regex/glob patterns for URLs to exclude.
             blocked_query_params: Query parameters to strip.
+            pattern_engine: Regex engine for include/exclude patterns,
+                "re" or "re2".
         """
         self.allowed_domains = set(d.lower() for d in (allowed_domains or []))
         self.allow_subdomains = allow_subdomains
@@ -74,10 +75,16 @@ class LinkFilter:
         self.allowed_path_prefixes = list(allowed_path_prefixes or [])
 
         self.normalizer = URLNormalizer(remove_query_params=blocked_query_params)
-        self.pattern_matcher = PatternMatcher(include_patterns, exclude_patterns)
+        self.pattern_matcher = PatternMatcher(
+            include_patterns, exclude_patterns, engine=pattern_engine
+        )
         self.extension_filter = ExtensionFilter(blocked_extensions)
 
-        # Track seen URLs for deduplication
+        # Without patterns every URL passes; skip the matcher calls entirely
+        self._check_patterns = bool(include_patterns or exclude_patterns)
+
+        # Track seen URLs for deduplication. Exact strings rather than
+        # digests: a collision would permanently reject an unseen URL.
         self._seen_urls: set[str] = set()
 
     def filter(
@@ -125,7 +132,7 @@ class LinkFilter:
             )
 
         # Normalize URL
-        normalized = self.normalizer.normalize(url)
+        normalized = self.normalizer.normalize_parsed(parsed)
 
         # Deduplication check
         if check_seen and normalized in self._seen_urls:
@@ -171,7 +178,7 @@ class LinkFilter:
                 )
 
         # Extension check
-        if self.extension_filter.is_blocked(url):
+        if self.extension_filter.is_blocked_path(parsed.path):
             ext = self.extension_filter.get_extension(url)
             return FilterResult(
                 allowed=False,
@@ -181,7 +188,7 @@ class LinkFilter:
             )
 
         # Pattern check
-        if not self.pattern_matcher.should_include(url):
+        if self._check_patterns and not self.pattern_matcher.should_include(url):
             reason = self.pattern_matcher.get_match_reason(url)
             if self.pattern_matcher.matches_exclude(url):
                 return FilterResult(
@@ -219,17 +226,14 @@ class LinkFilter:
         if hostname in self.allowed_domains:
             return True
 
-        # Subdomain match
+        # Subdomain match: look up each parent domain in turn
+        # (a.b.example.com -> b.example.com -> example.com -> com), so the
+        # cost depends on the hostname's depth, not on allowed_domains.
         if self.allow_subdomains:
-            extracted = tldextract.extract(hostname)
-            registered_domain = f"{extracted.domain}.{extracted.suffix}".lower()
-
-            if registered_domain in self.allowed_domains:
-                return True
-
-            # Check if any allowed domain is a parent of this hostname
-            for allowed in self.allowed_domains:
-                if hostname.endswith(f".{allowed}"):
+            parent = hostname
+            while "." in parent:
+                parent = parent.partition(".")[2]
+                if parent in self.allowed_domains:
                     return True
 
         return False
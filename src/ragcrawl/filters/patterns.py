@@ -2,7 +2,59 @@
 
 import fnmatch
 import re
-from typing import Pattern
+from typing import Any, Pattern
+from urllib.parse import urlparse
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional [fast] extra
+    re2 = None
+
+REGEX_ENGINES = ("re", "re2")
+
+# Numbered or named backreferences break when patterns are renumbered
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Leading global flags such as "(?s)" are only legal at the start of a regex
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scope_flags(pattern: str) -> str:
+    """Turn leading global inline flags into a scoped group: (?s)x -> (?s:x)."""
+    match = _GLOBAL_FLAGS_RE.match(pattern)
+    if match is None:
+        return pattern
+    return f"(?{match.group(1)}:{pattern[match.end():]})"
+
+
+def _compile_re2(sources: list[str], case_sensitive: bool) -> Any | None:
+    """
+    Compile regex sources into one RE2 alternation.
+
+    Args:
+        sources: Python regex sources, as compiled by PatternMatcher.
+        case_sensitive: Whether matching is case-sensitive.
+
+    Returns:
+        The RE2 pattern, or None if RE2 cannot express one of the sources
+        (lookarounds, for example).
+    """
+    parts = []
+    for source in sources:
+        source = _scope_flags(source)
+        # fnmatch.translate() anchors with \Z, which RE2 spells \z
+        if source.endswith("\\Z") and not source.endswith("\\\\Z"):
+            source = source[:-2] + "\\z"
+        parts.append(f"(?:{source})")
+
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    options.never_capture = True
+    options.log_errors = False
+    try:
+        return re2.compile("|".join(parts), options)
+    except re2.error:
+        return None
 
 
 class PatternMatcher:
@@ -17,6 +69,7 @@ class PatternMatcher:
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         case_sensitive: bool = False,
+        engine: str = "re",
     ) -> None:
         """
         Initialize the pattern matcher.
@@ -25,11 +78,26 @@ class PatternMatcher:
             include_patterns: Patterns for URLs to include (regex or glob).
             exclude_patterns: Patterns for URLs to exclude (regex or glob).
             case_sensitive: Whether pattern matching is case-sensitive.
+            engine: "re", or "re2" to run the combined include/exclude checks
+                on Google's linear-time RE2 engine (falls back to re when
+                google-re2 is not installed or cannot express a pattern).
+                get_match_reason() always uses the per-pattern re path.
+
+        Raises:
+            ValueError: If engine is not one of REGEX_ENGINES.
         """
+        if engine not in REGEX_ENGINES:
+            raise ValueError(f"Unknown regex engine: {engine!r}")
+
         self.case_sensitive = case_sensitive
+        self.engine = engine
         self._include_patterns = self._compile_patterns(include_patterns or [])
         self._exclude_patterns = self._compile_patterns(exclude_patterns or [])
 
+        # One alternation per side so each check is a single regex scan
+        self._include_re = self._combine_patterns(self._include_patterns)
+        self._exclude_re = self._combine_patterns(self._exclude_patterns)
+
     def _compile_patterns(self, patterns: list[str]) -> list[Pattern[str]]:
         """
         Compile patterns to regex.
@@ -59,6 +127,39 @@ class PatternMatcher:
 
         return compiled
 
+    def _combine_patterns(self, patterns: list[Pattern[str]]) -> Any | None:
+        """
+        Combine compiled patterns into a single alternation.
+
+        Args:
+            patterns: Compiled patterns sharing this matcher's flags.
+
+        Returns:
+            The combined pattern (re or RE2, both exposing search()), or None
+            if the patterns cannot be safely combined (the caller then checks
+            them one by one).
+        """
+        if not patterns:
+            return None
+        if any(_BACKREF_RE.search(p.pattern) for p in patterns):
+            return patterns[0] if len(patterns) == 1 else None
+
+        if self.engine == "re2" and re2 is not None:
+            combined = _compile_re2([p.pattern for p in patterns], self.case_sensitive)
+            if combined is not None:
+                return combined
+
+        if len(patterns) == 1:
+            return patterns[0]
+
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        try:
+            return re.compile(
+                "|".join(f"(?:{_scope_flags(p.pattern)})" for p in patterns), flags
+            )
+        except re.error:
+            return None
+
     def _is_glob_pattern(self, pattern: str) -> bool:
         """
         Determine if a pattern is glob-style.
@@ -97,6 +198,9 @@ class PatternMatcher:
         if not self._include_patterns:
             return True
 
+        if self._include_re is not None:
+            return self._include_re.search(url) is not None
+
         return any(p.search(url) for p in self._include_patterns)
 
     def matches_exclude(self, url: str) -> bool:
@@ -112,6 +216,9 @@ class PatternMatcher:
         if not self._exclude_patterns:
             return False
 
+        if self._exclude_re is not None:
+            return self._exclude_re.search(url) is not None
+
         return any(p.search(url) for p in self._exclude_patterns)
 
     def should_include(self, url: str) -> bool:
@@ -170,6 +277,8 @@ class ExtensionFilter:
             ext.lower() if ext.startswith(".") else f".{ext.lower()}"
             for ext in (blocked_extensions or [])
         )
+        # str.endswith takes a tuple and checks every suffix in one call
+        self._blocked_suffixes = tuple(self.blocked_extensions)
 
     def is_blocked(self, url: str) -> bool:
         """
@@ -184,20 +293,24 @@ class ExtensionFilter:
         if not self.blocked_extensions:
             return False
 
-        # Extract path from URL
-        from urllib.parse import urlparse
-
         try:
-            path = urlparse(url).path.lower()
+            path = urlparse(url).path
         except Exception:
             return False
 
-        # Check extension
-        for ext in self.blocked_extensions:
-            if path.endswith(ext):
-                return True
+        return self.is_blocked_path(path)
 
-        return False
+    def is_blocked_path(self, path: str) -> bool:
+        """
+        Check if an already-parsed URL path has a blocked extension.
+
+        Args:
+            path: The path component of the URL.
+
+        Returns:
+            True if the path has a blocked extension.
+        """
+        return path.lower().endswith(self._blocked_suffixes)
 
     def get_extension(self, url: str) -> str | None:
         """
@@ -209,8 +322,6 @@ class ExtensionFilter:
         Returns:
             The extension (e.g., '.html') or None.
         """
-        from urllib.parse import urlparse
-
         try:
             path = urlparse(url).path
             if "." in path:
@@ -1,11 +1,45 @@
 """URL normalization for deterministic deduplication."""
 
 import re
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from functools import lru_cache
+from urllib.parse import ParseResult, parse_qs, urlencode, urlparse, urlsplit, urlunparse
 
 import tldextract
 from yarl import URL
 
+# Public Suffix List lookups use the snapshot bundled with tldextract, so no
+# call ever reaches for the network or the on-disk suffix cache.
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+
+# A query whose pairs are made only of characters urlencode() leaves as-is
+# (one "=" at most per pair) survives a parse_qs/urlencode round trip
+# unchanged, so it can be filtered and sorted without decoding.
+_PLAIN_PAIR = r"[A-Za-z0-9_.~-]*(?:=[A-Za-z0-9_.~-]*)?"
+_PLAIN_QUERY_RE = re.compile(rf"{_PLAIN_PAIR}(?:&{_PLAIN_PAIR})*")
+
+
+@lru_cache(maxsize=1 << 16)
+def registered_domain(host: str) -> str:
+    """
+    Get the registered domain (eTLD+1) of a hostname.
+
+    Results are memoized: a crawl looks up the same few hosts for every
+    link it filters.
+
+    Args:
+        host: Hostname or netloc (port and credentials are ignored).
+
+    Returns:
+        The registered domain (e.g., 'example.com' for 'sub.example.com'),
+        or the bare domain when the host has no public suffix.
+    """
+    extracted = _TLD_EXTRACT(host)
+    if extracted.domain and extracted.suffix:
+        return f"{extracted.domain}.{extracted.suffix}"
+    return extracted.domain or ""
+
 
 class URLNormalizer:
     """
@@ -62,6 +96,7 @@ class URLNormalizer:
             "ref",
             "source",
         }
+        self._drop_params = self.remove_query_params | self.default_tracking_params
 
     def normalize(self, url: str) -> str:
         """
@@ -78,6 +113,18 @@ class URLNormalizer:
         except Exception:
             return url
 
+        return self.normalize_parsed(parsed)
+
+    def normalize_parsed(self, parsed: ParseResult) -> str:
+        """
+        Normalize a URL that the caller has already parsed.
+
+        Args:
+            parsed: Result of urllib.parse.urlparse() on the URL.
+
+        Returns:
+            The normalized URL string.
+        """
         # Scheme normalization (lowercase)
         scheme = parsed.scheme.lower()
 
@@ -101,7 +148,8 @@ class URLNormalizer:
         path = parsed.path
 
         # Remove duplicate slashes
-        path = re.sub(r"/+", "/", path)
+        if "//" in path:
+            path = _MULTI_SLASH_RE.sub("/", path)
 
         # Normalize path encoding
         # Decode safe characters that don't need encoding
@@ -127,12 +175,19 @@ class URLNormalizer:
 
         # Query parameter normalization
         query = parsed.query
-        if query:
+        if query and self.sort_query_params and _PLAIN_QUERY_RE.fullmatch(query):
+            # Fast path: filter and sort the raw pairs
+            pairs = sorted(
+                (key, value)
+                for key, _, value in (part.partition("=") for part in query.split("&") if part)
+                if key not in self._drop_params
+            )
+            query = "&".join(f"{key}={value}" for key, value in pairs)
+        elif query:
             params = parse_qs(query, keep_blank_values=True)
 
             # Remove tracking and specified params
-            params_to_remove = self.remove_query_params | self.default_tracking_params
-            params = {k: v for k, v in params.items() if k not in params_to_remove}
+            params = {k: v for k, v in params.items() if k not in self._drop_params}
 
             # Sort and rebuild query string
             if self.sort_query_params:
@@ -151,8 +206,16 @@ class URLNormalizer:
         # Fragment handling
         fragment = "" if self.remove_fragments else parsed.fragment
 
-        # Rebuild URL
-        normalized = urlunparse((scheme, hostname, path, "", query, fragment))
+        # Rebuild URL. For http(s), with the path always starting with "/",
+        # urlunparse reduces to plain concatenation; skip its argument coercion.
+        if scheme not in ("http", "https"):
+            return urlunparse((scheme, hostname, path, "", query, fragment))
+
+        normalized = f"{scheme}://{hostname}{path}"
+        if query:
+            normalized += f"?{query}"
+        if fragment:
+            normalized += f"#{fragment}"
 
         return normalized
 
@@ -189,10 +252,8 @@ class URLNormalizer:
             The registered domain (e.g., 'example.com' for 'sub.example.com').
         """
         try:
-            extracted = tldextract.extract(url)
-            if extracted.domain and extracted.suffix:
-                return f"{extracted.domain}.{extracted.suffix}"
-            return extracted.domain or ""
+            # Key the cache on the netloc; scheme-less input is passed whole
+            return registered_domain(urlsplit(url).netloc or url)
         except Exception:
             return ""
 
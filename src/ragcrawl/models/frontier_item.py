@@ -54,10 +54,10 @@ class FrontierItem(BaseModel):
 
     model_config = {"frozen": False}
 
-    def mark_in_progress(self) -> None:
+    def mark_in_progress(self, started_at: datetime | None = None) -> None:
         """Mark item as being crawled."""
         self.status = FrontierStatus.IN_PROGRESS
-        self.started_at = datetime.now()
+        self.started_at = started_at or datetime.now()
 
     def mark_completed(self) -> None:
         """Mark item as successfully crawled."""
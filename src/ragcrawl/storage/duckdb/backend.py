@@ -16,6 +16,47 @@ from ragcrawl.models.site import Site
 from ragcrawl.storage.backend import StorageBackend
 from ragcrawl.storage.duckdb.schema import get_all_schemas
 
+# Use INSERT ... ON CONFLICT instead of INSERT OR REPLACE
+# due to a DuckDB bug with boolean columns and INSERT OR REPLACE
+_SAVE_PAGE_SQL = """
+    INSERT INTO pages (
+        page_id, site_id, url, canonical_url, current_version_id,
+        content_hash, etag, last_modified, first_seen, last_seen,
+        last_crawled, last_changed, depth, referrer_url, status_code,
+        is_tombstone, error_count, last_error, version_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (page_id) DO UPDATE SET
+        site_id = excluded.site_id,
+        url = excluded.url,
+        canonical_url = excluded.canonical_url,
+        current_version_id = excluded.current_version_id,
+        content_hash = excluded.content_hash,
+        etag = excluded.etag,
+        last_modified = excluded.last_modified,
+        first_seen = excluded.first_seen,
+        last_seen = excluded.last_seen,
+        last_crawled = excluded.last_crawled,
+        last_changed = excluded.last_changed,
+        depth = excluded.depth,
+        referrer_url = excluded.referrer_url,
+        status_code = excluded.status_code,
+        is_tombstone = excluded.is_tombstone,
+        error_count = excluded.error_count,
+        last_error = excluded.last_error,
+        version_count = excluded.version_count
+"""
+
+_SAVE_VERSION_SQL = """
+    INSERT OR REPLACE INTO page_versions (
+        version_id, page_id, site_id, run_id, markdown, html, plain_text,
+        content_hash, raw_hash, url, canonical_url, title, description,
+        content_type, status_code, language, headings_outline, word_count,
+        char_count, outlinks, internal_link_count, external_link_count,
+        etag, last_modified, crawled_at, created_at, fetch_latency_ms,
+        extraction_latency_ms, is_tombstone, extra
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class DuckDBBackend(StorageBackend):
     """
@@ -249,58 +290,32 @@ class DuckDBBackend(StorageBackend):
 
     def save_page(self, page: Page) -> None:
         """Save or update a page."""
-        # Use INSERT ... ON CONFLICT instead of INSERT OR REPLACE
-        # due to a DuckDB bug with boolean columns and INSERT OR REPLACE
-        self.conn.execute(
-            """
-            INSERT INTO pages (
-                page_id, site_id, url, canonical_url, current_version_id,
-                content_hash, etag, last_modified, first_seen, last_seen,
-                last_crawled, last_changed, depth, referrer_url, status_code,
-                is_tombstone, error_count, last_error, version_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (page_id) DO UPDATE SET
-                site_id = excluded.site_id,
-                url = excluded.url,
-                canonical_url = excluded.canonical_url,
-                current_version_id = excluded.current_version_id,
-                content_hash = excluded.content_hash,
-                etag = excluded.etag,
-                last_modified = excluded.last_modified,
-                first_seen = excluded.first_seen,
-                last_seen = excluded.last_seen,
-                last_crawled = excluded.last_crawled,
-                last_changed = excluded.last_changed,
-                depth = excluded.depth,
-                referrer_url = excluded.referrer_url,
-                status_code = excluded.status_code,
-                is_tombstone = excluded.is_tombstone,
-                error_count = excluded.error_count,
-                last_error = excluded.last_error,
-                version_count = excluded.version_count
-            """,
-            [
-                page.page_id,
-                page.site_id,
-                page.url,
-                page.canonical_url,
-                page.current_version_id,
-                page.content_hash,
-                page.etag,
-                page.last_modified,
-                page.first_seen,
-                page.last_seen,
-                page.last_crawled,
-                page.last_changed,
-                page.depth,
-                page.referrer_url,
-                page.status_code,
-                page.is_tombstone,
-                page.error_count,
-                page.last_error,
-                page.version_count,
-            ],
-        )
+        self.conn.execute(_SAVE_PAGE_SQL, self._page_params(page))
+
+    @staticmethod
+    def _page_params(page: Page) -> list[Any]:
+        """Build save_page query parameters."""
+        return [
+            page.page_id,
+            page.site_id,
+            page.url,
+            page.canonical_url,
+            page.current_version_id,
+            page.content_hash,
+            page.etag,
+            page.last_modified,
+            page.first_seen,
+            page.last_seen,
+            page.last_crawled,
+            page.last_changed,
+            page.depth,
+            page.referrer_url,
+            page.status_code,
+            page.is_tombstone,
+            page.error_count,
+            page.last_error,
+            page.version_count,
+        ]
 
     def get_page(self, page_id: str) -> Page | None:
         """Get a page by ID."""
@@ -412,50 +427,43 @@ class DuckDBBackend(StorageBackend):
 
     def save_version(self, version: PageVersion) -> None:
         """Save a page version."""
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO page_versions (
-                version_id, page_id, site_id, run_id, markdown, html, plain_text,
-                content_hash, raw_hash, url, canonical_url, title, description,
-                content_type, status_code, language, headings_outline, word_count,
-                char_count, outlinks, internal_link_count, external_link_count,
-                etag, last_modified, crawled_at, created_at, fetch_latency_ms,
-                extraction_latency_ms, is_tombstone, extra
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                version.version_id,
-                version.page_id,
-                version.site_id,
-                version.run_id,
-                version.markdown,
-                version.html,
-                version.plain_text,
-                version.content_hash,
-                version.raw_hash,
-                version.url,
-                version.canonical_url,
-                version.title,
-                version.description,
-                version.content_type,
-                version.status_code,
-                version.language,
-                json.dumps(version.headings_outline),
-                version.word_count,
-                version.char_count,
-                json.dumps(version.outlinks),
-                version.internal_link_count,
-                version.external_link_count,
-                version.etag,
-                version.last_modified,
-                version.crawled_at,
-                version.created_at,
-                version.fetch_latency_ms,
-                version.extraction_latency_ms,
-                version.is_tombstone,
-                json.dumps(version.extra),
-            ],
-        )
+        self.conn.execute(_SAVE_VERSION_SQL, self._version_params(version))
+
+    @staticmethod
+    def _version_params(version: PageVersion) -> list[Any]:
+        """Build save_version query parameters."""
+        return [
+            version.version_id,
+            version.page_id,
+            version.site_id,
+            version.run_id,
+            version.markdown,
+            version.html,
+            version.plain_text,
+            version.content_hash,
+            version.raw_hash,
+            version.url,
+            version.canonical_url,
+            version.title,
+            version.description,
+            version.content_type,
+            version.status_code,
+            version.language,
+            json.dumps(version.headings_outline),
+            version.word_count,
+            version.char_count,
+            json.dumps(version.outlinks),
+            version.internal_link_count,
+            version.external_link_count,
+            version.etag,
+            version.last_modified,
+            version.crawled_at,
+            version.created_at,
+            version.fetch_latency_ms,
+            version.extraction_latency_ms,
+            version.is_tombstone,
+            json.dumps(version.extra),
+        ]
 
     def get_version(self, version_id: str) -> PageVersion | None:
         """Get a page version by ID."""
@@ -648,17 +656,28 @@ class DuckDBBackend(StorageBackend):
     # === Bulk operations ===
 
     def save_pages_bulk(self, pages: list[Page]) -> int:
-        """Bulk save pages."""
-        for page in pages:
-            self.save_page(page)
+        """Bulk save pages in a single transaction."""
+        self._executemany(_SAVE_PAGE_SQL, [self._page_params(p) for p in pages])
         return len(pages)
 
     def save_versions_bulk(self, versions: list[PageVersion]) -> int:
-        """Bulk save versions."""
-        for version in versions:
-            self.save_version(version)
+        """Bulk save versions in a single transaction."""
+        self._executemany(_SAVE_VERSION_SQL, [self._version_params(v) for v in versions])
         return len(versions)
 
+    def _executemany(self, sql: str, params: list[list[Any]]) -> None:
+        """Run a statement for each parameter list inside one transaction."""
+        if not params:
+            return
+
+        self.conn.begin()
+        try:
+            self.conn.executemany(sql, params)
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
     @staticmethod
     def _json_serializer(obj: Any) -> Any:
         """JSON serializer for objects not serializable by default."""
@@ -233,7 +233,11 @@ class DynamoDBBackend(StorageBackend):
 
     def save_page(self, page: Page) -> None:
         """Save or update a page."""
-        model = PageModel(
+        self._page_to_model(page).save()
+
+    def _page_to_model(self, page: Page) -> PageModel:
+        """Convert Page to DynamoDB model."""
+        return PageModel(
             page_id=page.page_id,
             site_id=page.site_id,
             url=page.url,
@@ -254,7 +258,6 @@ class DynamoDBBackend(StorageBackend):
             last_error=page.last_error,
             version_count=page.version_count,
         )
-        model.save()
 
     def get_page(self, page_id: str) -> Page | None:
         """Get a page by ID."""
@@ -339,7 +342,11 @@ class DynamoDBBackend(StorageBackend):
 
     def save_version(self, version: PageVersion) -> None:
         """Save a page version."""
-        model = PageVersionModel(
+        self._version_to_model(version).save()
+
+    def _version_to_model(self, version: PageVersion) -> PageVersionModel:
+        """Convert PageVersion to DynamoDB model."""
+        return PageVersionModel(
             version_id=version.version_id,
             page_id=version.page_id,
             site_id=version.site_id,
@@ -371,7 +378,6 @@ class DynamoDBBackend(StorageBackend):
             is_tombstone=version.is_tombstone,
             extra=version.extra,
         )
-        model.save()
 
     def get_version(self, version_id: str) -> PageVersion | None:
         """Get a page version by ID."""
@@ -534,23 +540,12 @@ class DynamoDBBackend(StorageBackend):
         """Bulk save pages."""
         with PageModel.batch_write() as batch:
             for page in pages:
-                model = PageModel(
-                    page_id=page.page_id,
-                    site_id=page.site_id,
-                    url=page.url,
-                    # ... other fields
-                )
-                batch.save(model)
+                batch.save(self._page_to_model(page))
         return len(pages)
 
     def save_versions_bulk(self, versions: list[PageVersion]) -> int:
         """Bulk save versions."""
         with PageVersionModel.batch_write() as batch:
             for version in versions:
-                model = PageVersionModel(
-                    version_id=version.version_id,
-                    page_id=version.page_id,
-                    # ... other fields
-                )
-                batch.save(model)
+                batch.save(self._version_to_model(version))
         return len(versions)
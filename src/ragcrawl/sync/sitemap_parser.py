@@ -1,6 +1,8 @@
 """Sitemap parsing for change prioritization."""
 
+import asyncio
 import xml.etree.ElementTree as ET
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -40,6 +42,7 @@ class SitemapParser:
         self,
         user_agent: str = "ragcrawl/0.1",
         timeout: int = 30,
+        max_concurrency: int = 4,
     ) -> None:
         """
         Initialize sitemap parser.
@@ -47,9 +50,11 @@ class SitemapParser:
         Args:
             user_agent: User agent for fetching sitemaps.
             timeout: Request timeout in seconds.
+            max_concurrency: Most sub-sitemaps of an index fetched at once.
         """
         self.user_agent = user_agent
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
 
     async def parse(self, sitemap_url: str) -> list[SitemapEntry]:
         """
@@ -64,15 +69,17 @@ class SitemapParser:
             List of sitemap entries.
         """
         try:
-            content = await self._fetch(sitemap_url)
-            if not content:
-                return []
+            # One client for the sitemap and any sub-sitemaps it lists
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                content = await self._fetch(sitemap_url, client)
+                if not content:
+                    return []
 
-            # Check if it's a sitemap index
-            if "<sitemapindex" in content:
-                return await self._parse_sitemap_index(content, sitemap_url)
-            else:
-                return self._parse_sitemap(content)
+                # Check if it's a sitemap index
+                if "<sitemapindex" in content:
+                    return await self._parse_sitemap_index(content, sitemap_url, client)
+                else:
+                    return self._parse_sitemap(content)
 
         except Exception as e:
             logger.error("Failed to parse sitemap", url=sitemap_url, error=str(e))
@@ -116,20 +123,23 @@ class SitemapParser:
 
         return sitemaps
 
-    async def _fetch(self, url: str) -> str | None:
-        """Fetch URL content."""
+    async def _fetch(self, url: str, client: httpx.AsyncClient | None = None) -> str | None:
+        """Fetch URL content, with a one-off client unless one is given."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": self.user_agent},
-                    follow_redirects=True,
-                )
+            if client is None:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    return await self._fetch(url, client)
 
-                if response.status_code == 200:
-                    return response.text
+            response = await client.get(
+                url,
+                headers={"User-Agent": self.user_agent},
+                follow_redirects=True,
+            )
 
-                return None
+            if response.status_code == 200:
+                return response.text
+
+            return None
 
         except Exception as e:
             logger.debug("Failed to fetch", url=url, error=str(e))
@@ -174,7 +184,7 @@ class SitemapParser:
         return entries
 
     async def _parse_sitemap_index(
-        self, content: str, base_url: str
+        self, content: str, base_url: str, client: httpx.AsyncClient
     ) -> list[SitemapEntry]:
         """Parse a sitemap index and fetch all referenced sitemaps."""
         all_entries = []
@@ -196,12 +206,24 @@ class SitemapParser:
                     if loc_elem is not None and loc_elem.text:
                         sitemap_urls.append(loc_elem.text.strip())
 
-            # Fetch each sitemap
-            for sitemap_url in sitemap_urls:
-                content = await self._fetch(sitemap_url)
-                if content:
-                    entries = self._parse_sitemap(content)
-                    all_entries.extend(entries)
+            # An index may list tens of thousands of sitemaps on one host, so
+            # a few workers fetch them and parse each body as it arrives;
+            # results are kept in index order
+            results: list[list[SitemapEntry]] = [[] for _ in sitemap_urls]
+            pending = deque(enumerate(sitemap_urls))
+
+            async def worker() -> None:
+                while pending:
+                    index, sitemap_url = pending.popleft()
+                    body = await self._fetch(sitemap_url, client)
+                    if body:
+                        results[index] = self._parse_sitemap(body)
+
+            await asyncio.gather(
+                *(worker() for _ in range(min(self.max_concurrency, len(pending))))
+            )
+            for entries in results:
+                all_entries.extend(entries)
 
         except ET.ParseError as e:
             logger.warning("XML parse error in sitemap index", error=str(e))
@@ -8,14 +8,19 @@ from ragcrawl.utils.hashing import (
 )
 from ragcrawl.utils.logging import get_logger, setup_logging
 from ragcrawl.utils.metrics import CrawlMetrics, MetricsCollector
+from ragcrawl.utils.text import count_words
+from ragcrawl.utils.urls import join_url, url_origin
 
 __all__ = [
     "compute_doc_id",
     "compute_content_hash",
+    "count_words",
     "generate_run_id",
     "generate_version_id",
     "get_logger",
+    "join_url",
     "setup_logging",
+    "url_origin",
     "CrawlMetrics",
     "MetricsCollector",
 ]
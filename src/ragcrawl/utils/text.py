@@ -0,0 +1,32 @@
+"""Text measurement helpers."""
+
+# Characters split per step, bounding the word list built while counting
+_WORD_COUNT_CHUNK_CHARS = 1 << 16
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words.
+
+    Equivalent to ``len(text.split())``, but large texts are split one
+    chunk at a time so only a chunk's worth of words is ever materialized.
+
+    Args:
+        text: Text to count.
+
+    Returns:
+        Number of words.
+    """
+    if len(text) <= _WORD_COUNT_CHUNK_CHARS:
+        return len(text.split())
+
+    count = 0
+    in_word = False  # Whether the previous chunk ended mid-word
+    for start in range(0, len(text), _WORD_COUNT_CHUNK_CHARS):
+        chunk = text[start : start + _WORD_COUNT_CHUNK_CHARS]
+        count += len(chunk.split())
+        # A word split across chunks was counted twice
+        if in_word and not chunk[0].isspace():
+            count -= 1
+        in_word = not chunk[-1].isspace()
+    return count
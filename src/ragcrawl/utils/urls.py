@@ -0,0 +1,51 @@
+"""URL helpers shared by the fetcher and extractors."""
+
+from urllib.parse import urljoin, urlsplit
+
+
+def url_origin(url: str) -> str:
+    """
+    Return the ``scheme://netloc`` origin of an http(s) URL.
+
+    Args:
+        url: Absolute URL.
+
+    Returns:
+        The origin, or "" for other schemes or relative URLs.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return ""
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def join_url(base_url: str, href: str, origin: str = "") -> str:
+    """
+    Resolve href against base_url, like urljoin.
+
+    Root-relative paths are joined by concatenating them to the page origin
+    when urljoin would produce the same string. Anything urljoin would
+    rewrite (dot segments, params, empty query or fragment, control
+    characters) takes the slow path.
+
+    Args:
+        base_url: URL of the page the href appeared on.
+        href: Link target.
+        origin: url_origin(base_url), computed once per page by the caller;
+            "" disables the fast path.
+
+    Returns:
+        Absolute URL.
+    """
+    if (
+        origin
+        and href[:1] == "/"
+        and href[1:2] != "/"
+        and href[-1] not in "?#"
+        and "/." not in href
+        and ";" not in href
+        and "?#" not in href
+        and href.isprintable()
+    ):
+        return origin + href
+    return urljoin(base_url, href)
@@ -12,6 +12,33 @@ from ragcrawl.models.page_version import PageVersion
 from ragcrawl.models.site import Site
 
 
+def make_page(site_id: str, index: int, **overrides) -> Page:
+    """Create a page with every optional field populated."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    fields = dict(
+        page_id=f"page-{index}",
+        site_id=site_id,
+        url=f"https://example.com/p{index}",
+        canonical_url=f"https://example.com/p{index}",
+        current_version_id=f"version-{index}",
+        content_hash=f"hash-{index}",
+        etag=f'"e{index}"',
+        last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        first_seen=now,
+        last_seen=now,
+        last_crawled=now,
+        last_changed=now,
+        depth=index,
+        referrer_url="https://example.com/",
+        status_code=200,
+        error_count=index,
+        last_error="boom",
+        version_count=index + 1,
+    )
+    fields.update(overrides)
+    return Page(**fields)
+
+
 class TestDuckDBBackend:
     """Integration tests for DuckDB backend."""
 
@@ -325,3 +352,84 @@ class TestDuckDBBackend:
         assert retrieved.name == "Test"
 
         backend2.close()
+
+    def test_bulk_save_round_trip(
+        self,
+        duckdb_backend,
+        sample_site: Site,
+        sample_crawl_run: CrawlRun,
+        sample_page_version: PageVersion,
+    ) -> None:
+        """Test that bulk-saved pages and versions read back unchanged."""
+        duckdb_backend.save_site(sample_site)
+        duckdb_backend.save_run(sample_crawl_run)
+        pages = [make_page(sample_site.site_id, i) for i in range(3)]
+        versions = [
+            sample_page_version.model_copy(
+                update={
+                    "version_id": f"version-{i}",
+                    "page_id": f"page-{i}",
+                    "outlinks": [f"https://example.com/p{i + 1}"],
+                    "headings_outline": [{"level": 1, "text": "Title"}],
+                    "extra": {"lang": "en"},
+                }
+            )
+            for i in range(3)
+        ]
+
+        assert duckdb_backend.save_versions_bulk(versions) == 3
+        assert duckdb_backend.save_pages_bulk(pages) == 3
+
+        for page, version in zip(pages, versions):
+            assert duckdb_backend.get_page(page.page_id) == page
+            retrieved = duckdb_backend.get_version(version.version_id)
+            assert retrieved.page_id == version.page_id
+            assert retrieved.markdown == version.markdown
+            assert retrieved.outlinks == version.outlinks
+            assert retrieved.headings_outline == version.headings_outline
+            assert retrieved.extra == version.extra
+
+    def test_bulk_save_upserts_existing_page(self, duckdb_backend, sample_site: Site) -> None:
+        """Test that bulk saves update pages that already exist."""
+        duckdb_backend.save_site(sample_site)
+        duckdb_backend.save_page(make_page(sample_site.site_id, 0))
+
+        updated = make_page(sample_site.site_id, 0, etag='"new"', version_count=7)
+        duckdb_backend.save_pages_bulk([updated, make_page(sample_site.site_id, 1)])
+
+        assert duckdb_backend.get_page("page-0") == updated
+        assert len(duckdb_backend.list_pages(sample_site.site_id)) == 2
+
+    def test_bulk_save_duplicate_page_in_batch(self, duckdb_backend, sample_site: Site) -> None:
+        """Test that the last copy of a page repeated within one batch wins."""
+        duckdb_backend.save_site(sample_site)
+        first = make_page(sample_site.site_id, 0, etag='"first"')
+        last = make_page(sample_site.site_id, 0, etag='"last"')
+
+        duckdb_backend.save_pages_bulk([first, last])
+
+        assert duckdb_backend.get_page("page-0").etag == '"last"'
+        assert len(duckdb_backend.list_pages(sample_site.site_id)) == 1
+
+    def test_bulk_save_rolls_back_on_failure(self, duckdb_backend, sample_site: Site) -> None:
+        """Test that a failing row leaves none of the batch written."""
+        duckdb_backend.save_site(sample_site)
+        duckdb_backend.save_page(make_page(sample_site.site_id, 0))
+        # Bypass validation to produce a row that violates NOT NULL
+        fields = make_page(sample_site.site_id, 2).model_dump()
+        broken = Page.model_construct(**{**fields, "url": None})
+
+        with pytest.raises(Exception):
+            duckdb_backend.save_pages_bulk(
+                [
+                    make_page(sample_site.site_id, 0, etag='"changed"'),
+                    make_page(sample_site.site_id, 1),
+                    broken,
+                ]
+            )
+
+        assert duckdb_backend.get_page("page-0").etag == '"e0"'
+        assert duckdb_backend.get_page("page-1") is None
+        # The connection is usable again after the rollback
+        duckdb_backend.save_page(make_page(sample_site.site_id, 1))
+        assert duckdb_backend.get_page("page-1") is not None
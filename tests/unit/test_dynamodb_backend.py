@@ -0,0 +1,122 @@
+"""Tests for DynamoDB backend bulk writes."""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("pynamodb")
+
+from ragcrawl.models.page import Page
+from ragcrawl.models.page_version import PageVersion
+from ragcrawl.storage.dynamodb.backend import DynamoDBBackend
+from ragcrawl.storage.dynamodb.models import PageModel, PageVersionModel
+
+
+def make_backend() -> DynamoDBBackend:
+    """Create a backend without touching AWS."""
+    return DynamoDBBackend.__new__(DynamoDBBackend)
+
+
+def capture_batch_writes(monkeypatch, model_cls) -> list:
+    """Replace ``model_cls.batch_write`` with one that records saved models."""
+    saved: list = []
+
+    class Batch:
+        def save(self, item) -> None:
+            saved.append(item)
+
+    @contextmanager
+    def batch_write(*args, **kwargs):
+        yield Batch()
+
+    monkeypatch.setattr(model_cls, "batch_write", batch_write)
+    return saved
+
+
+def round_trip(model_cls, model):
+    """Serialize a model the way DynamoDB stores it and load it back."""
+    return model_cls.from_raw_data(model.serialize())
+
+
+class TestDynamoDBBulkWrites:
+    """Bulk saves must persist the same fields as single saves."""
+
+    def test_save_pages_bulk_keeps_all_fields(self, monkeypatch) -> None:
+        """Every Page field survives save_pages_bulk."""
+        saved = capture_batch_writes(monkeypatch, PageModel)
+        backend = make_backend()
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        pages = [
+            Page(
+                page_id=f"page-{i}",
+                site_id="site-1",
+                url=f"https://example.com/p{i}",
+                canonical_url=f"https://example.com/p{i}",
+                current_version_id=f"version-{i}",
+                content_hash=f"hash-{i}",
+                etag=f'"e{i}"',
+                last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+                first_seen=now,
+                last_seen=now,
+                last_crawled=now,
+                last_changed=now,
+                depth=i,
+                referrer_url="https://example.com/",
+                status_code=200,
+                is_tombstone=bool(i % 2),
+                error_count=i,
+                last_error="boom",
+                version_count=i + 1,
+            )
+            for i in range(3)
+        ]
+
+        assert backend.save_pages_bulk(pages) == 3
+
+        restored = [backend._model_to_page(round_trip(PageModel, m)) for m in saved]
+        assert restored == pages
+
+    def test_save_versions_bulk_keeps_all_fields(self, monkeypatch) -> None:
+        """Every PageVersion field survives save_versions_bulk."""
+        saved = capture_batch_writes(monkeypatch, PageVersionModel)
+        backend = make_backend()
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        version = PageVersion(
+            version_id="version-1",
+            page_id="page-1",
+            site_id="site-1",
+            run_id="run-1",
+            markdown="# Title\n\nBody",
+            html="<h1>Title</h1><p>Body</p>",
+            plain_text="Title Body",
+            content_hash="hash-1",
+            raw_hash="raw-1",
+            url="https://example.com/p1",
+            canonical_url="https://example.com/p1",
+            title="Title",
+            description="A page",
+            content_type="text/html",
+            status_code=200,
+            language="en",
+            headings_outline=[{"level": 1, "text": "Title"}],
+            word_count=2,
+            char_count=10,
+            outlinks=["https://example.com/p2"],
+            internal_link_count=1,
+            external_link_count=0,
+            etag='"e1"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+            crawled_at=now,
+            created_at=now,
+            fetch_latency_ms=12.5,
+            extraction_latency_ms=3.0,
+            is_tombstone=False,
+            extra={"lang_confidence": 0.9},
+        )
+
+        assert backend.save_versions_bulk([version]) == 1
+
+        [model] = saved
+        restored = backend._model_to_version(round_trip(PageVersionModel, model))
+        assert restored == version
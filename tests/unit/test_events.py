@@ -54,3 +54,72 @@ def test_event_emitter_register_emit_and_unregister() -> None:
     emitter.unregister(bad_handler)
     emitter.emit_deleted(page_id="p1", url="https://example.com/page", site_id="s1", run_id="r1")
     assert received[-1].event_type is EventType.PAGE_DELETED
+
+
+def test_change_event_to_dict_keys() -> None:
+    """ChangeEvent.to_dict includes every field in declaration order."""
+    event = ChangeEvent(
+        event_type=EventType.PAGE_DELETED,
+        page_id="p1",
+        url="https://example.com",
+        site_id="s1",
+        run_id="r1",
+        timestamp=datetime(2024, 1, 1),
+    )
+    data = event.to_dict()
+    assert list(data) == [
+        "event_type",
+        "page_id",
+        "url",
+        "site_id",
+        "run_id",
+        "timestamp",
+        "version_id",
+        "old_version_id",
+        "content_hash",
+        "old_content_hash",
+        "metadata",
+    ]
+    assert data["version_id"] is None
+
+
+def test_event_emitter_positional_fields() -> None:
+    """Emit helpers populate the expected ChangeEvent fields."""
+    emitter = EventEmitter()
+    received: list[ChangeEvent] = []
+    emitter.register(received.append)
+
+    emitter.emit_created("p1", "https://example.com", "s1", "r1", "v1", "h1")
+    emitter.emit_changed("p1", "https://example.com", "s1", "r1", "v2", "v1", "h2", "h1")
+
+    created, changed = received
+    assert created.version_id == "v1"
+    assert created.old_version_id is None
+    assert created.content_hash == "h1"
+    assert changed.old_version_id == "v1"
+    assert changed.old_content_hash == "h1"
+    assert changed.run_id == "r1"
+
+
+def test_event_emitter_unregister_bound_method() -> None:
+    """Bound methods can be unregistered via a fresh attribute access."""
+
+    class Consumer:
+        def __init__(self) -> None:
+            self.events: list[ChangeEvent] = []
+
+        def on_event(self, event: ChangeEvent) -> None:
+            self.events.append(event)
+
+    consumer = Consumer()
+    emitter = EventEmitter()
+    emitter.register(consumer.on_event)
+    emitter.register(consumer.on_event)
+
+    emitter.emit_deleted("p1", "https://example.com", "s1", "r1")
+    assert len(consumer.events) == 1
+
+    emitter.unregister(consumer.on_event)
+    emitter.unregister(consumer.on_event)
+    emitter.emit_deleted("p1", "https://example.com", "s1", "r1")
+    assert len(consumer.events) == 1
@@ -0,0 +1,320 @@
+"""Tests for HTML metadata and link extraction."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from ragcrawl.extraction.extractor import ContentExtractor
+from ragcrawl.extraction.html_tree import parse_html
+from ragcrawl.extraction.link_extractor import LinkExtractor
+from ragcrawl.extraction.metadata import MetadataExtractor
+from ragcrawl.fetcher.base import FetchResult, FetchStatus
+
+SAMPLE_HTML = """<!DOCTYPE html>
+<html lang="en-US">
+<head>
+  <title>  My   Page &amp; More </title>
+  <meta name="description" content="A sample page">
+  <meta name="keywords" content="alpha, beta,, gamma">
+  <meta property="og:title" content="OG Title">
+  <meta property="og:type" content="article">
+  <link rel="canonical" href="https://example.com/page">
+</head>
+<body>
+  <h1 id="top">Main Heading</h1>
+  <h2>Section <em>Two</em></h2>
+  <h3></h3>
+  <a href="/docs/guide">Guide</a>
+  <a href="/docs/guide#intro">Guide again</a>
+  <a href="https://other.com/x" rel="nofollow">External</a>
+  <a href="https://sub.example.com/y">Sub</a>
+  <a href="mailto:me@example.com">Mail</a>
+  <a href="javascript:void(0)">JS</a>
+  <a name="no-href">Anchor only</a>
+</body>
+</html>"""
+
+
+@pytest.fixture(params=["lxml", "selectolax", "regex"])
+def backend(request: pytest.FixtureRequest) -> str:
+    """Run each test against both parser backends and the regex fallback."""
+    if request.param == "selectolax":
+        pytest.importorskip("selectolax")
+    return request.param
+
+
+class TestMetadataExtractor:
+    """Tests for MetadataExtractor."""
+
+    def test_extract_metadata(self, backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test title, meta tags, canonical, language, and headings."""
+        if backend == "regex":
+            monkeypatch.setattr(
+                "ragcrawl.extraction.metadata.parse_html", lambda html, backend: None
+            )
+            backend = "lxml"
+
+        metadata = MetadataExtractor(backend=backend).extract(SAMPLE_HTML, "one two three")
+
+        assert metadata.title == "My Page & More"
+        assert metadata.description == "A sample page"
+        assert metadata.keywords == ["alpha", "beta", "gamma"]
+        assert metadata.canonical_url == "https://example.com/page"
+        assert metadata.language == "en"
+        assert metadata.og_title == "OG Title"
+        assert metadata.og_type == "article"
+        assert metadata.word_count == 3
+        assert metadata.headings_outline[0].text == "Main Heading"
+        assert metadata.headings_outline[0].anchor == "top"
+        assert metadata.headings_outline[0].level == 1
+
+    def test_title_falls_back_to_og_title(self) -> None:
+        """Test that og:title is used when there is no <title>."""
+        html = '<html><head><meta property="og:title" content="OG"></head></html>'
+
+        assert MetadataExtractor().extract(html).title == "OG"
+
+    def test_regex_path_decodes_entities(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the regex fallback decodes named and numeric entities."""
+        monkeypatch.setattr("ragcrawl.extraction.metadata.parse_html", lambda html, backend: None)
+        html = "<title>Q&amp;A &ndash; caf&#xe9;&nbsp;&amp;lt;tips&gt;</title>"
+
+        assert MetadataExtractor().extract(html).title == "Q&A \u2013 caf\u00e9 &lt;tips>"
+
+    def test_regex_path_parses_meta_attributes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test attribute order, quoting, and case handling in the regex fallback."""
+        monkeypatch.setattr("ragcrawl.extraction.metadata.parse_html", lambda html, backend: None)
+        html = (
+            "<meta content=\"It's here\" NAME='Description'>"
+            "<meta name=author content=Ann>"
+            "<meta name=\"descriptionx\" content=\"wrong\">"
+            "<link href='https://example.com/?a=1&amp;b=2' rel=\"Canonical\">"
+            "<meta name=\"keywords\""
+        )
+
+        metadata = MetadataExtractor().extract(html)
+
+        assert metadata.description == "It's here"
+        assert metadata.author == "Ann"
+        assert metadata.canonical_url == "https://example.com/?a=1&b=2"
+        assert metadata.keywords == []
+
+    def test_regex_path_reads_head_tags_from_head(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that head tags in the body are ignored unless <head> is unmarked."""
+        monkeypatch.setattr("ragcrawl.extraction.metadata.parse_html", lambda html, backend: None)
+        body = '<meta name="author" content="Body"><h1>Heading</h1>'
+
+        with_head = MetadataExtractor().extract(
+            f"<html><head><title>T</title></head><body>{body}</body></html>"
+        )
+        without_head = MetadataExtractor().extract(body)
+
+        assert with_head.title == "T"
+        assert with_head.author is None
+        assert without_head.title == "Heading"
+        assert without_head.author == "Body"
+
+    def test_headings_include_nested_text(
+        self, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that headings keep text from nested inline tags."""
+        if backend == "regex":
+            monkeypatch.setattr(
+                "ragcrawl.extraction.metadata.parse_html", lambda html, backend: None
+            )
+            backend = "lxml"
+
+        metadata = MetadataExtractor(backend=backend).extract(SAMPLE_HTML)
+
+        assert [h.text for h in metadata.headings_outline] == ["Main Heading", "Section Two"]
+
+
+class TestLinkExtractor:
+    """Tests for LinkExtractor."""
+
+    def test_extract_links(self, backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test resolution, dedup, special schemes, and categorization."""
+        if backend == "regex":
+            monkeypatch.setattr(
+                "ragcrawl.extraction.link_extractor.parse_html", lambda html, backend: None
+            )
+            backend = "lxml"
+
+        extractor = LinkExtractor("https://example.com/page", {"example.com"}, backend=backend)
+        links = extractor.extract(SAMPLE_HTML)
+
+        assert [link.href for link in links] == [
+            "https://example.com/docs/guide",
+            "https://other.com/x",
+            "https://sub.example.com/y",
+        ]
+        assert links[0].text == "Guide"
+        assert links[0].is_internal
+        assert not links[1].is_internal
+        assert links[1].is_nofollow
+        assert links[2].is_internal
+
+    def test_special_schemes_are_case_insensitive(self) -> None:
+        """Test that special-scheme hrefs are skipped regardless of case."""
+        extractor = LinkExtractor("https://example.com/")
+
+        assert extractor._is_special_scheme("JavaScript:void(0)")
+        assert extractor._is_special_scheme("MAILTO:someone@example.com")
+        assert not extractor._is_special_scheme("/docs/telephone")
+
+    def test_regex_path_scans_anchor_bounds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test case-insensitive closing tags and unclosed anchors in the fallback."""
+        monkeypatch.setattr(
+            "ragcrawl.extraction.link_extractor.parse_html", lambda html, backend: None
+        )
+        html = (
+            '<A HREF="/a">x <b>y</b></A >'
+            '<a\nhref="/b">multi\nline</a>'
+            '<a href="/c">never closed' + " filler" * 1000
+        )
+
+        links = LinkExtractor("https://example.com/").extract(html)
+
+        assert [(link.href, link.text) for link in links] == [
+            ("https://example.com/a", "x y"),
+            ("https://example.com/b", "multi line"),
+        ]
+
+    @pytest.mark.parametrize(
+        "href", ["/a/b?x=1#top", "/a/./b", "/a/../b", "/a;p", "/a?", "/a#", "/a?#f", "/a\tb"]
+    )
+    def test_root_relative_matches_urljoin(self, href: str) -> None:
+        """Test that root-relative hrefs resolve exactly as urljoin would."""
+        base_url = "https://example.com/dir/page?q=1"
+        extractor = LinkExtractor(base_url)
+
+        result = extractor._resolve_url(href, base_url, "https://example.com")
+
+        assert result is not None
+        assert result[0] == urljoin(base_url, href)
+
+    def test_base_url_per_call(self) -> None:
+        """Test that one extractor resolves links against each page's URL."""
+        extractor = LinkExtractor()
+        html = '<a href="/docs">Docs</a><a href="https://docs.a.com/x">Sub</a>'
+
+        links_a = extractor.extract(html, base_url="https://a.com/page")
+        links_b = extractor.extract(html, base_url="https://b.com/page")
+
+        assert [(link.href, link.is_internal) for link in links_a] == [
+            ("https://a.com/docs", True),
+            ("https://docs.a.com/x", True),
+        ]
+        assert [(link.href, link.is_internal) for link in links_b] == [
+            ("https://b.com/docs", True),
+            ("https://docs.a.com/x", False),
+        ]
+
+        with pytest.raises(ValueError):
+            extractor.extract(html)
+
+    def test_shared_tree(self) -> None:
+        """Test that a pre-parsed tree gives the same links as raw HTML."""
+        extractor = LinkExtractor("https://example.com/page")
+        tree = parse_html(SAMPLE_HTML)
+
+        assert extractor.extract(SAMPLE_HTML, tree=tree) == extractor.extract(SAMPLE_HTML)
+
+    def test_parse_html_rejects_unknown_backend(self) -> None:
+        """Test that an unknown parser backend is reported."""
+        with pytest.raises(ValueError, match="Unknown HTML backend"):
+            parse_html(SAMPLE_HTML, "html5lib")
+
+    def test_parse_html_rejects_empty(self) -> None:
+        """Test that empty documents fall back to regex scanning."""
+        assert parse_html("") is None
+        assert parse_html("   \n") is None
+        assert LinkExtractor("https://example.com/").extract("") == []
+
+
+class TestContentExtractor:
+    """Tests for ContentExtractor."""
+
+    def test_markdown_to_text(self) -> None:
+        """Test stripping markdown syntax down to plain text."""
+        markdown = (
+            "# Title\n\n"
+            "Some **bold** and *italic* and __strong__ and _em_ text with `code`.\n\n"
+            "```python\nprint(\"hi\")\n```\n\n"
+            "![img](a.png) See [the docs](https://x.com) now.\n\n"
+            "---\n\n"
+            "- item one\n* item two\n1. first\n2. second\n\n\n\n"
+            "Tail   spaces   here."
+        )
+
+        assert ContentExtractor()._markdown_to_text(markdown) == (
+            "Title\n\n"
+            "Some bold and italic and strong and em text with .\n\n"
+            " See the docs now.\n\n"
+            "item one\nitem two\nfirst\nsecond\n\n"
+            "Tail spaces here."
+        )
+
+    def test_fetch_result_links_are_categorized(self) -> None:
+        """Test internal/external split for links supplied by the fetcher."""
+        fetch_result = FetchResult(
+            status=FetchStatus.SUCCESS,
+            markdown="# Page",
+            links=[
+                "https://example.com/a",
+                "https://example.com",
+                "https://example.com.evil.org/b",
+                "https://docs.example.com/c",
+                "https://partner.org/d",
+                "https://other.com/e",
+            ],
+        )
+
+        result = ContentExtractor({"example.com", "partner.org"}).extract(
+            fetch_result, "https://example.com/page"
+        )
+
+        assert result.internal_links == [
+            "https://example.com/a",
+            "https://example.com",
+            "https://docs.example.com/c",
+            "https://partner.org/d",
+        ]
+        assert result.external_links == [
+            "https://example.com.evil.org/b",
+            "https://other.com/e",
+        ]
+
+    def test_raw_hash_is_not_whitespace_normalized(self) -> None:
+        """Test that raw_hash fingerprints the HTML exactly as fetched."""
+        extractor = ContentExtractor()
+
+        def raw_hash(html: str) -> str | None:
+            fetch_result = FetchResult(status=FetchStatus.SUCCESS, html=html, markdown="x")
+            return extractor.extract(fetch_result, "https://example.com/").raw_hash
+
+        assert raw_hash("<p>a  b</p>") != raw_hash("<p>a b</p>")
+        assert raw_hash("<p>a b</p>") == raw_hash("<p>a b</p>")
+
+    def test_plain_text_is_rendered_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that plain text is only rendered when read, and only once."""
+        extractor = ContentExtractor()
+        calls = []
+
+        def render(markdown: str) -> str:
+            calls.append(markdown)
+            return "plain"
+
+        monkeypatch.setattr(extractor, "_markdown_to_text", render)
+        fetch_result = FetchResult(status=FetchStatus.SUCCESS, markdown="# Page")
+
+        result = extractor.extract(fetch_result, "https://example.com/", extract_plain_text=True)
+        assert calls == []
+        assert result.plain_text == "plain"
+        assert result.plain_text == "plain"
+        assert calls == ["# Page"]
+
+        result = extractor.extract(fetch_result, "https://example.com/")
+        assert result.plain_text is None
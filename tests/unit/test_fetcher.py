@@ -0,0 +1,619 @@
+"""Tests for the HTTP fetch path."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from robotexclusionrulesparser import RobotExclusionRulesParser
+
+from ragcrawl.config.crawler_config import FetchMode
+from ragcrawl.config.markdown_config import MarkdownConfig
+from ragcrawl.fetcher import crawl4ai_fetcher
+from ragcrawl.fetcher import robots
+from ragcrawl.fetcher.base import FetchResult, FetchStatus
+from ragcrawl.fetcher.crawl4ai_fetcher import Crawl4AIFetcher
+from ragcrawl.fetcher.revalidation import Revalidator
+from ragcrawl.fetcher.robots import RobotsChecker
+
+PAGE = "<html><head><title>Hello</title></head><body><p>Body text</p></body></html>"
+
+
+class MockNetwork:
+    """Records the requests and clients created while the fixture is active."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.clients: list[httpx.AsyncClient] = []
+        self.client_options: list[dict[str, object]] = []
+        self.chunks_sent = 0
+
+    async def _stream_paragraphs(self, count: int) -> AsyncIterator[bytes]:
+        """Yield count 1KB paragraphs."""
+        for _ in range(count):
+            self.chunks_sent += 1
+            yield b"<p>" + b"x" * 1024 + b"</p>"
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve robots.txt, a 304 for matching validators, or the test page."""
+        self.requests.append(request)
+        if request.url.path == "/robots.txt" and request.url.host == "missing.example.com":
+            return httpx.Response(404)
+        if request.url.path == "/robots.txt" and request.url.host == "broken.example.com":
+            return httpx.Response(500)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(
+                200,
+                text=(
+                    "User-agent: *\nDisallow: /private\nCrawl-delay: 2\n"
+                    "Sitemap: https://example.com/sitemap.xml\n"
+                ),
+            )
+        if request.url.path == "/logo":
+            return httpx.Response(200, content=b"\x89PNG", headers={"content-type": "image/png"})
+        if request.url.path == "/latin1":
+            return httpx.Response(
+                200,
+                content="<p>caf\xe9</p>".encode("latin-1"),
+                headers={"content-type": "text/html; charset=iso-8859-1"},
+            )
+        if request.url.path == "/huge":
+            # Streamed in chunks without a Content-Length header
+            return httpx.Response(200, content=self._stream_paragraphs(100))
+        if request.url.path == "/no-head" and request.method == "HEAD":
+            return httpx.Response(405)
+        if request.url.path == "/spa":
+            return httpx.Response(200, html='<html><body><div id="root"></div></body></html>')
+        if request.url.path == "/cdn":
+            # Ignores conditional headers but reports a stable ETag
+            return httpx.Response(200, html=PAGE, headers={"etag": '"v1"'})
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, html=PAGE, headers={"etag": '"v1"'})
+
+
+@pytest.fixture
+def network(monkeypatch: pytest.MonkeyPatch) -> MockNetwork:
+    """Route every httpx.AsyncClient through an in-memory transport."""
+    net = MockNetwork()
+
+    class MockClient(httpx.AsyncClient):
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__(transport=httpx.MockTransport(net.handle), **kwargs)
+            net.clients.append(self)
+            net.client_options.append(kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+    return net
+
+
+class TestCrawl4AIFetcherHttp:
+    """Tests for Crawl4AIFetcher in HTTP mode."""
+
+    async def test_fetches_share_one_client(self, network: MockNetwork) -> None:
+        """Test that repeated fetches reuse a single client until close()."""
+        fetcher = Crawl4AIFetcher(
+            user_agent="test-agent", headers={"X-Test": "1"}, cookies={"session": "abc"}
+        )
+
+        results = await fetcher.fetch_batch(
+            ["https://example.com/a", "https://example.com/b"]
+        )
+        result = await fetcher.fetch("https://example.com/c")
+
+        assert [r.status for r in results] == [FetchStatus.SUCCESS] * 2
+        assert result.title == "Hello"
+        assert len(network.clients) == 1
+        for request in network.requests:
+            assert request.headers["user-agent"] == "test-agent"
+            assert request.headers["x-test"] == "1"
+            assert request.headers["cookie"] == "session=abc"
+
+        await fetcher.close()
+        assert network.clients[0].is_closed
+
+    async def test_conditional_headers_per_request(
+        self, network: MockNetwork
+    ) -> None:
+        """Test that validators are sent only on the request that uses them."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch("https://example.com/a", etag='"v1"')
+        fresh = await fetcher.fetch("https://example.com/a")
+        await fetcher.close()
+
+        assert result.status == FetchStatus.NOT_MODIFIED
+        assert fresh.status == FetchStatus.SUCCESS
+        assert "if-none-match" not in network.requests[-1].headers
+
+    async def test_keeps_only_caching_headers(self, network: MockNetwork) -> None:
+        """Test that FetchResult keeps the caching and content headers only."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch("https://example.com/a")
+        await fetcher.close()
+
+        assert result.headers == {"etag": '"v1"', "content-type": "text/html; charset=utf-8"}
+
+    @pytest.mark.parametrize(
+        ("path", "etag", "expected", "methods"),
+        [
+            ("/a", '"v1"', FetchStatus.NOT_MODIFIED, ["HEAD"]),
+            ("/cdn", '"v1"', FetchStatus.NOT_MODIFIED, ["HEAD"]),
+            ("/cdn", '"v0"', FetchStatus.SUCCESS, ["HEAD", "GET"]),
+            ("/no-head", '"v0"', FetchStatus.SUCCESS, ["HEAD", "GET"]),
+        ],
+    )
+    async def test_head_revalidation(
+        self,
+        network: MockNetwork,
+        path: str,
+        etag: str,
+        expected: FetchStatus,
+        methods: list[str],
+    ) -> None:
+        """Test that a HEAD settles unchanged pages and falls through otherwise."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch(f"https://example.com{path}", etag=etag)
+        await fetcher.close()
+
+        assert result.status == expected
+        assert [r.method for r in network.requests] == methods
+
+    async def test_head_revalidation_respects_revalidator(self, network: MockNetwork) -> None:
+        """Test that a matching ETag is not trusted when the revalidator ignores ETags."""
+        fetcher = Crawl4AIFetcher(revalidator=Revalidator(use_etag=False))
+
+        result = await fetcher.fetch("https://example.com/cdn", etag='"v1"')
+        await fetcher.close()
+
+        assert result.status == FetchStatus.SUCCESS
+        assert "if-none-match" not in network.requests[-1].headers
+
+    async def test_head_revalidation_can_be_disabled(self, network: MockNetwork) -> None:
+        """Test that revalidate_with_head=False sends a conditional GET directly."""
+        fetcher = Crawl4AIFetcher(revalidate_with_head=False)
+
+        result = await fetcher.fetch("https://example.com/a", etag='"v1"')
+        await fetcher.close()
+
+        assert result.status == FetchStatus.NOT_MODIFIED
+        assert [r.method for r in network.requests] == ["GET"]
+
+    async def test_http2_follows_h2_availability(self, network: MockNetwork) -> None:
+        """Test that HTTP/2 is only requested when h2 is importable."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch("https://example.com/a")
+        await fetcher.close()
+
+        assert result.status == FetchStatus.SUCCESS
+        assert network.client_options[0]["http2"] is crawl4ai_fetcher.HTTP2_AVAILABLE
+
+    async def test_body_size_cap(self, network: MockNetwork) -> None:
+        """Test that bodies over max_body_bytes are rejected."""
+        fetcher = Crawl4AIFetcher(max_body_bytes=50_000)
+
+        huge = await fetcher.fetch("https://example.com/huge")
+        page = await fetcher.fetch("https://example.com/a")
+        await fetcher.close()
+
+        assert huge.status == FetchStatus.ERROR
+        assert "exceeds" in (huge.error or "")
+        assert huge.html is None
+        assert network.chunks_sent < 100
+        assert page.status == FetchStatus.SUCCESS
+
+    async def test_binary_content_is_skipped(self, network: MockNetwork) -> None:
+        """Test that binary media types are not decoded as HTML."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch("https://example.com/logo")
+        await fetcher.close()
+
+        assert result.status == FetchStatus.ERROR
+        assert result.content_type == "image/png"
+        assert result.html is None
+
+    async def test_body_decoded_with_declared_charset(self, network: MockNetwork) -> None:
+        """Test that the streamed body is decoded using the response charset."""
+        fetcher = Crawl4AIFetcher()
+
+        result = await fetcher.fetch("https://example.com/latin1")
+        await fetcher.close()
+
+        assert result.html == "<p>caf\xe9</p>"
+
+    async def test_fetch_batch_bounds_concurrency(
+        self, network: MockNetwork, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that fetch_batch never runs more than max_concurrency fetches."""
+        fetcher = Crawl4AIFetcher(max_concurrency=3)
+        original = fetcher._fetch_http
+        in_flight = peak = 0
+
+        async def slow_fetch(*args: object, **kwargs: object) -> FetchResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        monkeypatch.setattr(fetcher, "_fetch_http", slow_fetch)
+
+        urls = [f"https://example.com/page{i}" for i in range(10)]
+        results = await fetcher.fetch_batch(urls)
+        await fetcher.close()
+
+        assert peak == 3
+        assert [r.status for r in results] == [FetchStatus.SUCCESS] * 10
+
+    async def test_fetch_batch_iter_streams_results(self, network: MockNetwork) -> None:
+        """Test that results are yielded as they finish with a bounded window."""
+        fetcher = Crawl4AIFetcher(max_concurrency=2)
+        urls = [f"https://example.com/page{i}" for i in range(5)]
+
+        seen = []
+        async for url, result in fetcher.fetch_batch_iter(iter(urls)):
+            assert result.status == FetchStatus.SUCCESS
+            seen.append(url)
+        await fetcher.close()
+
+        assert sorted(seen) == urls
+
+    async def test_fetch_batch_keeps_input_order(self, network: MockNetwork) -> None:
+        """Test that fetch_batch returns results in input order, duplicates included."""
+        fetcher = Crawl4AIFetcher(max_concurrency=2)
+        urls = ["https://example.com/a", "https://example.com/spa", "https://example.com/a"]
+
+        results = await fetcher.fetch_batch(urls)
+        await fetcher.close()
+
+        assert [r.final_url for r in results] == urls
+
+
+class TestHybridMode:
+    """Tests for HYBRID fetch mode."""
+
+    async def test_spa_shell_goes_straight_to_browser(
+        self, network: MockNetwork, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an SPA shell skips HTTP-side extraction when a browser exists."""
+        fetcher = Crawl4AIFetcher(fetch_mode=FetchMode.HYBRID)
+        fetcher._crawler = object()
+        extracted: list[str] = []
+        rendered: list[str] = []
+
+        async def fake_extract(html: str, url: str) -> tuple[str, None, None, list[str]]:
+            extracted.append(url)
+            return "Static page text", None, None, []
+
+        async def fake_browser(url: str) -> FetchResult:
+            rendered.append(url)
+            return FetchResult(status=FetchStatus.SUCCESS, markdown="Rendered")
+
+        monkeypatch.setattr(fetcher, "_extract_content", fake_extract)
+        monkeypatch.setattr(fetcher, "_fetch_browser", fake_browser)
+
+        spa = await fetcher.fetch("https://example.com/spa")
+        static = await fetcher.fetch("https://example.com/a")
+
+        assert spa.used_browser
+        assert spa.markdown == "Rendered"
+        assert rendered == ["https://example.com/spa"]
+        assert extracted == ["https://example.com/a"]
+        assert not static.used_browser
+
+    async def test_no_browser_means_no_refetch(self, network: MockNetwork) -> None:
+        """Test that HYBRID without a browser does not repeat the HTTP fetch."""
+        fetcher = Crawl4AIFetcher(fetch_mode=FetchMode.HYBRID)
+
+        result = await fetcher.fetch("https://example.com/spa")
+        await fetcher.close()
+
+        assert result.status == FetchStatus.SUCCESS
+        assert not result.used_browser
+        assert len(network.requests) == 1
+
+
+class TestFallbackExtraction:
+    """Tests for the regex fallback used without Crawl4AI."""
+
+    @pytest.mark.parametrize("parser", ["selectolax", "regex"])
+    def test_fallback_extract(self, parser: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test title, description, links, and script/style stripping."""
+        if parser == "selectolax":
+            pytest.importorskip("selectolax")
+        else:
+            monkeypatch.setattr(crawl4ai_fetcher, "LexborHTMLParser", None)
+        html = (
+            "<html><head><TITLE>Docs</TITLE>"
+            '<meta name="description" content="About the docs">'
+            "<STYLE>p { color: red }</style></head>"
+            '<body><a href="/guide">Guide</a><a href="mailto:x@example.com">Mail</a>'
+            "<script>var x = '<p>';</SCRIPT><p>Text</p></body></html>"
+        )
+
+        markdown, title, description, links = Crawl4AIFetcher()._fallback_extract(
+            html, "https://example.com/docs/"
+        )
+
+        assert title == "Docs"
+        assert description == "About the docs"
+        assert links == ["https://example.com/guide"]
+        assert [line for line in markdown.splitlines() if line][-3:] == ["Guide", "Mail", "Text"]
+        assert "color" not in markdown
+        assert "var x" not in markdown
+
+    @pytest.mark.parametrize("parser", ["selectolax", "regex"])
+    def test_fallback_parsers_extract_the_same(
+        self, parser: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that both scans keep non-anchor hrefs, noscript text, and the title."""
+        if parser == "selectolax":
+            pytest.importorskip("selectolax")
+        else:
+            monkeypatch.setattr(crawl4ai_fetcher, "LexborHTMLParser", None)
+        html = (
+            '<html><head><title>T</title><link rel="stylesheet" href="/s.css">'
+            '<link rel="next" href="/page/2"><style>p {}</style></head>'
+            "<body><p>Hello</p><noscript>Enable JS</noscript>"
+            '<a href="/a">A</a><script>x</script></body></html>'
+        )
+
+        markdown, title, _, links = Crawl4AIFetcher()._fallback_extract(
+            html, "https://example.com/"
+        )
+
+        assert title == "T"
+        assert links == [
+            "https://example.com/s.css",
+            "https://example.com/page/2",
+            "https://example.com/a",
+        ]
+        assert [line for line in markdown.splitlines() if line] == [
+            "T",
+            "Hello",
+            "Enable JS",
+            "A",
+        ]
+
+    @pytest.mark.parametrize(
+        ("html", "markdown", "expected"),
+        [
+            ('<div id="root"></div>', "Loading", True),
+            ("<script>window.__NUXT__={}</script>", "Loading", True),
+            ('<div id="root"></div>', "x" * 499, True),
+            ('<div id="root"></div>', "x" * 500, False),
+            (None, "x" * 500, False),
+            ("<p>Static page</p>", "Static page", False),
+            ("<p>Static page</p>", "", True),
+        ],
+    )
+    def test_needs_browser_rendering(
+        self, html: str | None, markdown: str, expected: bool
+    ) -> None:
+        """Test that short pages with SPA markers are sent to the browser."""
+        result = FetchResult(status=FetchStatus.SUCCESS, html=html, markdown=markdown)
+
+        assert Crawl4AIFetcher()._needs_browser_rendering(result) is expected
+
+
+class TestMarkdownSelection:
+    """Tests for picking the markdown variant from a Crawl4AI result."""
+
+    @pytest.mark.parametrize(
+        ("include_citations", "use_fit_markdown", "expected"),
+        [
+            (True, True, "cited"),
+            (False, True, "fit"),
+            (False, False, "raw"),
+        ],
+    )
+    def test_variant_follows_config(
+        self, include_citations: bool, use_fit_markdown: bool, expected: str
+    ) -> None:
+        """Test that the configured variant wins over raw_markdown."""
+        fetcher = Crawl4AIFetcher(
+            markdown_config=MarkdownConfig(
+                include_citations=include_citations, use_fit_markdown=use_fit_markdown
+            )
+        )
+        markdown = SimpleNamespace(
+            markdown_with_citations="cited", fit_markdown="fit", raw_markdown="raw"
+        )
+
+        assert fetcher._extract_markdown_from_result(SimpleNamespace(markdown=markdown)) == expected
+
+    def test_fallbacks(self) -> None:
+        """Test empty variants, plain strings, and missing markdown."""
+        fetcher = Crawl4AIFetcher(
+            markdown_config=MarkdownConfig(include_citations=True, use_fit_markdown=True)
+        )
+        empty = SimpleNamespace(markdown_with_citations="", fit_markdown=None, raw_markdown="raw")
+
+        assert fetcher._extract_markdown_from_result(SimpleNamespace(markdown=empty)) == "raw"
+        assert fetcher._extract_markdown_from_result(SimpleNamespace(markdown="# Old")) == "# Old"
+        assert fetcher._extract_markdown_from_result(SimpleNamespace(markdown=None)) == ""
+
+
+class TestRobotsChecker:
+    """Tests for RobotsChecker."""
+
+    @pytest.mark.parametrize("parser", ["protego", "robotexclusionrulesparser"])
+    async def test_rules_with_each_parser(
+        self, network: MockNetwork, monkeypatch: pytest.MonkeyPatch, parser: str
+    ) -> None:
+        """Test allow rules, crawl delay, and sitemaps with either parser."""
+        if parser == "protego":
+            pytest.importorskip("protego")
+        else:
+            monkeypatch.setattr(robots, "Protego", None)
+        checker = RobotsChecker()
+
+        assert await checker.is_allowed("https://example.com/docs")
+        assert not await checker.is_allowed("https://example.com/private/x")
+        assert checker.get_crawl_delay("https://example.com/docs") == 2.0
+        assert checker.get_sitemaps("https://example.com/docs") == [
+            "https://example.com/sitemap.xml"
+        ]
+        await checker.close()
+
+    async def test_robots_share_one_client(self, network: MockNetwork) -> None:
+        """Test that robots.txt fetches for several hosts reuse one client."""
+        checker = RobotsChecker(user_agent="test-agent")
+
+        assert await checker.is_allowed("https://example.com/page")
+        assert not await checker.is_allowed("https://example.com/private/x")
+        assert await checker.is_allowed("https://other.com/page")
+
+        assert len(network.requests) == 2
+        assert len(network.clients) == 1
+        assert network.requests[0].headers["user-agent"] == "test-agent"
+
+        await checker.close()
+        assert network.clients[0].is_closed
+
+    async def test_concurrent_lookups_fetch_once_per_domain(self, network: MockNetwork) -> None:
+        """Test that domains fetch concurrently but each robots.txt only once."""
+        checker = RobotsChecker()
+        urls = [f"https://site{i % 3}.example.com/page{i}" for i in range(12)]
+
+        results = await asyncio.gather(*(checker.is_allowed(url) for url in urls))
+        await checker.close()
+
+        assert all(results)
+        assert sorted(r.url.host for r in network.requests) == [
+            "site0.example.com",
+            "site1.example.com",
+            "site2.example.com",
+        ]
+
+    async def test_decisions_are_memoized_per_parser(
+        self, network: MockNetwork, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeated paths skip rule matching until robots.txt is refetched."""
+        monkeypatch.setattr(robots, "Protego", None)
+        checker = RobotsChecker()
+        calls: list[str] = []
+        original = RobotExclusionRulesParser.is_allowed
+
+        def counting_is_allowed(self: RobotExclusionRulesParser, ua: str, url: str) -> bool:
+            calls.append(url)
+            return original(self, ua, url)
+
+        monkeypatch.setattr(RobotExclusionRulesParser, "is_allowed", counting_is_allowed)
+
+        assert not await checker.is_allowed("https://example.com/private/x")
+        assert not await checker.is_allowed("https://example.com/private/x#frag")
+        assert await checker.is_allowed("https://example.com/public?q=1")
+        assert len(calls) == 2
+
+        checker.cache_ttl_seconds = 0
+        assert not await checker.is_allowed("https://example.com/private/x")
+        assert len(calls) == 3
+        await checker.close()
+
+    async def test_cache_persists_across_runs(self, network: MockNetwork, tmp_path: Path) -> None:
+        """Test that fetched robots.txt files are reused by the next checker."""
+        cache_path = tmp_path / "robots.json"
+        urls = [
+            "https://example.com/private/x",
+            "https://missing.example.com/page",
+            "https://broken.example.com/page",
+        ]
+
+        first = RobotsChecker(cache_path=cache_path)
+        assert [await first.is_allowed(url) for url in urls] == [False, True, True]
+        await first.close()
+        assert len(network.requests) == 3
+
+        second = RobotsChecker(cache_path=cache_path)
+        assert [await second.is_allowed(url) for url in urls] == [False, True, True]
+        await second.close()
+
+        # Only the failed fetch is retried; the 200 and the 404 were persisted
+        assert [r.url.host for r in network.requests[3:]] == ["broken.example.com"]
+
+        second.clear_cache()
+        assert not cache_path.exists()
+
+    async def test_expired_or_corrupt_cache_is_refetched(
+        self, network: MockNetwork, tmp_path: Path
+    ) -> None:
+        """Test that stale entries and unreadable files fall back to fetching."""
+        cache_path = tmp_path / "robots.json"
+        cache_path.write_text(
+            '{"example.com": {"text": "User-agent: *\\nDisallow: /", "fetched_at": 0}}'
+        )
+
+        stale = RobotsChecker(cache_path=cache_path)
+        assert await stale.is_allowed("https://example.com/page")
+        await stale.close()
+        assert len(network.requests) == 1
+
+        cache_path.write_text("not json")
+        corrupt = RobotsChecker(cache_path=cache_path)
+        assert await corrupt.is_allowed("https://example.com/page")
+        await corrupt.close()
+        assert len(network.requests) == 2
+
+    def test_stored_cache_drops_expired_and_keeps_newest(self, tmp_path: Path) -> None:
+        """Test that loading cache_path skips stale entries and applies max_cache_entries."""
+        now = time.time()
+        cache_path = tmp_path / "robots.json"
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "old.example.com": {"text": "", "fetched_at": now - 7200},
+                    "a.example.com": {"text": "", "fetched_at": now - 30},
+                    "b.example.com": {"text": "", "fetched_at": now - 10},
+                    "c.example.com": {"text": "", "fetched_at": now - 20},
+                }
+            )
+        )
+
+        checker = RobotsChecker(cache_path=cache_path, max_cache_entries=2)
+
+        assert list(checker._stored) == ["c.example.com", "b.example.com"]
+
+    async def test_stored_cache_is_bounded(self, network: MockNetwork, tmp_path: Path) -> None:
+        """Test that the persisted robots.txt files are capped at max_cache_entries."""
+        cache_path = tmp_path / "robots.json"
+        checker = RobotsChecker(cache_path=cache_path, max_cache_entries=2)
+
+        for host in ("a", "b", "c"):
+            await checker.is_allowed(f"https://{host}.example.com/")
+        await checker.close()
+
+        assert sorted(json.loads(cache_path.read_text())) == ["b.example.com", "c.example.com"]
+
+    async def test_cache_is_bounded_lru(self, network: MockNetwork) -> None:
+        """Test that the least recently used domain is evicted past max_cache_entries."""
+        checker = RobotsChecker(max_cache_entries=2)
+
+        await checker.is_allowed("https://a.example.com/")
+        await checker.is_allowed("https://b.example.com/")
+        await checker.is_allowed("https://a.example.com/other")
+        await checker.is_allowed("https://c.example.com/")
+
+        assert list(checker._cache) == ["a.example.com", "c.example.com"]
+        assert len(checker._locks) == 2
+
+        await checker.is_allowed("https://b.example.com/")
+        await checker.close()
+
+        assert [r.url.host for r in network.requests] == [
+            "a.example.com",
+            "b.example.com",
+            "c.example.com",
+            "b.example.com",
+        ]
@@ -0,0 +1,242 @@
+"""Tests for the crawl frontier."""
+
+import pytest
+
+from ragcrawl.core.frontier import Frontier
+from ragcrawl.filters.link_filter import LinkFilter
+
+
+@pytest.fixture
+def frontier() -> Frontier:
+    """Create a frontier restricted to example.com."""
+    return Frontier(
+        run_id="run123",
+        site_id="site123",
+        link_filter=LinkFilter(allowed_domains=["example.com"]),
+        max_depth=3,
+        max_pages=100,
+    )
+
+
+class TestFrontier:
+    """Tests for Frontier."""
+
+    async def test_add_and_get_next(self, frontier: Frontier) -> None:
+        """Test adding a URL and getting it back."""
+        assert await frontier.add("https://example.com/page")
+        assert frontier.size == 1
+
+        item = await frontier.get_next()
+        assert item is not None
+        assert item.normalized_url == "https://example.com/page"
+        assert item.domain == "example.com"
+        assert frontier.in_progress_count == 1
+
+    async def test_add_deduplicates(self, frontier: Frontier) -> None:
+        """Test that duplicate URLs are rejected."""
+        assert await frontier.add("https://example.com/page")
+        assert not await frontier.add("https://EXAMPLE.com/page#section")
+        assert frontier.discovered_count == 1
+
+    async def test_add_skips_filter_for_seen_urls(
+        self, frontier: Frontier, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that already-normalized duplicates never reach the filter."""
+        assert await frontier.add("https://example.com/page")
+
+        calls = []
+        original = frontier.link_filter.filter
+
+        def counting_filter(url: str, **kwargs: object) -> object:
+            calls.append(url)
+            return original(url, **kwargs)
+
+        monkeypatch.setattr(frontier.link_filter, "filter", counting_filter)
+
+        added = await frontier.add_batch(
+            ["https://example.com/page", "https://example.com/new"], depth=1
+        )
+
+        assert added == 1
+        assert calls == ["https://example.com/new"]
+
+    async def test_add_rejects_filtered(self, frontier: Frontier) -> None:
+        """Test that filtered and too-deep URLs are rejected."""
+        assert not await frontier.add("https://other.com/page")
+        assert not await frontier.add("https://example.com/deep", depth=4)
+        assert not await frontier.add("/relative/path")
+        assert frontier.size == 0
+
+    async def test_add_rejects_long_urls(self) -> None:
+        """Test that URLs over max_url_length are rejected."""
+        frontier = Frontier(
+            run_id="run123",
+            site_id="site123",
+            link_filter=LinkFilter(allowed_domains=["example.com"]),
+            max_url_length=40,
+        )
+
+        assert await frontier.add("https://example.com/short")
+        assert not await frontier.add("https://example.com/" + "a" * 40)
+
+    async def test_add_batch(self, frontier: Frontier) -> None:
+        """Test batch add filters, deduplicates, and counts."""
+        added = await frontier.add_batch(
+            [
+                "https://example.com/a",
+                "https://example.com/b",
+                "https://example.com/a",
+                "https://other.com/c",
+            ],
+            depth=1,
+            referrer_url="https://example.com/",
+        )
+
+        assert added == 2
+        assert frontier.size == 2
+        assert frontier.max_depth_reached == 1
+
+        item = await frontier.get_next()
+        assert item is not None
+        assert item.referrer_url == "https://example.com/"
+
+    async def test_add_batch_respects_max_pages(self) -> None:
+        """Test batch add stops at max_pages."""
+        frontier = Frontier(
+            run_id="run123",
+            site_id="site123",
+            link_filter=LinkFilter(allowed_domains=["example.com"]),
+            max_pages=3,
+        )
+
+        added = await frontier.add_batch(
+            [f"https://example.com/page{i}" for i in range(10)], depth=1
+        )
+
+        assert added == 3
+        assert frontier.discovered_count == 3
+
+    async def test_priority_order(self, frontier: Frontier) -> None:
+        """Test that higher-priority URLs are returned first."""
+        await frontier.add_batch(
+            [
+                "https://example.com/archive/old-post",
+                "https://example.com/blog/post",
+                "https://example.com/docs/guide",
+            ],
+            depth=1,
+        )
+        await frontier.add("https://example.com/", priority=1000.0)
+
+        urls = []
+        while (item := await frontier.get_next()) is not None:
+            urls.append(item.normalized_url)
+
+        assert urls == [
+            "https://example.com/",
+            "https://example.com/docs/guide",
+            "https://example.com/blog/post",
+            "https://example.com/archive/old-post",
+        ]
+
+    async def test_mark_completed(self, frontier: Frontier) -> None:
+        """Test completion tracking."""
+        await frontier.add("https://example.com/page")
+        item = await frontier.get_next()
+        assert item is not None
+
+        await frontier.mark_completed(item)
+
+        assert frontier.completed_count == 1
+        assert frontier.in_progress_count == 0
+        assert frontier.is_empty
+
+    async def test_mark_completed_by_url(self, frontier: Frontier) -> None:
+        """Test completion tracking with raw and normalized URL strings."""
+        await frontier.add_batch(
+            ["https://example.com/a", "https://EXAMPLE.com/b#top"], depth=0
+        )
+        await frontier.get_batch(2)
+
+        await frontier.mark_completed("https://example.com/a")
+        await frontier.mark_completed("https://EXAMPLE.com/b#top")
+
+        assert frontier.completed_count == 2
+        assert frontier.in_progress_count == 0
+
+    async def test_mark_completed_while_queued(self, frontier: Frontier) -> None:
+        """Test that completing a queued URL removes it from the queue."""
+        await frontier.add_batch(
+            ["https://example.com/a", "https://example.com/b"], depth=0
+        )
+
+        await frontier.mark_completed("https://example.com/a")
+
+        assert frontier.size == 1
+        item = await frontier.get_next()
+        assert item is not None
+        assert item.normalized_url == "https://example.com/b"
+        assert await frontier.get_next() is None
+
+    async def test_stale_entries_are_compacted(self, frontier: Frontier) -> None:
+        """Test that the heap is rebuilt once most entries are stale."""
+        urls = [f"https://example.com/page{i}" for i in range(10)]
+        await frontier.add_batch(urls, depth=1)
+
+        for url in urls[:8]:
+            await frontier.mark_completed(url)
+
+        items = await frontier.get_batch(10)
+
+        assert [item.normalized_url for item in items] == urls[8:]
+        assert frontier.size == 0
+        assert frontier.get_stats()["queue_size"] == 0
+
+    async def test_mark_failed(self, frontier: Frontier) -> None:
+        """Test failure tracking."""
+        await frontier.add("https://example.com/page")
+        item = await frontier.get_next()
+        assert item is not None
+
+        await frontier.mark_failed(item, "boom")
+
+        assert frontier.failed_count == 1
+        assert frontier.is_empty
+
+    async def test_return_to_queue(self, frontier: Frontier) -> None:
+        """Test returning an item for retry."""
+        await frontier.add("https://example.com/page")
+        item = await frontier.get_next()
+        assert item is not None
+
+        await frontier.return_to_queue(item)
+
+        assert frontier.in_progress_count == 0
+        retried = await frontier.get_next()
+        assert retried is item
+        assert retried.retry_count == 1
+
+    async def test_get_batch(self, frontier: Frontier) -> None:
+        """Test getting a batch of URLs."""
+        await frontier.add_batch(
+            [f"https://example.com/page{i}" for i in range(5)], depth=1
+        )
+
+        items = await frontier.get_batch(3)
+        assert len(items) == 3
+        assert frontier.in_progress_count == 3
+
+        items = await frontier.get_batch(10)
+        assert len(items) == 2
+        assert await frontier.get_next() is None
+
+    async def test_stats(self, frontier: Frontier) -> None:
+        """Test statistics reporting."""
+        await frontier.add_batch(
+            ["https://example.com/a", "https://sub.example.com/b"], depth=0
+        )
+
+        stats = frontier.get_stats()
+        assert stats["queue_size"] == 2
+        assert stats["discovered"] == 2
+        assert stats["domains"] == 2
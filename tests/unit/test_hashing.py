@@ -1,7 +1,10 @@
 """Tests for hashing utilities."""
 
+import re
 from datetime import datetime
 
+import xxhash
+
 import pytest
 
 from ragcrawl.utils.hashing import compute_content_hash, compute_doc_id, compute_url_hash
@@ -126,6 +129,27 @@ class TestHashing:
         assert isinstance(hash_value, str)
         assert len(hash_value) == 16
 
+    def test_content_hash_whitespace_normalization(self) -> None:
+        """Test that normalization collapses all Unicode whitespace runs."""
+        content = "  Title\n\n\tBody\u00a0text\u2003end\r\n  "
+        expected = re.sub(r"\s+", " ", content.strip())
+
+        assert compute_content_hash(content) == xxhash.xxh64_hexdigest(
+            expected.encode("utf-8")
+        )
+
+    @pytest.mark.parametrize("normalize", [True, False])
+    def test_content_hash_chunked_matches_one_shot(self, normalize: bool) -> None:
+        """Test that hashing large text in chunks matches a one-shot hash."""
+        words = ["alpha", "\u00e9t\u00e9", "x" * 70_000, "", "  ", "\n\t", "\u3000"]
+        content = " ".join(words[i % len(words)] * (i % 4) for i in range(400))
+        expected = " ".join(content.split()) if normalize else content
+
+        assert len(content) > 200_000
+        assert compute_content_hash(content, normalize=normalize) == (
+            xxhash.xxh64_hexdigest(expected.encode("utf-8"))
+        )
+
     def test_content_hash_large_content(self) -> None:
         """Test content hash with large content."""
         content = "x" * 1_000_000
@@ -1,9 +1,11 @@
 """Tests for JSON and JSONL exporters."""
 
-from datetime import datetime, timezone
+import json
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from ragcrawl.export import json_exporter
 from ragcrawl.export.json_exporter import JSONExporter, JSONLExporter
 from ragcrawl.models.chunk import Chunk
 from ragcrawl.models.document import Document, DocumentDiagnostics
@@ -99,7 +101,50 @@ def test_jsonl_exporter_streams_lines(tmp_path) -> None:
     exporter.export_chunks([chunk], chunk_path)
     chunk_lines = chunk_path.read_text().strip().splitlines()
     assert len(chunk_lines) == 1
-    assert '"chunk_id": "c1"' in chunk_lines[0]
+    assert '"chunk_id":"c1"' in chunk_lines[0]
+
+
+def test_jsonl_exporter_matches_json_exporter(tmp_path) -> None:
+    """JSONL lines decode to the same data as the JSON exporter output."""
+    doc = make_document()
+    exporter = JSONLExporter(include_html=True, include_diagnostics=True)
+    out_docs = tmp_path / "docs.jsonl"
+    exporter.export_documents([doc], out_docs)
+
+    line = out_docs.read_text().splitlines()[0]
+    expected = JSONExporter(include_html=True, indent=None).export_document(doc)
+    assert json.loads(line) == json.loads(expected)
+
+
+def test_jsonl_output_same_without_orjson(tmp_path, monkeypatch) -> None:
+    """For plain documents and non-ASCII text, the stdlib fallback matches orjson."""
+    pytest.importorskip("orjson")
+    doc = make_document()
+    doc.title = "Café – naïve"
+    exporter = JSONLExporter(include_html=True, include_diagnostics=True)
+    nested = {"k": {1: "x"}, "values": [1.5, None, True]}
+
+    fast_path = tmp_path / "fast.jsonl"
+    exporter.export_documents([doc], fast_path)
+    fast_line = JSONLExporter._dumps_line(nested)
+    monkeypatch.setattr(json_exporter, "orjson", None)
+    slow_path = tmp_path / "slow.jsonl"
+    exporter.export_documents([doc], slow_path)
+
+    assert fast_path.read_bytes() == slow_path.read_bytes()
+    assert "Café – naïve" in fast_path.read_text(encoding="utf-8")
+    assert fast_line == JSONLExporter._dumps_line(nested)
+
+
+def test_jsonl_line_falls_back_for_big_ints() -> None:
+    """Ints orjson cannot encode are written by the stdlib serializer."""
+    assert JSONLExporter._dumps_line({"n": 2**70}) == b'{"n":1180591620717411303424}\n'
+
+
+def test_jsonl_line_accepts_non_str_keys() -> None:
+    """Nested dicts with non-string keys are written with stringified keys."""
+    line = JSONLExporter._dumps_line({"k": {1: "x"}})
+    assert line == b'{"k":{"1":"x"}}\n'
 
 
 def test_json_serializer_rejects_unknown_types() -> None:
@@ -115,3 +160,44 @@ def test_json_exporter_excludes_optional_fields_by_default() -> None:
     rendered = exporter.export_document(doc)
     assert '"html"' not in rendered
     assert '"diagnostics"' not in rendered
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2])
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_json_exporter_streams_array(tmp_path, indent, count) -> None:
+    """Streamed JSON array output matches json.dumps of the full list."""
+    docs = [make_document() for _ in range(count)]
+    exporter = JSONExporter(indent=indent)
+    out_file = tmp_path / "docs.json"
+    exporter.export_documents(docs, out_file)
+
+    expected = json.dumps(
+        [exporter._document_to_dict(doc) for doc in docs],
+        indent=indent,
+        default=JSONExporter._json_serializer,
+    )
+    assert out_file.read_text() == expected
+
+
+def test_json_exporter_formats_equal_instants_by_offset() -> None:
+    """Equal instants in different time zones keep their own offsets."""
+    utc = make_document()
+    utc.last_seen = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    shifted = make_document()
+    shifted.last_seen = datetime(2024, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    exporter = JSONExporter(indent=None)
+
+    assert exporter._document_to_dict(utc)["last_seen"] == "2024-01-01T12:00:00+00:00"
+    assert exporter._document_to_dict(shifted)["last_seen"] == "2024-01-01T14:00:00+02:00"
+
+
+async def test_jsonl_exporter_async_export(tmp_path) -> None:
+    """Async export writes the same file as the sync export."""
+    docs = [make_document(), make_document()]
+    exporter = JSONLExporter()
+
+    await exporter.aexport_documents(docs, tmp_path / "async.jsonl")
+    exporter.export_documents(docs, tmp_path / "sync.jsonl")
+
+    assert (tmp_path / "async.jsonl").read_bytes() == (tmp_path / "sync.jsonl").read_bytes()
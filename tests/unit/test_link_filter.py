@@ -1,5 +1,7 @@
 """Tests for link filtering."""
 
+from urllib.parse import ParseResult, urlparse
+
 import pytest
 
 from ragcrawl.filters.link_filter import LinkFilter, FilterReason
@@ -151,6 +153,38 @@ class TestLinkFilter:
         result = link_filter.filter("https://other.com/page", check_seen=False)
         assert not result.allowed
 
+    @pytest.mark.parametrize(
+        ("url", "allowed"),
+        [
+            ("https://a.b.docs.example.org/page", True),
+            ("https://api.example.org/page", False),
+            ("https://example.org/page", False),
+            ("https://notdocs.example.org/page", False),
+        ],
+    )
+    def test_filter_nested_subdomains(self, url: str, allowed: bool) -> None:
+        """Test that only subdomains of an allowed domain pass."""
+        link_filter = LinkFilter(allowed_domains=["docs.example.org"])
+
+        assert link_filter.filter(url, check_seen=False).allowed is allowed
+
+    def test_filter_parses_url_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that normalization and extension checks reuse the parsed URL."""
+        calls = []
+
+        def counting_urlparse(url: str) -> ParseResult:
+            calls.append(url)
+            return urlparse(url)
+
+        for module in ("link_filter", "patterns", "url_normalizer"):
+            monkeypatch.setattr(f"ragcrawl.filters.{module}.urlparse", counting_urlparse)
+        lf = LinkFilter(allowed_domains=["example.com"], blocked_extensions=[".pdf"])
+
+        result = lf.filter("https://example.com/Guide/?utm_source=x")
+
+        assert result.normalized_url == "https://example.com/Guide"
+        assert calls == ["https://example.com/Guide/?utm_source=x"]
+
     def test_filter_normalize_url(self) -> None:
         """Test URL normalization in filtering."""
         link_filter = LinkFilter(allowed_domains=["example.com"])
@@ -204,12 +238,18 @@ class TestLinkFilter:
         assert not link_filter.is_seen(url)
 
         link_filter.mark_seen(url)
+        link_filter.mark_seen("https://EXAMPLE.com/page/#top")
         assert link_filter.is_seen(url)
+        assert not link_filter.is_seen("https://example.com/other")
+        assert link_filter.seen_count == 1
 
         result = link_filter.filter(url, check_seen=True)
         assert not result.allowed
         assert result.reason == FilterReason.ALREADY_SEEN
 
+        link_filter.clear_seen()
+        assert not link_filter.is_seen(url)
+
     def test_filter_invalid_scheme_and_path_prefix(self) -> None:
         """Reject disallowed schemes and paths outside allowed prefixes."""
         link_filter = LinkFilter(allowed_domains=["example.com"])
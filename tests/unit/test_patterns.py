@@ -1,7 +1,10 @@
 """Tests for pattern matching."""
 
+import re
+
 import pytest
 
+from ragcrawl.filters import patterns
 from ragcrawl.filters.patterns import ExtensionFilter, PatternMatcher
 
 
@@ -52,6 +55,92 @@ class TestPatternMatcher:
         assert matcher.should_include("/Docs/Guide")
         assert not matcher.should_include("/docs/guide")
 
+    def test_combined_patterns_match_individually(self) -> None:
+        """Test that combined alternations agree with per-pattern checks."""
+        matcher = PatternMatcher(
+            include_patterns=["/docs/*", r"^/api/v\d+/", "/Blog/*"],
+            exclude_patterns=["*.pdf", r"/private/"],
+        )
+        urls = [
+            "/docs/guide",
+            "/api/v1/users",
+            "/api/beta/users",
+            "/blog/post",
+            "/docs/manual.pdf",
+            "/private/docs/x",
+            "/other",
+        ]
+
+        for url in urls:
+            expected = not any(
+                p.search(url) for p in matcher._exclude_patterns
+            ) and any(p.search(url) for p in matcher._include_patterns)
+            assert matcher.should_include(url) == expected
+
+    def test_backreference_patterns_not_combined(self) -> None:
+        """Test that patterns with backreferences are checked one by one."""
+        matcher = PatternMatcher(include_patterns=[r"/(\w+)/\1/", "/docs/*"])
+
+        assert matcher.should_include("/a/a/")
+        assert not matcher.should_include("/a/b/")
+        assert matcher.should_include("/docs/guide")
+
+    def test_inline_flag_patterns_combined(self) -> None:
+        """Test that leading inline flags are scoped to their own pattern."""
+        matcher = PatternMatcher(
+            include_patterns=["(?i)/docs/", "/Blog/"], case_sensitive=True
+        )
+
+        assert matcher._include_re is not None
+        assert matcher.should_include("/DOCS/guide")
+        assert matcher.should_include("/Blog/post")
+        assert not matcher.should_include("/blog/post")
+
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_re2_engine_agrees_with_re(self, case_sensitive: bool) -> None:
+        """Test that the RE2 backend makes the same decisions as re."""
+        pytest.importorskip("re2")
+        options = {
+            "include_patterns": ["/docs/*", r"^/api/v\d+/", "(?i)/Blog/"],
+            "exclude_patterns": ["*.pdf", "/private/"],
+            "case_sensitive": case_sensitive,
+        }
+        fast = PatternMatcher(**options, engine="re2")
+        slow = PatternMatcher(**options)
+        urls = [
+            "/docs/guide",
+            "/DOCS/guide",
+            "/api/v1/users",
+            "/api/beta/users",
+            "/blog/post",
+            "/docs/manual.pdf",
+            "/docs/manual.pdf?x=1",
+            "/private/docs/x",
+            "/other",
+        ]
+
+        assert not isinstance(fast._include_re, re.Pattern)
+        for url in urls:
+            assert fast.should_include(url) == slow.should_include(url), url
+
+    def test_re2_engine_falls_back_to_re(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test lookarounds and a missing google-re2 fall back to re."""
+        if patterns.re2 is not None:
+            matcher = PatternMatcher(include_patterns=["/docs/(?!draft)"], engine="re2")
+            assert isinstance(matcher._include_re, re.Pattern)
+            assert not matcher.should_include("/docs/draft-1")
+
+        monkeypatch.setattr(patterns, "re2", None)
+        matcher = PatternMatcher(include_patterns=["/docs/*", "/blog/*"], engine="re2")
+
+        assert isinstance(matcher._include_re, re.Pattern)
+        assert matcher.should_include("/docs/guide")
+
+    def test_unknown_engine_rejected(self) -> None:
+        """Test that an unknown engine name raises ValueError."""
+        with pytest.raises(ValueError):
+            PatternMatcher(engine="pcre")
+
     def test_case_insensitive_patterns(self) -> None:
         """Test case-insensitive pattern matching."""
         matcher = PatternMatcher(
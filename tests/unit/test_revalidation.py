@@ -0,0 +1,38 @@
+"""Tests for conditional request handling."""
+
+import httpx
+import pytest
+
+from ragcrawl.fetcher.revalidation import RevalidationStatus, Revalidator
+
+
+class TestRevalidator:
+    """Tests for Revalidator."""
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"ETag": '"abc"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"},
+            {"etag": '"abc"', "last-modified": "Tue, 01 Oct 2024 00:00:00 GMT"},
+            httpx.Headers({"ETAG": '"abc"', "Last-modified": "Tue, 01 Oct 2024 00:00:00 GMT"}),
+        ],
+    )
+    def test_parse_response_reads_headers_case_insensitively(
+        self, headers: dict[str, str]
+    ) -> None:
+        """Test that validators are found regardless of header casing."""
+        result = Revalidator().parse_response(304, headers)
+
+        assert result.status == RevalidationStatus.NOT_MODIFIED
+        assert result.etag == '"abc"'
+        assert result.last_modified == "Tue, 01 Oct 2024 00:00:00 GMT"
+
+    def test_parse_response_statuses(self) -> None:
+        """Test status mapping for success, redirect, and error responses."""
+        revalidator = Revalidator()
+
+        assert revalidator.parse_response(200, {}).status == RevalidationStatus.MODIFIED
+        assert revalidator.parse_response(301, {}).status == RevalidationStatus.MODIFIED
+        error = revalidator.parse_response(503, {"ETag": '"x"'})
+        assert error.status == RevalidationStatus.ERROR
+        assert error.needs_fetch
@@ -0,0 +1,109 @@
+"""Tests for domain scheduling."""
+
+import asyncio
+
+import pytest
+
+from ragcrawl.config.crawler_config import RateLimitConfig
+from ragcrawl.core.scheduler import DomainScheduler
+
+
+def make_scheduler(
+    per_domain_rps: float | None = None,
+    per_domain_concurrency: int = 2,
+    max_concurrency: int = 10,
+) -> DomainScheduler:
+    """Create a scheduler with effectively no global rate limit."""
+    config = RateLimitConfig(
+        requests_per_second=10000.0,
+        per_domain_rps=per_domain_rps,
+        per_domain_concurrency=per_domain_concurrency,
+        delay_between_requests=0,
+    )
+    return DomainScheduler(config, max_concurrency=max_concurrency)
+
+
+class TestDomainScheduler:
+    """Tests for DomainScheduler."""
+
+    async def test_acquire_release(self) -> None:
+        """Test basic acquire/release bookkeeping."""
+        scheduler = make_scheduler()
+
+        assert await scheduler.acquire("example.com")
+        assert scheduler.active_requests == 1
+        assert scheduler.get_domain_stats("example.com")["active_requests"] == 1
+
+        scheduler.release("example.com")
+        assert scheduler.active_requests == 0
+
+        stats = scheduler.get_domain_stats("example.com")
+        assert stats["request_count"] == 1
+        assert stats["active_requests"] == 0
+
+    async def test_per_domain_concurrency(self) -> None:
+        """Test that per-domain concurrency blocks extra requests."""
+        scheduler = make_scheduler(per_domain_concurrency=1)
+
+        assert await scheduler.acquire("example.com")
+
+        waiter = asyncio.create_task(scheduler.acquire("example.com"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # Other domains are not blocked
+        assert await asyncio.wait_for(scheduler.acquire("other.com"), timeout=1)
+
+        scheduler.release("example.com")
+        assert await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_circuit_breaker(self) -> None:
+        """Test that consecutive errors open the circuit."""
+        scheduler = make_scheduler(per_domain_concurrency=10)
+
+        for _ in range(5):
+            assert await scheduler.acquire("example.com")
+            scheduler.release("example.com", success=False)
+
+        assert scheduler.get_domain_stats("example.com")["circuit_open"]
+        assert scheduler.get_stats()["circuits_open"] == 1
+        assert not await scheduler.acquire("example.com")
+
+    async def test_stats_do_not_create_domains(self) -> None:
+        """Test that reading stats does not start tracking a domain."""
+        scheduler = make_scheduler()
+
+        stats = scheduler.get_domain_stats("unknown.com")
+
+        assert stats["request_count"] == 0
+        assert scheduler.get_stats()["domains_tracked"] == 0
+
+    async def test_domain_rate_allows_burst(self) -> None:
+        """Test that the token bucket allows a burst up to the concurrency."""
+        scheduler = make_scheduler(per_domain_rps=20.0, per_domain_concurrency=2)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await scheduler.acquire("example.com")
+        await scheduler.acquire("example.com")
+        assert loop.time() - start < 0.04
+
+        scheduler.release("example.com")
+        await scheduler.acquire("example.com")
+        assert loop.time() - start >= 0.04
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that cancelling a queued acquire leaves the slot usable."""
+        scheduler = make_scheduler(per_domain_concurrency=1)
+
+        assert await scheduler.acquire("example.com")
+
+        waiter = asyncio.create_task(scheduler.acquire("example.com"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        scheduler.release("example.com")
+        assert scheduler.get_domain_stats("example.com")["active_requests"] == 0
+        assert await asyncio.wait_for(scheduler.acquire("example.com"), timeout=1)
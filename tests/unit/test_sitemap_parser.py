@@ -0,0 +1,82 @@
+"""Tests for sitemap parsing."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ragcrawl.sync.sitemap_parser import SitemapParser
+
+SUB_SITEMAPS = 20
+
+
+class SitemapServer:
+    """Serves a sitemap index of SUB_SITEMAPS sitemaps and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.clients = 0
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve the index at /sitemap.xml and one URL per sub-sitemap."""
+        if request.url.path == "/sitemap.xml":
+            locs = "".join(
+                f"<sitemap><loc>https://example.com/s{i}.xml</loc></sitemap>"
+                for i in range(SUB_SITEMAPS)
+            )
+            return httpx.Response(
+                200,
+                text=(
+                    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                    f"{locs}</sitemapindex>"
+                ),
+            )
+
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            self.inflight -= 1
+        name = request.url.path.strip("/").removesuffix(".xml")
+        return httpx.Response(
+            200,
+            text=(
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                f"<url><loc>https://example.com/{name}/page</loc>"
+                "<lastmod>2025-01-01</lastmod></url></urlset>"
+            ),
+        )
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> SitemapServer:
+    """Route every httpx.AsyncClient through the in-memory sitemap server."""
+    srv = SitemapServer()
+
+    class MockClient(httpx.AsyncClient):
+        def __init__(self, **kwargs: object) -> None:
+            super().__init__(transport=httpx.MockTransport(srv.handle), **kwargs)
+            srv.clients += 1
+
+    monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+    return srv
+
+
+class TestSitemapIndex:
+    """Tests for sitemap index expansion."""
+
+    async def test_sub_sitemaps_fetched_with_bounded_concurrency(
+        self, server: SitemapServer
+    ) -> None:
+        """Test that sub-sitemaps share one client and at most max_concurrency run at once."""
+        parser = SitemapParser(max_concurrency=3)
+
+        entries = await parser.parse("https://example.com/sitemap.xml")
+
+        assert [e.loc for e in entries] == [
+            f"https://example.com/s{i}/page" for i in range(SUB_SITEMAPS)
+        ]
+        assert 1 < server.max_inflight <= 3
+        assert server.clients == 1
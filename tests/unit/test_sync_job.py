@@ -0,0 +1,277 @@
+"""Tests for the incremental sync job."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from ragcrawl.config.crawler_config import RateLimitConfig
+from ragcrawl.config.sync_config import SyncConfig, SyncStrategy
+from ragcrawl.core import sync_job as sync_job_module
+from ragcrawl.core.sync_job import SyncJob
+from ragcrawl.fetcher.base import FetchResult, FetchStatus
+from ragcrawl.models.page import Page
+from ragcrawl.models.site import Site
+from ragcrawl.storage.backend import create_storage_backend
+from ragcrawl.storage.duckdb.backend import DuckDBBackend
+from ragcrawl.sync.sitemap_parser import SitemapEntry
+
+
+class FakeFetcher:
+    """Fetcher that returns fresh content for every URL and tracks concurrency."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.fail = False
+        self.urls: list[str] = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def fetch(self, url: str, etag=None, last_modified=None, **kwargs) -> FetchResult:
+        self.urls.append(url)
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            self.inflight -= 1
+        if self.fail:
+            return FetchResult(status=FetchStatus.ERROR, status_code=503, error="busy")
+        body = f"# {url}\n\nnew body"
+        return FetchResult(
+            status=FetchStatus.SUCCESS,
+            status_code=200,
+            html=f"<html><body>{body}</body></html>",
+            markdown=body,
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+def seed_site(storage_config, site_id: str, count: int) -> list[str]:
+    """Store a site with ``count`` stale pages and return their URLs."""
+    backend = create_storage_backend(storage_config)
+    backend.initialize()
+    now = datetime.now()
+    backend.save_site(
+        Site(site_id=site_id, name="s", seeds=["https://example.com/"])
+    )
+    urls = [f"https://example.com/p{i}" for i in range(count)]
+    for i, url in enumerate(urls):
+        backend.save_page(
+            Page(
+                page_id=f"page-{i}",
+                site_id=site_id,
+                url=url,
+                first_seen=now,
+                last_seen=now,
+                depth=0,
+                content_hash="old",
+                last_crawled=now - timedelta(days=2),
+            )
+        )
+    backend.close()
+    return urls
+
+
+def make_sync_job(storage_config, site_id: str, monkeypatch, **overrides) -> tuple[SyncJob, FakeFetcher]:
+    """Create a SyncJob wired to a FakeFetcher."""
+    fetcher = FakeFetcher()
+
+    def make_fetcher(*args, **kwargs) -> FakeFetcher:
+        fetcher.kwargs = kwargs
+        return fetcher
+
+    monkeypatch.setattr(sync_job_module, "Crawl4AIFetcher", make_fetcher)
+    overrides.setdefault(
+        "rate_limit",
+        RateLimitConfig(
+            requests_per_second=10_000,
+            per_domain_rps=None,
+            per_domain_concurrency=64,
+            delay_between_requests=0,
+        ),
+    )
+    config = SyncConfig(
+        site_id=site_id,
+        storage=storage_config,
+        strategy=[SyncStrategy.HASH],
+        **overrides,
+    )
+    return SyncJob(config), fetcher
+
+
+class TestSyncJobConcurrency:
+    """Worker pool and scheduler limits in SyncJob."""
+
+    async def test_every_page_processed_within_concurrency_bound(
+        self, storage_config, monkeypatch
+    ) -> None:
+        """All pages are fetched and flushed with at most max_concurrency in flight."""
+        urls = seed_site(storage_config, "site-1", 30)
+        job, fetcher = make_sync_job(
+            storage_config,
+            "site-1",
+            monkeypatch,
+            max_concurrency=4,
+            storage_batch_size=7,
+        )
+
+        result = await job.run()
+
+        assert result.success is True
+        assert sorted(fetcher.urls) == sorted(urls)
+        assert 1 < fetcher.max_inflight <= 4
+        assert sorted(result.changed_pages) == sorted(urls)
+        assert result.stats.pages_changed == 30
+
+        backend = create_storage_backend(storage_config)
+        backend.initialize()
+        try:
+            for page in backend.list_pages("site-1"):
+                assert page.content_hash != "old"
+                assert backend.get_version(page.current_version_id) is not None
+        finally:
+            backend.close()
+
+    async def test_per_domain_concurrency_applies(
+        self, storage_config, monkeypatch
+    ) -> None:
+        """Fetches to one domain respect rate_limit.per_domain_concurrency."""
+        seed_site(storage_config, "site-1", 12)
+        job, fetcher = make_sync_job(
+            storage_config,
+            "site-1",
+            monkeypatch,
+            max_concurrency=16,
+            rate_limit=RateLimitConfig(
+                requests_per_second=10_000,
+                per_domain_rps=None,
+                per_domain_concurrency=2,
+                delay_between_requests=0,
+            ),
+        )
+
+        result = await job.run()
+
+        assert result.success is True
+        assert len(fetcher.urls) == 12
+        assert fetcher.max_inflight == 2
+
+    async def test_open_circuit_skips_remaining_pages(
+        self, storage_config, monkeypatch
+    ) -> None:
+        """Repeated server errors open the domain circuit and stop fetching."""
+        seed_site(storage_config, "site-1", 10)
+        job, fetcher = make_sync_job(
+            storage_config, "site-1", monkeypatch, max_concurrency=1
+        )
+        fetcher.fail = True
+
+        result = await job.run()
+
+        assert result.success is True
+        assert len(fetcher.urls) == 5
+        assert job._metrics.metrics.pages_skipped == 5
+
+
+class TestSyncJobFetcher:
+    """How SyncJob configures its fetcher."""
+
+    async def test_fetcher_shares_sync_revalidator(self, storage_config, monkeypatch) -> None:
+        """The fetcher's HEAD check uses SyncConfig's use_etag/use_last_modified."""
+        seed_site(storage_config, "site-1", 1)
+        job, fetcher = make_sync_job(
+            storage_config, "site-1", monkeypatch, use_etag=False
+        )
+
+        await job.run()
+
+        revalidator = fetcher.kwargs["revalidator"]
+        assert revalidator is job._revalidator
+        assert revalidator.use_etag is False
+        assert revalidator.use_last_modified is True
+
+
+class TestSyncJobWrites:
+    """Buffered storage writes made by SyncJob."""
+
+    async def test_failed_flush_fails_run_without_losing_writes(
+        self, storage_config, monkeypatch
+    ) -> None:
+        """A storage error fails the run and the batch is retried, not dropped."""
+        urls = seed_site(storage_config, "site-1", 6)
+        job, _ = make_sync_job(
+            storage_config, "site-1", monkeypatch, storage_batch_size=2
+        )
+
+        original = DuckDBBackend.save_pages_bulk
+        calls = {"n": 0}
+
+        def flaky_save_pages_bulk(self, pages):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("disk full")
+            return original(self, pages)
+
+        monkeypatch.setattr(DuckDBBackend, "save_pages_bulk", flaky_save_pages_bulk)
+
+        result = await job.run()
+
+        assert result.success is False
+        assert result.error == "disk full"
+
+        backend = create_storage_backend(storage_config)
+        backend.initialize()
+        try:
+            stored = {p.url: p for p in backend.list_pages("site-1")}
+            # Every page that was checked before the failure is persisted,
+            # along with the version it points at
+            checked = [stored[u] for u in urls if stored[u].content_hash != "old"]
+            assert len(checked) >= 2
+            for page in checked:
+                assert backend.get_version(page.current_version_id) is not None
+        finally:
+            backend.close()
+
+
+class TestSitemapFilter:
+    """Sitemap lastmod filtering in SyncJob."""
+
+    async def test_sub_second_lastmod_change_is_not_skipped(self) -> None:
+        """A lastmod a fraction of a second after the last crawl keeps the page."""
+        crawled = datetime(2025, 1, 1, 12, 0, 0, 100_000)
+        entries = {
+            "https://example.com/newer": crawled.replace(microsecond=900_000),
+            "https://example.com/same": crawled,
+            "https://example.com/older": crawled.replace(microsecond=0),
+        }
+
+        class FakeSitemapParser:
+            async def parse(self, url: str) -> list[SitemapEntry]:
+                return [SitemapEntry(loc=loc, lastmod=m) for loc, m in entries.items()]
+
+        job = SyncJob(
+            SyncConfig(
+                site_id="site-1",
+                strategy=[SyncStrategy.SITEMAP],
+                sitemap_urls=["https://example.com/sitemap.xml"],
+            )
+        )
+        job._sitemap_parser = FakeSitemapParser()
+        pages = [
+            Page(
+                page_id=url,
+                site_id="site-1",
+                url=url,
+                first_seen=crawled,
+                last_seen=crawled,
+                last_crawled=crawled,
+                depth=0,
+            )
+            for url in entries
+        ]
+
+        kept = await job._prioritize_by_sitemap(pages)
+
+        assert [p.url for p in kept] == ["https://example.com/newer"]
+        assert job._metrics.metrics.pages_unchanged == 2
@@ -0,0 +1,22 @@
+"""Tests for text measurement utilities."""
+
+import pytest
+
+from ragcrawl.utils.text import count_words
+
+
+class TestCountWords:
+    """Tests for count_words."""
+
+    @pytest.mark.parametrize("text", ["", "   ", "one", " one  two\nthree\t", "　a　b"])
+    def test_matches_split(self, text: str) -> None:
+        """Test that short texts count like str.split()."""
+        assert count_words(text) == len(text.split())
+
+    def test_chunked_matches_split(self) -> None:
+        """Test that words straddling chunk boundaries are counted once."""
+        words = ["alpha", "été", "x" * 70_000, "", "  ", "\n\t", "　"]
+        text = " ".join(words[i % len(words)] * (i % 4) for i in range(400))
+
+        assert len(text) > 200_000
+        assert count_words(text) == len(text.split())
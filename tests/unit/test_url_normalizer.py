@@ -2,7 +2,7 @@
 
 import pytest
 
-from ragcrawl.filters.url_normalizer import URLNormalizer
+from ragcrawl.filters.url_normalizer import URLNormalizer, registered_domain
 
 
 class TestURLNormalizer:
@@ -18,6 +18,12 @@ class TestURLNormalizer:
         result = self.normalizer.normalize(url)
         assert result == "https://example.com/Page"
 
+    def test_normalize_without_tracking_params(self) -> None:
+        """Test that URLs with nothing to strip are still canonicalized."""
+        url = "HTTPS://Example.com:443//docs/?page=2&lang=en"
+        result = self.normalizer.normalize(url)
+        assert result == "https://example.com/docs?lang=en&page=2"
+
     def test_remove_default_port(self) -> None:
         """Test removal of default ports."""
         url = "https://example.com:443/page"
@@ -40,6 +46,20 @@ class TestURLNormalizer:
         result = self.normalizer.normalize(url)
         assert result == "https://example.com/page"
 
+    def test_collapse_duplicate_slashes(self) -> None:
+        """Test that runs of slashes in the path collapse to one."""
+        url = "https://example.com//docs///guide//"
+        result = self.normalizer.normalize(url)
+        assert result == "https://example.com/docs/guide"
+
+    def test_rebuild_keeps_fragment_and_other_schemes(self) -> None:
+        """Test URL reassembly with fragments kept and for non-HTTP schemes."""
+        normalizer = URLNormalizer(remove_fragments=False)
+
+        assert normalizer.normalize("https://E.com/a/?q=1#top") == "https://e.com/a?q=1#top"
+        assert normalizer.normalize("http://e.com") == "http://e.com/"
+        assert normalizer.normalize("ftp://E.com/pub/") == "ftp://e.com/pub"
+
     def test_keep_root_trailing_slash(self) -> None:
         """Test keeping root path slash."""
         url = "https://example.com/"
@@ -73,6 +93,20 @@ class TestURLNormalizer:
         result = normalizer.normalize(url)
         assert result == "https://example.com/page?id=123"
 
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("b=2&a=1&a=0&ref=x", "a=0&a=1&b=2"),
+            ("flag&x=&&utm_source=y", "flag=&x="),
+            ("q=a%20b&p=1", "p=1&q=a+b"),
+            ("q=a+b&eq=x=y", "eq=x%3Dy&q=a+b"),
+        ],
+    )
+    def test_query_normalization(self, query: str, expected: str) -> None:
+        """Test that plain and percent-encoded queries normalize alike."""
+        result = self.normalizer.normalize(f"https://example.com/page?{query}")
+        assert result == f"https://example.com/page?{expected}"
+
     def test_preserve_tracking_params(self) -> None:
         """Test that default tracking params are still removed."""
         # Default behavior removes utm_source
@@ -100,6 +134,28 @@ class TestURLNormalizer:
         registered_domain = self.normalizer.get_registered_domain(url)
         assert registered_domain == "example.com"
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://user:pw@docs.example.co.uk:8080/a", "example.co.uk"),
+            ("sub.example.com/page", "example.com"),
+            ("http://localhost:8000/", "localhost"),
+        ],
+    )
+    def test_get_registered_domain_variants(self, url: str, expected: str) -> None:
+        """Test registered domains for netlocs, multi-part suffixes, and bare hosts."""
+        assert self.normalizer.get_registered_domain(url) == expected
+
+    def test_registered_domain_is_cached(self) -> None:
+        """Test that repeated hosts are served from the lookup cache."""
+        registered_domain.cache_clear()
+
+        for page in range(5):
+            self.normalizer.get_registered_domain(f"https://sub.example.com/{page}")
+
+        info = registered_domain.cache_info()
+        assert (info.misses, info.hits) == (1, 4)
+
     def test_is_same_domain(self) -> None:
         """Test same domain checking."""
         url1 = "https://example.com/page1"
@@ -0,0 +1,54 @@
+"""Tests for URL helpers."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from ragcrawl.utils.urls import join_url, url_origin
+
+BASE = "https://example.com/docs/page.html?x=1"
+
+
+class TestUrlOrigin:
+    """Tests for url_origin."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://example.com/docs/page", "https://example.com"),
+            ("http://user@example.com:8080/a?b", "http://user@example.com:8080"),
+            ("ftp://example.com/file", ""),
+            ("/relative/path", ""),
+        ],
+    )
+    def test_url_origin(self, url: str, expected: str) -> None:
+        """Test origin extraction for http(s) and other URLs."""
+        assert url_origin(url) == expected
+
+
+class TestJoinUrl:
+    """Tests for join_url."""
+
+    @pytest.mark.parametrize(
+        "href",
+        [
+            "/guide",
+            "/guide?q=1#top",
+            "//cdn.example.com/lib.js",
+            "/a/../b",
+            "/a/./b",
+            "/a;params",
+            "/search?",
+            "/page#",
+            "/x?#",
+            "/tab\there",
+            "relative/path",
+            "?only=query",
+            "#fragment",
+            "https://other.com/abs",
+        ],
+    )
+    def test_matches_urljoin(self, href: str) -> None:
+        """Test that the fast path never changes urljoin's result."""
+        assert join_url(BASE, href, url_origin(BASE)) == urljoin(BASE, href)
+        assert join_url(BASE, href) == urljoin(BASE, href)